@@ -4,6 +4,8 @@ from pathlib import Path
 from typing import ClassVar
 
 from attr import attrs
+from numpy import arange, frombuffer, uint8, unpackbits, zeros
+from numpy.typing import NDArray
 from PySide6.QtCore import QPoint
 from PySide6.QtGui import QColor, QImage, QPainter, Qt
 
@@ -25,7 +27,7 @@ from foundry.core.namespace import (
     validate,
 )
 from foundry.core.painter.Painter import Painter
-from foundry.core.palette import Color, Palette, PaletteGroup
+from foundry.core.palette import COLORS_PER_PALETTE, Color, Palette, PaletteGroup
 
 PIXELS: int = 64
 BYTES_PER_TILE: int = 16
@@ -99,16 +101,14 @@ class _Tile:
         bytes
             That represent an RGB tile image.
         """
-        pixels = bytearray()
         assert isinstance(self.palette, Palette)
 
-        for pixel_index in self.pixels_indexes:
-            if not self.use_background_color and pixel_index == 0:
-                pixels.extend(MASK_COLOR.to_rgb_bytes())
-            else:
-                pixels.extend(self.palette[pixel_index, Color].to_rgb_bytes())
+        table = self.palette.rgb_table
+        colors = [table[i * 3 : i * 3 + 3] for i in range(len(self.palette.color_indexes))]
+        if not self.use_background_color:
+            colors[0] = MASK_COLOR.to_rgb_bytes()
 
-        return bytes(pixels)
+        return b"".join(colors[pixel_index] for pixel_index in self.pixels_indexes)
 
 
 def _tile_to_image(tile: _Tile, scale_factor: int = 1) -> QImage:
@@ -376,6 +376,25 @@ def _block_to_image(block: _Block, scale_factor: int = 1, use_background_color:
     return image.scaled(scale_factor, scale_factor)
 
 
+def mask_out_color(image: QImage) -> QImage:
+    """
+    Makes the mask color of an image transparent.
+
+    Parameters
+    ----------
+    image : QImage
+        The image to make transparent, which is not modified.
+
+    Returns
+    -------
+    QImage
+        A premultiplied ARGB copy of the image, where every pixel of the mask color is transparent.
+    """
+    image = image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+    image.setAlphaChannel(image.createMaskFromColor(QColor(*MASK_COLOR).rgb(), Qt.MaskMode.MaskOutColor))
+    return image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+
+
 @lru_cache(2**10)
 def _cached_block_to_image(
     block: Block,
@@ -383,12 +402,17 @@ def _cached_block_to_image(
     graphics_set: GraphicsSet,
     scale_factor: int = 1,
     use_background_color: bool = False,
+    transparent: bool = False,
 ) -> QImage:
+    if transparent:
+        return mask_out_color(
+            _cached_block_to_image(block, palette_group, graphics_set, scale_factor, use_background_color)
+        )
     return _block_to_image(
         _Block(block.patterns, block.palette_index, palette_group, graphics_set, block.do_not_render),
         scale_factor,
         use_background_color,
-    )
+    ).convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
 
 
 def block_to_image(
@@ -397,6 +421,7 @@ def block_to_image(
     graphics_set: GraphicsSet,
     scale_factor: int = 1,
     use_background_color: bool = False,
+    transparent: bool = False,
 ) -> QImage:
     """
     Generates and caches a NES block with a given palette and graphics as a QImage.
@@ -413,18 +438,61 @@ def block_to_image(
         The multiple of 16 that the image will be created as, by default 1
     use_background_color: bool, optional
         If the natural background color should be used or if a mask color should be applied.
+    transparent: bool, optional
+        If the mask color should be transparent, by default False.
 
     Returns
     -------
     QImage
-        That represents the block.
+        A premultiplied ARGB image that represents the block.
 
     Notes
     -----
     Since this method is being cached, it is expected that every parameter is hashable and immutable.  If this does not
     occur, there is a high chance of an errors to linger throughout the program.
+
+    The opaque and transparent images of a block are cached separately, so neither must be masked when drawn.
+    """
+    return _cached_block_to_image(block, palette_group, graphics_set, scale_factor, use_background_color, transparent)
+
+
+BLOCKS_PER_TSA: int = 0x100
+
+
+@lru_cache(2**4)
+def block_atlas(tsa_data: bytes, graphics: bytes) -> NDArray[uint8]:
+    """
+    Decodes every block of a TSA table at once, into the palette group indexes of their pixels.
+
+    Parameters
+    ----------
+    tsa_data : bytes
+        The TSA table that defines the patterns of each block.
+    graphics : bytes
+        The bytes of the graphics set the patterns index into.
+
+    Returns
+    -------
+    NDArray[uint8]
+        An array of the shape (256, 16, 16), where each pixel is the index of its palette multiplied by four, plus its
+        index inside that palette.  A pixel is the background color when its index inside its palette is zero.
     """
-    return _cached_block_to_image(block, palette_group, graphics_set, scale_factor, use_background_color)
+    tiles = frombuffer(graphics, dtype=uint8)
+    tiles = tiles[: len(tiles) - len(tiles) % BYTES_PER_TILE].reshape(-1, BYTES_PER_TILE)
+    low_bits = unpackbits(tiles[:, :PIXEL_OFFSET], axis=1).reshape(-1, TILE_SIZE.height, TILE_SIZE.width)
+    high_bits = unpackbits(tiles[:, PIXEL_OFFSET:], axis=1).reshape(-1, TILE_SIZE.height, TILE_SIZE.width)
+    tile_pixels = (high_bits << 1) | low_bits
+
+    # The patterns of a block are stored as the upper left, lower left, upper right, and lower right quarters.
+    tsa = frombuffer(bytes(tsa_data), dtype=uint8).reshape(4, BLOCKS_PER_TSA)
+    atlas = zeros((BLOCKS_PER_TSA, BLOCK_SIZE.height, BLOCK_SIZE.width), dtype=uint8)
+    atlas[:, : TILE_SIZE.height, : TILE_SIZE.width] = tile_pixels[tsa[0]]
+    atlas[:, TILE_SIZE.height :, : TILE_SIZE.width] = tile_pixels[tsa[1]]
+    atlas[:, : TILE_SIZE.height, TILE_SIZE.width :] = tile_pixels[tsa[2]]
+    atlas[:, TILE_SIZE.height :, TILE_SIZE.width :] = tile_pixels[tsa[3]]
+
+    palette_indexes = arange(BLOCKS_PER_TSA, dtype=uint8) // 0x40
+    return atlas + (palette_indexes * COLORS_PER_PALETTE)[:, None, None]
 
 
 @attrs(slots=True, auto_attribs=True, eq=True, frozen=True, hash=True)
@@ -8,6 +8,8 @@ from functools import partial
 from inspect import get_annotations
 from itertools import chain
 from logging import DEBUG, Logger, NullHandler, getLogger
+from sys import getsizeof
+from threading import local
 from types import MethodType
 from typing import (
     Any,
@@ -15,17 +17,16 @@ from typing import (
     Generic,
     Literal,
     NoReturn,
-    ParamSpec,
     TypeVar,
     final,
     get_type_hints,
     overload,
 )
 from warnings import warn
-from weakref import ReferenceType, WeakMethod, finalize, ref
+from weakref import WeakMethod, finalize, ref
 
-from attr import Factory, attrs, evolve, field
-from PySide6.QtCore import QObject, Qt
+from attr import Factory, attrs, evolve, field, fields, has
+from PySide6.QtCore import QCoreApplication, QObject, Qt, QTimer
 from PySide6.QtGui import QFocusEvent, QKeyEvent, QMouseEvent, QWheelEvent
 
 from foundry.core import sequence_to_pretty_str
@@ -33,7 +34,6 @@ from foundry.core.geometry import Point
 
 _T = TypeVar("_T")
 _U = TypeVar("_U")
-_P = ParamSpec("_P")
 
 
 LOGGER_NAME: Literal["GUI"] = "GUI"
@@ -55,32 +55,6 @@ undo_log: Logger = getLogger(UNDO_LOGGER_NAME)
 undo_log.addHandler(NullHandler())
 
 
-def _remove_garbage(func: Callable[_P, _T]) -> Callable[_P, _T]:
-    """
-    A decorator for a method that needs to remove garbage subscribers.
-
-    Parameters
-    ----------
-    func : Callable[_P, _T]
-        The method to be decorated.
-
-    Returns
-    -------
-    Callable[_P, _T]
-        The decorated method.
-
-    Notes
-    -----
-        `func` must be a method of `Signal` or a subclass.
-    """
-
-    def remove_garbage(*args: _P.args, **kwargs: _P.kwargs):
-        args[0]._remove_garbage_subscribers()  # type: ignore
-        return func(*args, **kwargs)
-
-    return remove_garbage
-
-
 @attrs(slots=True, auto_attribs=True)
 class _Connection(Generic[_T, _U]):
     parent_signal_instance: SignalInstance[_T]
@@ -188,17 +162,21 @@ class Signal(Generic[_T]):
 
     Attributes
     ----------
-    subscribers: list[_SignalElement]
-        A list of interested parties which will be called when the action of interest is taken.
     name: str | None
         The user friendly name of this signal, None by default.
-    _dead_subscribers: bool
-        If there exists a subscriber which needs to be collected by the garbage collector.
+    _subscribers: dict[int, list[_SignalElement]]
+        The interested parties which will be called when the action of interest is taken, keyed by the identity of the
+        object which is interested in them.
+
+    Notes
+    -----
+        Subscribers are indexed by the identity of their object, so emitting an action only visits the subscribers of
+    a single object, regardless of how many other objects are subscribed.  Weak subscribers are removed by a finalizer
+    as soon as they are garbage collected.
     """
 
-    subscribers: list[_SignalElement]
     name: str | None
-    _dead_subscribers: bool
+    _subscribers: dict[int, list[_SignalElement]]
 
     @overload
     def __init__(self, *, subscribers: None = None, name: str | None = None) -> None:
@@ -224,7 +202,6 @@ class Signal(Generic[_T]):
             self.subscribers = list(subscribers)
         else:
             self.subscribers = []
-        self._dead_subscribers = False
 
     def __str__(self) -> str:
         if self.name:
@@ -236,24 +213,58 @@ class Signal(Generic[_T]):
         raise KeyError(key)
 
     def __getitem__(self, key) -> _SignalElement:
-        for value in self.subscribers:
-            if value == key:
-                return value
+        if isinstance(key, _SignalElement):
+            for value in self._subscribers.get(key.uid, ()):
+                if value == key:
+                    return value
         return self.__missing__(key)
 
     def __contains__(self, value: _SignalElement) -> bool:
-        return any(v == value for v in self.subscribers)
+        return isinstance(value, _SignalElement) and any(v == value for v in self._subscribers.get(value.uid, ()))
 
     def __len__(self) -> int:
-        return len(self.subscribers)
+        return sum(len(elements) for elements in self._subscribers.values())
 
     def __iter__(self) -> Iterator[_SignalElement[_T]]:
-        return iter(self.subscribers)
+        return chain.from_iterable(list(self._subscribers.values()))
 
     def __bool__(self):
-        return bool(self.subscribers)
+        return bool(self._subscribers)
+
+    @property
+    def subscribers(self) -> list[_SignalElement]:
+        """
+        The interested parties which will be called when the action of interest is taken.
+
+        Returns
+        -------
+        list[_SignalElement]
+            Every subscriber of the signal.
+        """
+        return list(self)
+
+    @subscribers.setter
+    def subscribers(self, subscribers: Sequence[_SignalElement]) -> None:
+        self._subscribers = {}
+        for element in subscribers:
+            self._subscribers.setdefault(element.uid, []).append(element)
+
+    def subscribers_of(self, instance: object) -> Sequence[_SignalElement[_T]]:
+        """
+        Provides the subscribers interested in a specific object.
+
+        Parameters
+        ----------
+        instance : object
+            The object which is interested in the subscribers.
+
+        Returns
+        -------
+        Sequence[_SignalElement[_T]]
+            The subscribers associated with `instance`.
+        """
+        return self._subscribers.get(id(instance), ())
 
-    @_remove_garbage
     def clear(self, *instances: object) -> None:
         """
         Removes all subscribers for a signal.
@@ -263,16 +274,13 @@ class Signal(Generic[_T]):
         instances : object
             The instances to remove subscribers from.
         """
-        subscribers: list[_SignalElement[_T]] = []
         if len(instances):
-            for element in self.subscribers:
-                if any(id(instance) == element.uid for instance in instances):
+            for instance in instances:
+                for element in self._subscribers.pop(id(instance), ()):
                     signal_log.debug("%s removed %s from %s", self.__class__.__name__, element, self)
-                else:
-                    subscribers.append(element)
-        self.subscribers = subscribers
+        else:
+            self._subscribers = {}
 
-    @_remove_garbage
     def connect(
         self, subscriber: Callable[[_T], None], instance: object, weak: bool = True, max_uses: int | None = None
     ) -> None:
@@ -296,22 +304,24 @@ class Signal(Generic[_T]):
         stopping unknown state, as it is indeterminate which will be called first.  If this is done, the second
         call will be ignored and a warning will be provided.
         """
+        referent: object | None = None
         if weak:
             if isinstance(subscriber, MethodType):
-                finalize(subscriber.__self__, self._remove_subscriber)
+                referent = subscriber.__self__
                 subscriber = WeakMethod(subscriber)  # type: ignore
             else:
-                finalize(subscriber, self._remove_subscriber)
+                referent = subscriber
                 subscriber = ref(subscriber)  # type: ignore
         element: _SignalElement = _SignalElement(id(instance), subscriber, uses_left=max_uses)
 
         if element not in self:
             signal_log.debug("%s adding %s to %s", instance.__class__.__name__, element, self)
-            self.subscribers.append(element)
+            self._subscribers.setdefault(element.uid, []).append(element)
+            if referent is not None:
+                finalize(referent, self._remove_element, element)
         else:
             signal_log.warning("%s failed to add %s to %s", instance.__class__.__name__, element, self)
 
-    @_remove_garbage
     def disconnect(self, subscriber: Callable[[_T], None], instance: object | None) -> None:
         """
         Allows for a subscriber with or without respect to a given instance to no longer receive actions from
@@ -325,13 +335,12 @@ class Signal(Generic[_T]):
             The object which was interested in `subscriber`.
         """
         element: _SignalElement = _SignalElement(id(instance), subscriber)
-        for idx, sub in enumerate(self.subscribers):
+        for sub in self._subscribers.get(element.uid, ()):
             if sub == element:
-                del self.subscribers[idx]
+                self._remove_element(sub)
                 signal_log.debug("%s removed %s from %s", self.__class__.__name__, element, self)
                 break
 
-    @_remove_garbage
     def emit(self, value: _T, instance: object) -> None:
         """
         Emits an action to `subscribers`.
@@ -342,15 +351,22 @@ class Signal(Generic[_T]):
             The result of an action taken.
         instance : object
             The object associated with this action.
+
+        Notes
+        -----
+            Inside of a `SignalBatch`, the action is delivered once the batch exits.
         """
-        for subscriber in self.subscribers:
-            if subscriber.uid == id(instance) and not subscriber.is_silenced:
+        if SignalBatch.is_batching():
+            SignalBatch.defer(self, value, instance)
+            return
+        # Copy the subscribers, as subscribers may connect or disconnect while being notified.
+        for subscriber in list(self._subscribers.get(id(instance), ())):
+            if not subscriber.is_silenced and subscriber.subscriber_callable is not None:
                 signal_log.debug("%s notifying %s of %s", self.name, subscriber, value)
                 subscriber(value)
                 if subscriber.uses_left is not None and not subscriber.uses_left:
-                    self._remove_subscriber()
+                    self._remove_element(subscriber)
 
-    @_remove_garbage
     def is_silenced(self, instance: object) -> bool:
         """
         Determines if `instance` has silenced their subscriber with respect to this signal.
@@ -365,9 +381,8 @@ class Signal(Generic[_T]):
         bool
             If `instance` has silenced their subscriber.
         """
-        return not any(sub.uid == id(instance) and not sub.is_silenced for sub in self)
+        return not any(not sub.is_silenced for sub in self._subscribers.get(id(instance), ()))
 
-    @_remove_garbage
     def silence(self, instance: object, is_silenced: bool) -> None:
         """
         Sets the silence status for `instance`'s subscriber.
@@ -381,31 +396,29 @@ class Signal(Generic[_T]):
         """
         if DEBUG >= signal_log.level:
             _prior_silenced = self.is_silenced(instance)
-        for idx, sub in enumerate(self.subscribers):
-            if sub.uid == id(instance):
-                self.subscribers[idx].is_silenced = is_silenced
+        for sub in self._subscribers.get(id(instance), ()):
+            sub.is_silenced = is_silenced
         if DEBUG >= signal_log.level and _prior_silenced != is_silenced:  # type: ignore
             signal_log.debug(f"{instance}::{self.name} {'silenced' if is_silenced else 'unsilenced'}")
 
-    def _remove_garbage_subscribers(self) -> None:
-        """
-        Removes subscribers that need to be garbage collected.
+    def _remove_element(self, element: _SignalElement) -> None:
         """
-        if self._dead_subscribers:
-            self._dead_subscribers = False
-            self.subscribers = [
-                r
-                for r in self.subscribers
-                if (not isinstance(r.subscriber, ReferenceType) or r.subscriber() is not None)
-                and (r.uses_left is None or r.uses_left)
-            ]
+        Removes a single subscriber, if it is still subscribed.
 
-    def _remove_subscriber(self) -> None:
-        """
-        Notifies the signal that subscribers need to be cleaned before any action is taken.
+        Parameters
+        ----------
+        element : _SignalElement
+            The subscriber to remove.
         """
-        signal_log.debug("%s queued garbage collection", self.name)
-        self._dead_subscribers = True
+        elements: list[_SignalElement] | None = self._subscribers.get(element.uid)
+        if elements is None:
+            return
+        for idx, sub in enumerate(elements):
+            if sub is element:
+                del elements[idx]
+                break
+        if not elements:
+            del self._subscribers[element.uid]
 
 
 @attrs(slots=True, auto_attribs=True, frozen=True, eq=True, hash=True)
@@ -455,19 +468,19 @@ class SignalInstance(Generic[_T]):
         raise KeyError(key)
 
     def __getitem__(self, key) -> _SignalElement:
-        for value in filter(lambda v: v.uid == id(self.instance), self.signal):
+        for value in self.signal.subscribers_of(self.instance):
             if value == key:
                 return value
         return self.__missing__(key)
 
     def __contains__(self, value: _SignalElement) -> bool:
-        return any(v == value and v.uid == id(self.instance) for v in self.signal)
+        return any(v == value for v in self.signal.subscribers_of(self.instance))
 
     def __len__(self) -> int:
-        return len(list(iter(self)))
+        return len(self.signal.subscribers_of(self.instance))
 
     def __iter__(self) -> Iterator[_SignalElement[_T]]:
-        return iter(filter(lambda v: v.uid == id(self.instance), self.signal))
+        return iter(list(self.signal.subscribers_of(self.instance)))
 
     def __bool__(self) -> bool:
         return len(self) > 0
@@ -615,6 +628,101 @@ class SignalTester:
         self.signal.disconnect(self.increment_counter)
 
 
+class _SignalBatchState(local):
+    """
+    The batches of a single thread, which are independent from the batches of every other thread.
+
+    Attributes
+    ----------
+    depth: int
+        The amount of nested batches which are active.
+    pending: dict[tuple[int, int], tuple[Signal, object, Any]]
+        The latest deferred action of each signal instance.
+    """
+
+    def __init__(self):
+        self.depth: int = 0
+        self.pending: dict[tuple[int, int], tuple[Signal, object, Any]] = {}
+
+
+@attrs(auto_attribs=True)
+class SignalBatch:
+    """
+    A context manager for coalescing the actions of every signal, so a bulk operation only notifies each subscriber
+    once.
+
+    Attributes
+    ----------
+    deliver_later: bool = False
+        If the actions are delivered on the next iteration of the event loop, instead of when the outermost batch exits.
+
+    Notes
+    -----
+        Batches may be nested, where the actions are only delivered once the outermost batch exits.  Each signal
+    instance only emits its most recent action, in the order that it first emitted.
+
+        Batches are local to the thread which entered them, so a batch only defers the actions emitted from its own
+    thread.
+    """
+
+    deliver_later: bool = False
+    _state: ClassVar[_SignalBatchState] = _SignalBatchState()
+
+    def __enter__(self) -> SignalBatch:
+        SignalBatch._state.depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        SignalBatch._state.depth -= 1
+        if SignalBatch._state.depth:
+            return
+        if self.deliver_later and QCoreApplication.instance() is not None:
+            QTimer.singleShot(0, SignalBatch.flush)
+        else:
+            SignalBatch.flush()
+
+    @classmethod
+    def is_batching(cls) -> bool:
+        """
+        Determines if a batch is active inside the current thread.
+
+        Returns
+        -------
+        bool
+            If actions are being deferred.
+        """
+        return cls._state.depth > 0
+
+    @classmethod
+    def defer(cls, signal: Signal[_T], value: _T, instance: object) -> None:
+        """
+        Defers an action until the batch of the current thread exits, replacing any prior action of the same signal
+        instance.
+
+        Parameters
+        ----------
+        signal : Signal[_T]
+            The signal emitting the action.
+        value : _T
+            The result of an action taken.
+        instance : object
+            The object associated with this action.
+        """
+        signal_log.debug("%s deferred %s for %s", cls.__name__, value, signal.name)
+        cls._state.pending[(id(signal), id(instance))] = (signal, instance, value)
+
+    @classmethod
+    def flush(cls) -> None:
+        """
+        Delivers every action deferred by the current thread, unless another batch has begun.
+        """
+        state = cls._state
+        while state.pending and not state.depth:
+            pending, state.pending = state.pending, {}
+            for signal, instance, value in pending.values():
+                signal.emit(value, instance)
+
+
 @attrs(auto_attribs=True)
 class SignalBlocker:
     """
@@ -743,6 +851,70 @@ class _Object(Generic[_T]):
         object_log.info("%s changed state to %s", self, model)
 
 
+def estimate_size(obj: object, _seen: set[int] | None = None) -> int:
+    """
+    Estimates the amount of memory retained by an object, including the objects it references.
+
+    Parameters
+    ----------
+    obj : object
+        The object to measure.
+
+    Returns
+    -------
+    int
+        The estimated amount of bytes retained by `obj`.
+
+    Notes
+    -----
+    Objects which are referenced multiple times are only counted once.
+    """
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+
+    size: int = getsizeof(obj)
+    if isinstance(obj, (str, bytes, bytearray, memoryview, int, float, bool, type(None))):
+        return size
+    if isinstance(obj, Mapping):
+        return size + sum(estimate_size(k, _seen) + estimate_size(v, _seen) for k, v in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset, deque)):
+        return size + sum(estimate_size(item, _seen) for item in obj)
+    if has(type(obj)):
+        return size + sum(estimate_size(getattr(obj, a.name), _seen) for a in fields(type(obj)))
+    if hasattr(obj, "__dict__"):
+        return size + estimate_size(vars(obj), _seen)
+    return size
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True)
+class UndoRedoStats:
+    """
+    A summary of the history retained by an undo and redo controller.
+
+    Attributes
+    ----------
+    undo_depth: int
+        The amount of actions which can be undone.
+    redo_depth: int
+        The amount of actions which can be redone.
+    size: int
+        The estimated amount of bytes retained by the actions.
+    discarded: int
+        The amount of actions which were removed to stay inside the limits.
+    compacted: int
+        The amount of actions which were merged into snapshots.
+    """
+
+    undo_depth: int
+    redo_depth: int
+    size: int
+    discarded: int
+    compacted: int
+
+
 @attrs(auto_attribs=True)
 class UndoRedo(Generic[_T]):
     """
@@ -761,6 +933,18 @@ class UndoRedo(Generic[_T]):
         A sequence of actions taken, which can be undone.
     redo_stack: deque[Action[_T]] = Factory(deque)
         A sequence of undone actions, which can be reapplied.
+    max_depth: int | None = None
+        The maximum amount of actions which can be undone, by default None or unbounded.
+    max_size: int | None = None
+        The maximum amount of bytes the models of the actions can retain, by default None or unbounded.
+    compaction_interval: int | None = None
+        The amount of recent actions which can be undone one at a time, by default None or every action.
+        Older actions are merged into snapshots of `compaction_stride` actions, so their intermediate models are
+        released.
+    compaction_stride: int = 10
+        The amount of actions merged into a single snapshot.
+    measure: Callable[[_T], int] = estimate_size
+        Estimates the amount of bytes retained by a model.
     """
 
     slots = ("model", "undo_stack", "redo_stack", "_current_model")
@@ -768,6 +952,16 @@ class UndoRedo(Generic[_T]):
     model: _T
     undo_stack: deque[Action[_T]] = Factory(lambda: deque(maxlen=1000000000))
     redo_stack: deque[Action[_T]] = Factory(deque)
+    max_depth: int | None = field(default=None, eq=False)
+    max_size: int | None = field(default=None, eq=False)
+    compaction_interval: int | None = field(default=None, eq=False)
+    compaction_stride: int = field(default=10, eq=False)
+    measure: Callable[[_T], int] = field(default=estimate_size, eq=False)
+    _sizes: dict[int, int] = field(init=False, factory=dict, eq=False)
+    _size: int = field(init=False, default=0, eq=False)
+    _compacted_depth: int = field(init=False, default=0, eq=False)
+    _discarded: int = field(init=False, default=0, eq=False)
+    _compacted: int = field(init=False, default=0, eq=False)
 
     def __attrs_post_init__(self) -> None:
         if DEBUG >= log.level:
@@ -780,6 +974,97 @@ class UndoRedo(Generic[_T]):
             + f"undone_actions=<{', '.join(str(a) for a in self.redo_stack)}>)"
         )
 
+    @property
+    def stats(self) -> UndoRedoStats:
+        """
+        Provides a summary of the history retained.
+
+        Returns
+        -------
+        UndoRedoStats
+            The depth, size, and the amount of actions removed or compacted of the history.
+        """
+        if self.max_size is None:
+            size = sum(self._measure_action(action) for action in chain(self.undo_stack, self.redo_stack))
+        else:
+            size = self._size
+        return UndoRedoStats(len(self.undo_stack), len(self.redo_stack), size, self._discarded, self._compacted)
+
+    def _measure_action(self, action: Action[_T]) -> int:
+        return self.measure(action.action()) + self.measure(action.reverse_action())
+
+    def _track(self, action: Action[_T]) -> None:
+        if self.max_size is not None:
+            size = self._measure_action(action)
+            self._sizes[id(action)] = size
+            self._size += size
+
+    def _untrack(self, action: Action[_T]) -> None:
+        self._size -= self._sizes.pop(id(action), 0)
+
+    def _clear_redo_stack(self) -> None:
+        for action in self.redo_stack:
+            self._untrack(action)
+        self.redo_stack.clear()
+
+    def _trim(self) -> None:
+        """
+        Removes the oldest actions until the history is inside its limits.
+
+        The latest action is always kept, so it can be undone regardless of its size.
+        """
+        while self.undo_stack and (
+            (self.max_depth is not None and len(self.undo_stack) > self.max_depth)
+            or (self.max_size is not None and self._size > self.max_size and len(self.undo_stack) > 1)
+        ):
+            self._untrack(self.undo_stack.popleft())
+            self._compacted_depth = max(0, self._compacted_depth - 1)
+            self._discarded += 1
+
+    def _merge(self, actions: Sequence[Action[_T]]) -> Action[_T] | None:
+        """
+        Merges a sequence of actions into a single action, which only retains the first and last models.
+
+        Returns
+        -------
+        Action[_T] | None
+            The merged action, or None if the actions have no overall effect.
+        """
+        first, last = actions[0], actions[-1]
+        if first.reverse_action() == last.action():
+            return None
+        return Action(last.actor, last.action, first.reverse_action, f"{first.name}...{last.name}")
+
+    def compact(self) -> None:
+        """
+        Merges the actions older than `compaction_interval` into snapshots of `compaction_stride` actions.
+        """
+        if self.compaction_interval is None or self.compaction_stride < 2:
+            return
+        end: int = len(self.undo_stack) - self.compaction_interval
+        if end - self._compacted_depth < self.compaction_stride:
+            return
+
+        recent: list[Action[_T]] = [self.undo_stack.pop() for _ in range(len(self.undo_stack) - end)][::-1]
+        pending: list[Action[_T]] = [self.undo_stack.pop() for _ in range(end - self._compacted_depth)][::-1]
+        remainder: int = len(pending) % self.compaction_stride
+        if remainder:
+            recent = pending[-remainder:] + recent
+            pending = pending[:-remainder]
+
+        for index in range(0, len(pending), self.compaction_stride):
+            group = pending[index : index + self.compaction_stride]
+            for action in group:
+                self._untrack(action)
+            merged = self._merge(group)
+            if merged is not None:
+                self.undo_stack.append(merged)
+                self._track(merged)
+            self._compacted += len(group)
+        self._compacted_depth = len(self.undo_stack)
+        self.undo_stack.extend(recent)
+        undo_log.debug("%s compacted %i actions", self.__class__.__name__, len(pending))
+
     def do(self, action: Action[_T]) -> None:
         """
         Adds an action to the undo stack.
@@ -790,7 +1075,8 @@ class UndoRedo(Generic[_T]):
             The action performed.
         """
         self.undo_stack.append(action)
-        self.redo_stack.clear()
+        self._clear_redo_stack()
+        self._track(action)
         if DEBUG >= log.level:
             undo_log.debug("%s<%s> has done %s", self.__class__.__name__, self.model, action)
 
@@ -808,6 +1094,8 @@ class UndoRedo(Generic[_T]):
                     )
                 )
             self._current_model = action.action()
+        self.compact()
+        self._trim()
 
     @property
     def can_undo(self) -> bool:
@@ -832,6 +1120,7 @@ class UndoRedo(Generic[_T]):
         """
         action: Action[_T] = self.undo_stack.pop()
         self.redo_stack.append(action)
+        self._compacted_depth = min(self._compacted_depth, len(self.undo_stack))
         if DEBUG >= log.level:
             undo_log.debug("%s<%s> has undone %s", self.__class__.__name__, self.model, action)
             self._current_model = action.reverse_action()
@@ -1035,7 +1324,23 @@ class UndoRedoForwarder(UndoRedoActor[_T]):
 
 
 class UndoRedoHelper(UndoRedoActor[_T]):
+    """
+    Provides an internal undo and redo controller.
+
+    Attributes
+    ----------
+    max_undo_depth: ClassVar[int | None] = None
+        The maximum amount of actions which can be undone.
+    max_undo_size: ClassVar[int | None] = None
+        The maximum amount of bytes the undo and redo history can retain.
+    undo_compaction_interval: ClassVar[int | None] = None
+        The amount of recent actions which can be undone one at a time before they are merged into snapshots.
+    """
+
     __undo_redo__: UndoRedo[_T]
+    max_undo_depth: ClassVar[int | None] = None
+    max_undo_size: ClassVar[int | None] = None
+    undo_compaction_interval: ClassVar[int | None] = None
 
     def initialize_state(self, model: _T, undo_redo: UndoRedo[_T] | None = None, *args, **kwargs) -> None:
         """
@@ -1058,7 +1363,27 @@ class UndoRedoHelper(UndoRedoActor[_T]):
         undo_redo : UndoRedo[_T] | None, optional
             The internal undo and redo controller to be used, by default None
         """
-        self.__undo_redo__ = UndoRedo(self.model) if undo_redo is None else undo_redo  # type: ignore
+        if undo_redo is None:
+            undo_redo = UndoRedo(
+                self.model,  # type: ignore
+                max_depth=self.max_undo_depth,
+                max_size=self.max_undo_size,
+                compaction_interval=self.undo_compaction_interval,
+            )
+        self.__undo_redo__ = undo_redo
+
+    @property
+    @final
+    def undo_redo_stats(self) -> UndoRedoStats:
+        """
+        Provides a summary of the undo and redo history.
+
+        Returns
+        -------
+        UndoRedoStats
+            The depth, size, and the amount of actions removed or compacted of the history.
+        """
+        return self.__undo_redo__.stats
 
     @property
     @final
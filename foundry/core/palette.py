@@ -2,12 +2,13 @@ from __future__ import annotations
 
 from collections.abc import Generator, Iterable, Iterator, Sequence
 from colorsys import hsv_to_rgb, rgb_to_hsv
-from functools import cache
 from json import loads
 from pathlib import Path
 from typing import ClassVar, Self, overload
 
 from attr import attrs, evolve, field, validators
+from numpy import array, empty, frombuffer, int32, intp, uint8
+from numpy.typing import NDArray
 from PySide6.QtGui import QColor
 
 from foundry import data_dir
@@ -36,6 +37,7 @@ ENEMY_PALETTE_GROUPS_PER_OBJECT_SET = 4
 PALETTES_PER_PALETTES_GROUP = 4
 COLORS_PER_PALETTE = 4
 COLOR_SIZE = 1  # byte
+QUANTIZE_CHUNK_SIZE = 0x1000  # pixels
 PALETTE_DATA_SIZE = (
     (PALETTE_GROUPS_PER_OBJECT_SET + ENEMY_PALETTE_GROUPS_PER_OBJECT_SET)
     * PALETTES_PER_PALETTES_GROUP
@@ -53,7 +55,6 @@ def _check_in_color_range(inst, attr, value):
     return value
 
 
-@cache
 def get_internal_palette_offset(tileset: int) -> int:
     """
     Provides the absolute internal point of the palette group offset from ROM.
@@ -68,7 +69,7 @@ def get_internal_palette_offset(tileset: int) -> int:
     int
         The absolute internal point of the tileset's palette group.
     """
-    return PALETTE_BASE_ADDRESS + ROM().little_endian(PALETTE_OFFSET_LIST + (tileset * PALETTE_OFFSET_SIZE))
+    return PaletteRepository.current().palette_offset(tileset)
 
 
 @attrs(slots=True, frozen=True, eq=True, hash=True)
@@ -317,11 +318,30 @@ class Color(ConcreteValidator, KeywordValidator):
 
 
 class ColorSequence(Sequence):
-    __slots__ = ("_list",)
+    """
+    An immutable sequence of colors, which can be indexed by position or by color.
+
+    Attributes
+    ----------
+    rgb_table: bytes
+        The RGB bytes of every color, three bytes per color, to convert color indexes to pixels in bulk.
+    rgb_array: NDArray[uint8]
+        The RGB values of every color as an array with a row per color.
+    """
+
+    __slots__ = ("_list", "_indexes", "rgb_table", "rgb_array")
     _list: list[Color]
+    _indexes: dict[Color, int]
+    rgb_table: bytes
+    rgb_array: NDArray[uint8]
 
     def __init__(self, iterable: Iterable[Color | QColor]):
         self._list = [Color.ensure_type(c) for c in iterable]
+        self._indexes = {}
+        for index, color in enumerate(self._list):
+            self._indexes.setdefault(color, index)
+        self.rgb_table = b"".join(color.to_rgb_bytes() for color in self._list)
+        self.rgb_array = frombuffer(self.rgb_table, dtype=uint8).reshape(len(self._list), 3)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self._list})"
@@ -344,10 +364,8 @@ class ColorSequence(Sequence):
         match index:
             case int():
                 return self._list[index % len(self._list)]
-            case Color():
-                return self._list.index(index)
-            case QColor():
-                return self._list.index(Color.from_qt(index))
+            case Color() | QColor():
+                return self.index(index)
             case _:
                 return NotImplemented
 
@@ -359,9 +377,9 @@ class ColorSequence(Sequence):
             case int():
                 return 0 <= value <= len(self._list)
             case Color():
-                return value in self._list
+                return value in self._indexes
             case QColor():
-                return Color.from_qt(value) in self._list
+                return Color.from_qt(value) in self._indexes
             case _:
                 return NotImplemented
 
@@ -370,13 +388,64 @@ class ColorSequence(Sequence):
 
     def index(self, value: Color | QColor, start: int = 0, stop: int | None = None) -> int:
         match value:
-            case Color():
-                return self._list.index(value, start, stop)  # type: ignore
-            case QColor():
-                return self._list.index(Color.from_qt(value), start, stop)  # type: ignore
+            case Color() | QColor():
+                color = Color.ensure_type(value)
+                if start == 0 and stop is None:
+                    try:
+                        return self._indexes[color]
+                    except KeyError:
+                        raise ValueError(f"{color} is not in {self}") from None
+                return self._list.index(color, start, len(self._list) if stop is None else stop)
             case _:
                 return NotImplemented
 
+    def nearest(self, value: Color | QColor) -> int:
+        """
+        Finds the color closest to a color, to convert colors which are not inside the sequence.
+
+        Parameters
+        ----------
+        value : Color | QColor
+            The color to find.
+
+        Returns
+        -------
+        int
+            The index of the color with the smallest euclidean distance in RGB to `value`.
+        """
+        color = Color.ensure_type(value)
+        if color in self._indexes:
+            return self._indexes[color]
+        return int(self.quantize(array([[color.red, color.green, color.blue]], dtype=uint8))[0])
+
+    def quantize(self, pixels: NDArray[uint8]) -> NDArray[intp]:
+        """
+        Converts RGB pixels to the indexes of the closest colors of the sequence.
+
+        Parameters
+        ----------
+        pixels : NDArray[uint8]
+            An array of pixels, whose last dimension are the red, green, and blue values.
+
+        Returns
+        -------
+        NDArray[intp]
+            An array of the same shape without the last dimension, containing the index of the color with the
+            smallest euclidean distance in RGB to each pixel.
+        """
+        flat = pixels.reshape(-1, 3)
+        colors = self.rgb_array.astype(int32)
+        indexes = empty(len(flat), dtype=intp)
+
+        # The distances are computed in chunks, as the distances of every pixel to every color can take hundreds of
+        # megabytes for a large image.
+        for start in range(0, len(flat), QUANTIZE_CHUNK_SIZE):
+            chunk = flat[start : start + QUANTIZE_CHUNK_SIZE].astype(int32)
+            distances = ((chunk[:, None, :] - colors[None, :, :]) ** 2).sum(axis=2)
+            indexes[start : start + QUANTIZE_CHUNK_SIZE] = distances.argmin(axis=1)
+
+        return indexes.reshape(pixels.shape[:-1])
+
     def count(self, value: Color | QColor) -> int:
         match value:
             case Color():
@@ -458,12 +527,56 @@ class ColorPalette(ConcreteValidator, KeywordValidator):
     def validate_from_default(cls) -> Self:
         return cls.from_default()
 
+    @property
+    def rgb_table(self) -> bytes:
+        """
+        Provides a lookup table from a color index to its RGB bytes.
+
+        Returns
+        -------
+        bytes
+            The RGB bytes of every color, three bytes per color.
+        """
+        return self.colors.rgb_table
+
     def index(self, value: Color | QColor, start: int = 0, stop: int | None = None) -> int:
         return self.colors.index(value, start, stop)
 
     def count(self, value: Color | QColor) -> int:
         return self.colors.count(value)
 
+    def nearest(self, value: Color | QColor) -> int:
+        """
+        Finds the index of the color closest to a color, such as the colors of imported art.
+
+        Parameters
+        ----------
+        value : Color | QColor
+            The color to find.
+
+        Returns
+        -------
+        int
+            The index of the closest color.
+        """
+        return self.colors.nearest(value)
+
+    def quantize(self, pixels: NDArray[uint8]) -> NDArray[intp]:
+        """
+        Converts RGB pixels, such as those of an imported image, to the indexes of the closest colors.
+
+        Parameters
+        ----------
+        pixels : NDArray[uint8]
+            An array of pixels, whose last dimension are the red, green, and blue values.
+
+        Returns
+        -------
+        NDArray[intp]
+            The index of the closest color of each pixel.
+        """
+        return self.colors.quantize(pixels)
+
 
 @attrs(slots=True, auto_attribs=True, frozen=True, eq=True, hash=True)
 @custom_validator("COLORS", method_name="validate_from_colors")
@@ -579,6 +692,20 @@ class Palette(ConcreteValidator, KeywordValidator):
             case _:
                 return NotImplemented
 
+    @property
+    def rgb_table(self) -> bytes:
+        """
+        Provides a lookup table from an index of the palette to its RGB bytes.
+
+        Returns
+        -------
+        bytes
+            The RGB bytes of every color of the palette, three bytes per color.
+        """
+        table = self.color_palette.rgb_table
+        count = len(self.color_palette.colors)
+        return b"".join(table[(i % count) * 3 : (i % count) * 3 + 3] for i in self.color_indexes)
+
     def evolve_color_index(self, index: int, color_index: int) -> Self:
         color_indexes = list(self.color_indexes)
         color_indexes[index] = color_index
@@ -691,9 +818,12 @@ class PaletteGroup(ConcreteValidator, KeywordValidator):
         -------
         PaletteGroup
             The PaletteGroup that represents the tileset's palette group at the provided offset.
+
+        Notes
+        -----
+        The palette group is provided by the `PaletteRepository` of the ROM, so it is only read once.
         """
-        offset = get_internal_palette_offset(tileset) + index * PALETTES_PER_PALETTES_GROUP * COLORS_PER_PALETTE
-        return cls.from_rom(offset)
+        return PaletteRepository.current().palette_group(tileset, index)
 
     @classmethod
     @validate(palettes=SequenceValidator.generate_class(Palette))
@@ -706,3 +836,103 @@ class PaletteGroup(ConcreteValidator, KeywordValidator):
         if any(map(lambda p: p != palette, palettes)):
             palettes = map(lambda p: p.evolve_color_index(0, palette[0]), palettes)
         return evolve(self, palettes=tuple(palettes))
+
+
+@attrs(slots=True, auto_attribs=True, eq=False)
+class PaletteRepository:
+    """
+    Memoizes the palette groups of a ROM, so each palette group is only read from the ROM once.
+
+    Attributes
+    ----------
+    rom_data: bytearray
+        The data of the ROM the palette groups are read from.
+    offsets: dict[int, int]
+        The absolute address of the palette groups of each tileset.
+    palette_groups: dict[tuple[int, int], PaletteGroup]
+        The palette groups read, by their tileset and index.
+
+    Notes
+    -----
+    Anything which writes palette groups to the ROM must invalidate them, so the changes are read again.
+    """
+
+    rom_data: bytearray
+    offsets: dict[int, int] = field(factory=dict)
+    palette_groups: dict[tuple[int, int], PaletteGroup] = field(factory=dict)
+
+    _current: ClassVar[PaletteRepository | None] = None
+
+    @classmethod
+    def current(cls) -> PaletteRepository:
+        """
+        Provides the repository of the loaded ROM, creating a new repository when a different ROM is loaded.
+
+        Returns
+        -------
+        PaletteRepository
+            The repository of the loaded ROM.
+        """
+        if cls._current is None or cls._current.rom_data is not ROM.rom_data:
+            cls._current = cls(ROM.rom_data)
+        return cls._current
+
+    def palette_offset(self, tileset: int) -> int:
+        """
+        Provides the absolute address of the palette groups of a tileset.
+
+        Parameters
+        ----------
+        tileset : int
+            The index of the tileset.
+
+        Returns
+        -------
+        int
+            The absolute address of the tileset's first palette group.
+        """
+        if tileset not in self.offsets:
+            self.offsets[tileset] = PALETTE_BASE_ADDRESS + ROM().little_endian(
+                PALETTE_OFFSET_LIST + (tileset * PALETTE_OFFSET_SIZE)
+            )
+        return self.offsets[tileset]
+
+    def palette_group(self, tileset: int, index: int) -> PaletteGroup:
+        """
+        Provides a palette group of a tileset, reading it from the ROM if it was not read already.
+
+        Parameters
+        ----------
+        tileset : int
+            The index of the tileset.
+        index : int
+            The index of the palette group inside the tileset.
+
+        Returns
+        -------
+        PaletteGroup
+            The tileset's palette group at the provided index.
+        """
+        key = tileset, index
+        if key not in self.palette_groups:
+            self.palette_groups[key] = PaletteGroup.from_rom(
+                self.palette_offset(tileset) + index * PALETTES_PER_PALETTES_GROUP * COLORS_PER_PALETTE
+            )
+        return self.palette_groups[key]
+
+    def invalidate(self, tileset: int, index: int | None = None) -> None:
+        """
+        Forgets palette groups which were written to the ROM, so they are read again.
+
+        Parameters
+        ----------
+        tileset : int
+            The index of the tileset.
+        index : int | None, optional
+            The index of the palette group inside the tileset, by default None or every palette group of the tileset.
+        """
+        if index is None:
+            for key in [key for key in self.palette_groups if key[0] == tileset]:
+                del self.palette_groups[key]
+        else:
+            self.palette_groups.pop((tileset, index), None)
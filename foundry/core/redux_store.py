@@ -8,11 +8,18 @@ A Generic type state S is used to hold the state data for the module and
 actions given to the store are used to transform the state into a new state
 through a set of reducers.  The reducers are UI specific and so abstract in
 this interface definition.
+
+For larger states, ImmutableReduxStore avoids copying the state entirely by
+requiring the state to be immutable, such as a frozen dataclass or attrs class.
+Reducers return evolved copies which share every unchanged field with the old
+state, so a change is detected by identity alone.
 """
 import copy
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Generic, TypeVar
+from dataclasses import dataclass, is_dataclass, replace
+from typing import Any, Callable, Generic, TypeVar
+
+from attr import evolve, has
 
 
 class StateNoneError(Exception):
@@ -51,7 +58,7 @@ class ReduxStore(ABC, Generic[S]):
     the developer.
     """
 
-    _subscribers = []
+    _subscribers: list[Callable]
 
     def __init__(self, state: S):
         """Initialize the store with the default state.
@@ -61,6 +68,7 @@ class ReduxStore(ABC, Generic[S]):
         if not state:
             raise StateNoneError
 
+        self._subscribers = []
         self._default_state = state
         self._state = copy.deepcopy(state)
 
@@ -111,3 +119,70 @@ class ReduxStore(ABC, Generic[S]):
     def subscribe(self, subscriber):
         """Subscribe a function to be called when the state changes."""
         self._subscribers.append(subscriber)
+
+
+class ImmutableReduxStore(ReduxStore[S]):
+    """A Redux store for immutable states which never copies the state.
+
+    The state must be immutable, such as a frozen dataclass or attrs class, and
+    reducers must return a new state instead of modifying the old one.  The
+    evolve() method creates the new state and returns the old state when no
+    field would change, so dispatch() only has to compare identities to know
+    whether the state changed.
+
+    Because the state cannot be modified, get_state() returns the stored state
+    itself.  Subscribers are called without arguments, like the subscribers of
+    ReduxStore, so a callback can subscribe to either store and retrieve the
+    new state from get_state() without it being copied.
+    """
+
+    def __init__(self, state: S):
+        """Initialize the store with the default state.
+
+        StateNoneError is raised if a None is provided for the default state
+        """
+        if not state:
+            raise StateNoneError
+
+        self._subscribers = []
+        self._default_state = state
+        self._state = state
+
+    def get_default_state(self) -> S:
+        """Returns the default state."""
+        return self._default_state
+
+    def get_state(self) -> S:
+        """Get the current state."""
+        return self._state
+
+    def dispatch(self, action: Action):
+        """Updates the system state based on user action.
+
+        The subscribers are only notified if the reducers returned a different
+        state object than the current state.
+        """
+        old_state = self._state
+        self._state = self._reduce(old_state, action)
+
+        if self._state is not old_state:
+            self._notify_subscribers()
+
+    @staticmethod
+    def evolve(state: S, **changes) -> S:
+        """Creates a copy of a state with some fields changed.
+
+        Unchanged fields are shared between both states.  If every changed
+        field is equal to the current value, the state itself is returned, so
+        no subscribers are notified.
+        """
+        if has(type(state)):
+            create = evolve
+        elif is_dataclass(state):
+            create = replace
+        else:
+            raise TypeError(f"{type(state).__name__} is not a dataclass or attrs class")
+
+        if all(getattr(state, name) == value for name, value in changes.items()):
+            return state
+        return create(state, **changes)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from asyncio import (
+    AbstractEventLoop,
     TimeoutError,
     ensure_future,
     gather,
@@ -8,27 +9,47 @@ from asyncio import (
     run,
     sleep,
     wait_for,
+    wrap_future,
 )
 from atexit import register
-from collections.abc import Callable, Mapping, Sequence
+from collections import OrderedDict, deque
+from collections.abc import Callable, Generator, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import suppress
 from copy import copy
 from enum import Enum
-from itertools import chain
+from functools import partial
+from hashlib import sha256
+from importlib import import_module
+from io import BytesIO
+from itertools import chain, islice
+from json import dump
 from logging import DEBUG, WARNING, Logger, NullHandler, getLogger
-from multiprocessing import Pipe, Process, cpu_count, current_process
+from multiprocessing import (
+    Pipe,
+    Process,
+    Value,
+    cpu_count,
+    current_process,
+    parent_process,
+)
 from multiprocessing.connection import _ConnectionBase as Connection
-from random import choice
-from signal import SIGINT, SIGTERM, signal
-from time import time
+from multiprocessing.resource_tracker import unregister
+from multiprocessing.shared_memory import SharedMemory
+from os import name as os_name
+from signal import SIG_DFL, SIGINT, SIGTERM, signal
+from threading import Event, Thread, local
+from time import perf_counter, time
 from typing import Any, ClassVar, Generic, Literal, ParamSpec, TypeVar, overload
 from warnings import catch_warnings, simplefilter
 
-from attr import attrs
-from dill import dumps, loads, pickles
+from attr import Factory, asdict, attrs, evolve, field
+from attr.validators import ge, optional
+from dill import Pickler, Unpickler, dumps, pickles
 from dill.detect import badtypes
 from func_timeout import FunctionTimedOut, func_timeout
 from nest_asyncio import apply as allow_nesting
+from numpy import frombuffer, ndarray, percentile
 
 from foundry.core.gui import Signal, SignalInstance
 
@@ -39,6 +60,7 @@ log.addHandler(NullHandler())
 
 _P = ParamSpec("_P")
 _T = TypeVar("_T")
+_A = TypeVar("_A")
 
 RequestValue = TypeVar("RequestValue")
 ReplyValue = TypeVar("ReplyValue")
@@ -66,14 +88,14 @@ The desired rate of polling for a worker process of the task manager.
 AUTOMATED_REMOVAL_DURATION: float = 5
 """
 The amount of seconds the task manager will wait without any response from the parent process until it will
-automatically stop itself and terminate gracefully.
+automatically begin to scale down its workers.
 
 Notes
 -----
     The automated removal servers two primary purposes: If the user tabs out and does not require multiprocessing, then
-they won't be burdened with unnecessary processing.  During testing, PyTest does not end the process until all
-processes finish, so testing does not require a SEGKILL signal to end the testing.  Also, it likely it also provides
-redundancy in killing the process.
+they won't be burdened with unnecessary processing, while the warm workers described by `IdlePolicy` still allow the
+next task to start immediately.  The task manager will always stop itself once its parent process exits, so testing
+does not require a SEGKILL signal to end the testing.
 """
 
 FORCE_TERMINATION_TIMEOUT: float = 0.5
@@ -91,18 +113,348 @@ RESPONSIVE_TIMEOUT: float = 0.1
 The maximum amount of time a responsive task should take without getting timed out.
 """
 
+LISTENER_TIMEOUT: float = 0.1
+"""
+The maximum amount of time a thread listening for finished tasks blocks before checking if it was stopped.
+"""
+
+WORKER_PREFETCH_LIMIT: int = 1
+"""
+The maximum amount of tasks the task manager will send to a single worker process at once.
+
+Notes
+-----
+    Tasks beyond this limit are kept inside the task manager, so they can still be stolen by an idle worker.  Once a
+task is sent to a worker process it can no longer be reassigned, so a short task prefetched behind a long task would
+have to wait for the long task to finish.  Only sending a single task at a time keeps the tail latency of batches low.
+"""
+
+RESULT_CACHE_SIZE: int = 0x4000000
+"""
+The maximum amount of bytes of results of pure tasks the task manager will cache.
+"""
+
+METRICS_SAMPLE_SIZE: int = 1000
+"""
+The amount of the most recent tasks of each type used to compute the latency percentiles of the task manager.
+"""
+
+MAP_CHUNK_SIZE: int = 16
+"""
+The default amount of items sent to a worker process inside a single task when mapping a function.
+"""
+
+MAP_CHUNKS_PER_WORKER: int = 2
+"""
+The default amount of chunks per worker process permitted to be unfinished at once when mapping a function.
+"""
+
+MANAGER_JOIN_TIMEOUT: float = 10
+"""
+The maximum amount of time the task manager will wait for its pending tasks to be sent to its workers when joining.
+"""
+
+
+SHARED_MEMORY_THRESHOLD: int = 0x10000
+"""
+The minimum size in bytes of a buffer for it to be sent through shared memory instead of being serialized.
+"""
+
+_REFERENCE_COUNT_SIZE: int = 8
+_REFERENCE_COUNT_ORDER: Literal["little"] = "little"
+
 
 class NotAPickleException(ValueError):
     pass
 
 
+class TaskCancelled(Exception):
+    """
+    An exception provided as the result of a task which was cancelled or superseded before it finished.
+    """
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True, eq=True, hash=True)
+class IdlePolicy:
+    """
+    The policy a task manager follows when it is not actively receiving tasks.
+
+    Instead of stopping every worker once the task manager becomes idle, workers are stopped one at a time until only
+    the warm workers remain.  The warm workers are able to start a task immediately, without paying for a new process
+    to start and import its modules.
+
+    Attributes
+    ----------
+    warm_workers: int = 1
+        The amount of workers kept alive while the task manager is idle.
+    scale_down_delay: float = AUTOMATED_REMOVAL_DURATION
+        The amount of seconds without any activity before workers begin to be stopped.
+    scale_down_interval: float = 1
+        The amount of seconds between stopping each worker.
+    stop_delay: float | None = None
+        The amount of seconds without any activity before the task manager stops itself, None to never stop.
+    preload: tuple[str, ...] = ()
+        The modules to import before a worker starts, so tasks do not have to import them.
+    initializer: Callable[[], None] | None = None
+        A function to be called by each worker before it starts, to load any data required by its tasks.
+
+    Notes
+    -----
+        Similar to the `forkserver` preload list, the task manager imports `preload` before it starts any worker, so
+    workers created by forking inherit the modules already imported.
+    """
+
+    warm_workers: int = field(default=1, validator=ge(0))
+    scale_down_delay: float = field(default=AUTOMATED_REMOVAL_DURATION, validator=ge(0))
+    scale_down_interval: float = field(default=1, validator=ge(0))
+    stop_delay: float | None = field(default=None, validator=optional(ge(0)))
+    preload: tuple[str, ...] = ()
+    initializer: Callable[[], None] | None = None
+
+    def prepare(self) -> None:
+        """
+        Imports the preloaded modules and calls the initializer of the policy.
+        """
+        for module in self.preload:
+            import_module(module)
+        if self.initializer is not None:
+            self.initializer()
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True, eq=True, hash=True)
+class SharedPayload:
+    """
+    A handle to a buffer which was moved into a shared memory segment, so only the handle needs to be serialized.
+
+    The segment begins with the amount of references to the segment which have not been loaded, followed by the data
+    of the buffer.  The receiver decrements the count as it loads each reference and unlinks the segment once the count
+    reaches zero, so the sender is free to release its own handle afterwards.
+
+    Attributes
+    ----------
+    name: str
+        The name of the shared memory segment.
+    kind: str
+        The type of the buffer: `bytes`, `bytearray`, `memoryview`, or `ndarray`.
+    size: int
+        The amount of bytes inside the buffer.
+    dtype: str | None = None
+        The data type of the buffer, if it was an array.
+    shape: tuple[int, ...] = ()
+        The shape of the buffer, if it was an array.
+    """
+
+    name: str
+    kind: str
+    size: int
+    dtype: str | None = None
+    shape: tuple[int, ...] = ()
+
+    def __str__(self) -> str:
+        return f"<{self.kind}, {self.name}, {self.size} bytes>"
+
+    def load(self, segment: SharedMemory) -> Any:
+        """
+        Copies the buffer out of its shared memory segment.
+
+        Parameters
+        ----------
+        segment : SharedMemory
+            The segment associated with this handle.
+
+        Returns
+        -------
+        Any
+            A buffer of the same type which was sent.
+        """
+        data = segment.buf[_REFERENCE_COUNT_SIZE : _REFERENCE_COUNT_SIZE + self.size]
+        try:
+            match self.kind:
+                case "bytes":
+                    return bytes(data)
+                case "bytearray":
+                    return bytearray(data)
+                case "memoryview":
+                    return memoryview(bytearray(data))
+                case _:
+                    return frombuffer(data, dtype=self.dtype).reshape(self.shape).copy()
+        finally:
+            data.release()
+
+
+def _shareable_buffer(obj: Any, threshold: int) -> tuple[memoryview, SharedPayload] | None:
+    """
+    Determines if an object can and should be moved into shared memory.
+
+    Parameters
+    ----------
+    obj : Any
+        The object to be serialized.
+    threshold : int
+        The minimum size in bytes required to move a buffer into shared memory.
+
+    Returns
+    -------
+    tuple[memoryview, SharedPayload] | None
+        A byte view of the buffer and an unnamed handle for it, otherwise None if it should be serialized normally.
+    """
+    match obj:
+        case bytes() | bytearray():
+            if len(obj) < threshold:
+                return None
+            return memoryview(obj), SharedPayload("", type(obj).__name__, len(obj))
+        case memoryview():
+            if obj.nbytes < threshold or not obj.c_contiguous:
+                return None
+            return obj.cast("B"), SharedPayload("", "memoryview", obj.nbytes)
+        case ndarray():
+            if obj.nbytes < threshold or obj.dtype.hasobject or not obj.flags.c_contiguous:
+                return None
+            return memoryview(obj.reshape(-1).view("u1")), SharedPayload(
+                "", "ndarray", obj.nbytes, obj.dtype.str, obj.shape
+            )
+        case _:
+            return None
+
+
+class SharedMemoryPickler(Pickler):
+    """
+    A pickler which moves large buffers into shared memory segments and only serializes their handles.
+
+    Attributes
+    ----------
+    threshold: int
+        The minimum size in bytes of a buffer to be moved into shared memory.
+    segments: dict[int, tuple[Any, SharedPayload, SharedMemory]]
+        The buffers moved into shared memory, keyed by their identity, to share a segment between references.
+    references: dict[str, int]
+        The amount of references to each segment inside the serialized object.
+    """
+
+    def __init__(self, file, threshold: int = SHARED_MEMORY_THRESHOLD, *args, **kwargs):
+        super().__init__(file, *args, **kwargs)
+        self.threshold = threshold
+        self.segments: dict[int, tuple[Any, SharedPayload, SharedMemory]] = {}
+        self.references: dict[str, int] = {}
+
+    def persistent_id(self, obj: Any) -> SharedPayload | None:
+        if id(obj) in self.segments:
+            _, payload, _ = self.segments[id(obj)]
+        else:
+            buffer = _shareable_buffer(obj, self.threshold)
+            if buffer is None:
+                return None
+            data, payload = buffer
+            segment = SharedMemory(create=True, size=_REFERENCE_COUNT_SIZE + payload.size)
+            if os_name == "posix":
+                # The receiver is responsible for unlinking the segment, so it must not be removed when we exit.
+                unregister(segment._name, "shared_memory")  # type: ignore
+            segment.buf[_REFERENCE_COUNT_SIZE : _REFERENCE_COUNT_SIZE + payload.size] = data
+            payload = SharedPayload(segment.name, payload.kind, payload.size, payload.dtype, payload.shape)
+            # Keep a reference to the object, so its identity cannot be reused while pickling.
+            self.segments[id(obj)] = (obj, payload, segment)
+        self.references[payload.name] = self.references.get(payload.name, 0) + 1
+        return payload
+
+    def commit(self) -> list[SharedMemory]:
+        """
+        Writes the reference count of each segment, so they can be loaded by the receiver.
+
+        Returns
+        -------
+        list[SharedMemory]
+            The segments which were created.
+        """
+        segments: list[SharedMemory] = []
+        for _, payload, segment in self.segments.values():
+            segment.buf[:_REFERENCE_COUNT_SIZE] = self.references[payload.name].to_bytes(
+                _REFERENCE_COUNT_SIZE, _REFERENCE_COUNT_ORDER
+            )
+            segments.append(segment)
+        return segments
+
+    def discard(self) -> None:
+        """
+        Removes every segment which was created, as the object will not be sent.
+        """
+        for _, _, segment in self.segments.values():
+            with suppress(FileNotFoundError):
+                segment.close()
+                segment.unlink()
+        self.segments.clear()
+
+
+class SharedMemoryUnpickler(Unpickler):
+    """
+    An unpickler which loads buffers from the shared memory segments created by a `SharedMemoryPickler`.
+
+    Attributes
+    ----------
+    segments: dict[str, SharedMemory]
+        The segments which are attached, keyed by their name.
+    """
+
+    def __init__(self, file, *args, **kwargs):
+        super().__init__(file, *args, **kwargs)
+        self.segments: dict[str, SharedMemory] = {}
+
+    def persistent_load(self, pid: SharedPayload) -> Any:
+        if pid.name not in self.segments:
+            self.segments[pid.name] = SharedMemory(pid.name)
+        segment: SharedMemory = self.segments[pid.name]
+        obj = pid.load(segment)
+
+        references: int = int.from_bytes(segment.buf[:_REFERENCE_COUNT_SIZE], _REFERENCE_COUNT_ORDER) - 1
+        segment.buf[:_REFERENCE_COUNT_SIZE] = references.to_bytes(_REFERENCE_COUNT_SIZE, _REFERENCE_COUNT_ORDER)
+        if references <= 0:
+            del self.segments[pid.name]
+            segment.close()
+            segment.unlink()
+        return obj
+
+
+def is_segment_released(segment: SharedMemory) -> bool:
+    """
+    Determines if every reference to a segment was loaded by its receiver.
+
+    Parameters
+    ----------
+    segment : SharedMemory
+        The segment which was sent.
+
+    Returns
+    -------
+    bool
+        If the segment is no longer required by the receiver.
+    """
+    return int.from_bytes(segment.buf[:_REFERENCE_COUNT_SIZE], _REFERENCE_COUNT_ORDER) <= 0
+
+
 class DilledConnection(Connection):
     """
     Decorates a connection object to use `dill` instead of `pickle` so we can serialize additional objects.
+
+    Buffers which are larger than `shared_memory_threshold` are moved through shared memory, so only a handle to them
+    is serialized and sent through the pipe.
+
+    Attributes
+    ----------
+    connection: Connection
+        The connection being decorated.
+    shared_memory_threshold: int | None
+        The minimum size in bytes of a buffer to be sent through shared memory, None to serialize every buffer.
+    last_sent_size: int
+        The amount of bytes serialized for the last object sent.
+    last_received_size: int
+        The amount of bytes serialized for the last object received.
     """
 
-    def __init__(self, connection: Connection):
+    def __init__(self, connection: Connection, shared_memory_threshold: int | None = SHARED_MEMORY_THRESHOLD):
         self.connection = connection
+        self.shared_memory_threshold = shared_memory_threshold
+        self.last_sent_size: int = 0
+        self.last_received_size: int = 0
+        self._sent_segments: list[SharedMemory] = []
 
     @property
     def closed(self):
@@ -125,15 +477,46 @@ class DilledConnection(Connection):
 
     def close(self):
         """Close the connection"""
+        self.release_segments()
         self.connection.close()
 
+    def release_segments(self) -> None:
+        """
+        Closes our handles to every segment sent which the receiver has finished loading.
+        """
+        sent_segments: list[SharedMemory] = []
+        for segment in self._sent_segments:
+            if is_segment_released(segment):
+                segment.close()
+            else:
+                sent_segments.append(segment)
+        self._sent_segments = sent_segments
+
     def send_bytes(self, buf, offset=0, size=None):
         """Send the bytes data from a bytes-like object"""
         self.connection.send_bytes(buf, offset, size)
 
     def send(self, obj):
         """Send a (picklable) object"""
-        self.connection.send_bytes(dumps(obj))
+        self.release_segments()
+        buffer = BytesIO()
+        if self.shared_memory_threshold is None:
+            Pickler(buffer).dump(obj)
+            self.last_sent_size = buffer.getbuffer().nbytes
+            self.connection.send_bytes(buffer.getbuffer())
+            return
+
+        pickler = SharedMemoryPickler(buffer, self.shared_memory_threshold)
+        try:
+            pickler.dump(obj)
+            segments: list[SharedMemory] = pickler.commit()
+            self.last_sent_size = buffer.getbuffer().nbytes
+            self.connection.send_bytes(buffer.getbuffer())
+        except BaseException:
+            pickler.discard()
+            raise
+        # The segments must stay open until they are loaded, as some platforms remove them once every handle is closed.
+        self._sent_segments.extend(segments)
 
     def recv_bytes(self, maxlength=None):
         """
@@ -151,7 +534,9 @@ class DilledConnection(Connection):
     def recv(self):
         """Receive a (picklable) object"""
         buf = self.connection._recv_bytes()  # type: ignore
-        return loads(buf.getbuffer())
+        self.last_received_size = buf.getbuffer().nbytes
+        buf.seek(0)
+        return SharedMemoryUnpickler(buf).load()
 
     def poll(self, timeout=0.0):
         """Whether there is any input available to be read"""
@@ -188,6 +573,8 @@ class Requests(Enum):
         A request for the receiver to finish all tasks currently active.
     LIMIT
         A request for the receiver to not start tasks.
+    GET_METRICS
+        A request to receive the metrics of the receiver.
     """
 
     NOT_DEFINED = -1
@@ -197,6 +584,51 @@ class Requests(Enum):
     STOP = 3
     JOIN = 4
     LIMIT = 5
+    GET_METRICS = 6
+
+
+class Priority(Enum):
+    """
+    The urgency of a task, where more urgent tasks are sent to workers before less urgent tasks.
+
+    Attributes
+    ----------
+    INTERACTIVE
+        A task the user is actively waiting on.
+    VISIBLE
+        A task whose result is currently displayed to the user.
+    BACKGROUND
+        A task whose result is not immediately required.
+    """
+
+    INTERACTIVE = 0
+    VISIBLE = 1
+    BACKGROUND = 2
+
+
+class Executor(Enum):
+    """
+    Where a task is performed, which can be chosen for each task without changing how it is scheduled.
+
+    Attributes
+    ----------
+    PROCESS
+        A worker process, for tasks which hold the global interpreter lock.
+    THREAD
+        A thread of the main process, for tasks which wait on I/O, release the global interpreter lock, or return
+        results which cannot be pickled.
+    INLINE
+        The thread which scheduled the task inside the main process, for tasks which are trivial to perform.
+
+    Notes
+    -----
+        Tasks performed by threads or inline are never sent to the task manager, so neither the task nor its result
+    is pickled unless a task performed by a worker process requires its result.
+    """
+
+    PROCESS = 0
+    THREAD = 1
+    INLINE = 2
 
 
 class Status(Enum):
@@ -262,12 +694,24 @@ class Task(Generic[_P, _T]):
         The identity of the task.
     required_tasks: Sequence[int] = []
         Tasks which are required to be complete prior to execution of this task.
+    key: str | None = None
+        A stable hash of the task, if it is pure and its result can be cached.
+    priority: Priority = Priority.VISIBLE
+        The urgency of the task.
+    supersede_key: str | None = None
+        A key shared by tasks which replace one another, where a new task cancels any unfinished task with its key.
+    executor: Executor = Executor.PROCESS
+        Where the task is performed.
     """
 
     _last_identity: ClassVar[int] = 0
     task: Callable[_P, _T]
     identity: int
     required_tasks: Sequence[int] = []
+    key: str | None = None
+    priority: Priority = Priority.VISIBLE
+    supersede_key: str | None = None
+    executor: Executor = Executor.PROCESS
 
     def __str__(self) -> str:
         return f"<{self.task.__name__}, 0x{self.identity:02X}>"
@@ -309,6 +753,10 @@ class WorkerTask(Generic[_P, _T]):
     def identity(self) -> int:
         return self.task.identity
 
+    @property
+    def priority(self) -> Priority:
+        return self.task.priority
+
     def begin_task(self) -> _T:
         """
         Begins execution of the task.
@@ -338,6 +786,77 @@ class WorkerTask(Generic[_P, _T]):
         return cls(task, args)
 
 
+@attrs(slots=True, auto_attribs=True, frozen=True)
+class CancelTask:
+    """
+    A message to the task manager to cancel a task.
+
+    Attributes
+    ----------
+    identity: int
+        The identity of the task to cancel.
+    """
+
+    identity: int
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True)
+class PerformedTask:
+    """
+    A receipt of a task which the main process performed itself, so the task manager can record it and start the tasks
+    which require it.
+
+    Attributes
+    ----------
+    identity: int
+        The identity of the task.
+    name: str
+        The name of the type of the task.
+    executor: Executor
+        Where the task was performed.
+    queue_wait: float
+        The amount of seconds the task waited before it was performed.
+    duration: float
+        The amount of seconds spent performing the task.
+    failed: bool
+        If the task raised an exception.
+    result: Any = None
+        The result of the task, which is only provided if a task performed by a worker process requires it.
+    """
+
+    identity: int
+    name: str
+    executor: Executor
+    queue_wait: float
+    duration: float
+    failed: bool
+    result: Any = None
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True)
+class MapChunk(Generic[_A, _T]):
+    """
+    A task which applies a function to a chunk of items, so many small items only require a single message.
+
+    Attributes
+    ----------
+    func: Callable[[_A], _T]
+        The function to apply to each item.
+    items: Sequence[_A]
+        The items of the chunk.
+    """
+
+    func: Callable[[_A], _T]
+    items: Sequence[_A]
+
+    def __call__(self) -> list[_T]:
+        return [self.func(item) for item in self.items]
+
+    @property
+    def __name__(self) -> str:  # type: ignore
+        return getattr(self.func, "__name__", self.__class__.__name__)
+
+
 @attrs(slots=True, auto_attribs=True, frozen=True, eq=True, hash=True)
 class TaskCallback(Generic[_P, _T]):
     """
@@ -374,11 +893,23 @@ class TaskCallback(Generic[_P, _T]):
         A function that will receive the result of the task.
     exception_handler: Callable[[Exception], None] | None = None
         A handler that resolves exceptions inside the task provided.
+    key: str | None = None
+        A stable hash of the task, if it is pure and its result can be reused by identical tasks.
+    priority: Priority = Priority.VISIBLE
+        The urgency of the task.
+    supersede_key: str | None = None
+        A key shared by tasks which replace one another, where a new task cancels any unfinished task with its key.
+    executor: Executor = Executor.PROCESS
+        Where the task is performed.
     """
 
     start_task: Callable[_P, _T]
     return_task: Callable[[_T], None]
     exception_handler: Callable[[Exception], None] | None = None
+    key: str | None = None
+    priority: Priority = Priority.VISIBLE
+    supersede_key: str | None = None
+    executor: Executor = Executor.PROCESS
 
     def __str__(self) -> str:
         return (
@@ -396,7 +927,40 @@ class TaskCallback(Generic[_P, _T]):
         Task[_P, _T]
             The internal task.
         """
-        return Task(self.start_task, Task.generate_identity())
+        return Task(
+            self.start_task,
+            Task.generate_identity(),
+            key=self.key,
+            priority=self.priority,
+            supersede_key=self.supersede_key,
+            executor=self.executor,
+        )
+
+    @classmethod
+    def as_pure(
+        cls,
+        start_task: Callable[_P, _T],
+        return_task: Callable[[_T], None],
+        exception_handler: Callable[[Exception], None] | None = None,
+    ):
+        """
+        Generates a task callback whose result only depends on `start_task`, so it may be served from a cache.
+
+        Parameters
+        ----------
+        start_task : Callable[_P, _T]
+            The task to be paralyzed.
+        return_task : Callable[[_T], None]
+            A function that will receive the result of the task.
+        exception_handler : Callable[[Exception], None] | None, optional
+            A handler that resolves exceptions inside the task provided.
+
+        Returns
+        -------
+        Self
+            The task callback with a key generated from `start_task`.
+        """
+        return cls(start_task, return_task, exception_handler, task_key(start_task))
 
 
 @attrs(slots=True, auto_attribs=True, frozen=True, eq=True, hash=True)
@@ -412,11 +976,14 @@ class FinishedTask(Generic[_T]):
         The result of the task completed.  If None is returned, it is implied an exception occurred.
     exception: Exception | None = None
         An exception that was raised during the completion of a task, None if there does not exist.
+    duration: float = 0
+        The amount of seconds the worker spent performing the task.
     """
 
     identity: int
     result: _T | None
     exception: Exception | None = None
+    duration: float = 0
 
     def __str__(self) -> str:
         if self.result is not None:
@@ -425,7 +992,7 @@ class FinishedTask(Generic[_T]):
             return f"<0x{self.identity:02X}, failure:{self.exception}>"
 
     @classmethod
-    def as_exception(cls, identity: int, exception: Exception):
+    def as_exception(cls, identity: int, exception: Exception, duration: float = 0):
         """
         Generates a finished task for an exception.
 
@@ -435,13 +1002,78 @@ class FinishedTask(Generic[_T]):
             The identity of the task completely.
         exception: Exception | None = None
             An exception that was raised during the completion of a task.
+        duration: float = 0
+            The amount of seconds the worker spent performing the task.
 
         Returns
         -------
         Self
             The finished task that raised an exception.
         """
-        return cls(identity, None, exception)
+        return cls(identity, None, exception, duration)
+
+
+class TaskFuture(Future, Generic[_T]):
+    """
+    The eventual result of a scheduled task, which can also be awaited from an asyncio event loop.
+
+    Attributes
+    ----------
+    identity: int
+        The identity of the task.
+
+    Notes
+    -----
+        The future is resolved when the task manager proxy handles the finished task, either by polling or by listening
+    for finished tasks with `TaskManagerProxy.watch` or a `TaskNotifier`.
+    """
+
+    identity: int
+    _cancel_task: Callable[[int], None] | None
+
+    def __init__(self, identity: int, cancel_task: Callable[[int], None] | None = None) -> None:
+        super().__init__()
+        self.identity = identity
+        self._cancel_task = cancel_task
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} 0x{self.identity:02X} {self._state}>"  # type: ignore
+
+    def __await__(self) -> Generator[Any, None, _T]:
+        return wrap_future(self).__await__()
+
+    def cancel(self) -> bool:
+        """
+        Cancels the task, if it has not finished.
+
+        Returns
+        -------
+        bool
+            If the future was cancelled.
+        """
+        if self.done():
+            return False
+        if self._cancel_task is not None:
+            self._cancel_task(self.identity)
+        return super().cancel()
+
+    def resolve(self, finished_task: FinishedTask[_T]) -> None:
+        """
+        Provides the result of the task to the future.
+
+        Parameters
+        ----------
+        finished_task : FinishedTask[_T]
+            The finished task associated with this future.
+        """
+        if self.done():
+            return
+        if isinstance(finished_task.exception, TaskCancelled):
+            super().cancel()
+        elif finished_task.exception is not None:
+            self.set_exception(finished_task.exception)
+        else:
+            self.set_result(finished_task.result)  # type: ignore
 
 
 @attrs(slots=True, auto_attribs=True, frozen=True, eq=True, hash=True)
@@ -737,6 +1369,397 @@ class Replier(Generic[RequestValue, ReplyValue]):
         log.debug(f"{self} sent reply {reply}")
 
 
+def task_key(task: Callable, *arguments: Any) -> str:
+    """
+    Generates a stable hash of a task and its arguments.
+
+    Parameters
+    ----------
+    task : Callable
+        The task to be hashed, including any variables it encloses.
+    *arguments : Any
+        The arguments provided to the task.
+
+    Returns
+    -------
+    str
+        A hash which is equal for identical tasks with identical arguments.
+    """
+    return sha256(dumps((task, arguments))).hexdigest()
+
+
+class TaskResultCache:
+    """
+    A least recently used cache of the results of pure tasks, limited by the size of the results.
+
+    Attributes
+    ----------
+    maximum_size: int
+        The maximum amount of bytes of results to keep.
+    size: int
+        The amount of bytes of results currently kept.
+    results: OrderedDict[str, tuple[Any, int]]
+        The results and their size in bytes, keyed by their task key and ordered from least to most recently used.
+    """
+
+    maximum_size: int
+    size: int
+    results: OrderedDict[str, tuple[Any, int]]
+
+    def __init__(self, maximum_size: int = RESULT_CACHE_SIZE) -> None:
+        self.maximum_size = maximum_size
+        self.size = 0
+        self.results = OrderedDict()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.maximum_size})"
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.results
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def get(self, key: str) -> Any:
+        """
+        Acquires a result and marks it as the most recently used.
+
+        Parameters
+        ----------
+        key : str
+            The key of the task.
+
+        Returns
+        -------
+        Any
+            The result of the task.
+
+        Raises
+        ------
+        KeyError
+            The result is not cached.
+        """
+        self.results.move_to_end(key)
+        return self.results[key][0]
+
+    def add(self, key: str, result: Any) -> bool:
+        """
+        Caches a result, evicting the least recently used results until it fits.
+
+        Parameters
+        ----------
+        key : str
+            The key of the task.
+        result : Any
+            The result of the task.
+
+        Returns
+        -------
+        bool
+            If the result was cached, results larger than the entire cache are not kept.
+        """
+        size: int = len(dumps(result))
+        if size > self.maximum_size:
+            return False
+        if key in self.results:
+            self.size -= self.results.pop(key)[1]
+        while self.results and self.size + size > self.maximum_size:
+            _, (_, evicted_size) = self.results.popitem(last=False)
+            self.size -= evicted_size
+        self.results[key] = (result, size)
+        self.size += size
+        return True
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True)
+class TaskTypeMetrics:
+    """
+    The metrics of every task of a single type performed by a task manager.
+
+    Attributes
+    ----------
+    count: int
+        The amount of tasks finished.
+    failures: int
+        The amount of tasks which raised an exception.
+    cached: int
+        The amount of tasks which were finished from the result cache.
+    queue_wait_p50: float
+        The median amount of seconds between a task being received and a worker starting it.
+    queue_wait_p95: float
+        The 95th percentile of seconds between a task being received and a worker starting it.
+    run_time_p50: float
+        The median amount of seconds a worker spent performing a task.
+    run_time_p95: float
+        The 95th percentile of seconds a worker spent performing a task.
+    bytes_serialized: float
+        The mean amount of bytes serialized to send a task and its result.
+    """
+
+    count: int
+    failures: int
+    cached: int
+    queue_wait_p50: float
+    queue_wait_p95: float
+    run_time_p50: float
+    run_time_p95: float
+    bytes_serialized: float
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True)
+class WorkerMetrics:
+    """
+    The metrics of a single worker of a task manager.
+
+    Attributes
+    ----------
+    tasks_finished: int
+        The amount of tasks the worker has finished.
+    busy_ratio: float
+        The ratio of time the worker spent performing tasks since it started.
+    load: int
+        The amount of tasks assigned to the worker which are not finished.
+    """
+
+    tasks_finished: int
+    busy_ratio: float
+    load: int
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True)
+class TaskMetrics:
+    """
+    A snapshot of the metrics of a task manager, to determine if the pool, serialization, or the tasks themselves are
+    limiting performance.
+
+    Attributes
+    ----------
+    tasks: dict[str, TaskTypeMetrics]
+        The metrics of each type of task, keyed by the name of the task.
+    workers: dict[str, WorkerMetrics]
+        The metrics of each active worker, keyed by the name of the worker.
+    queue_depth: int
+        The amount of tasks received which have not been sent to a worker process.
+    active_tasks: int
+        The amount of tasks sent to a worker process which have not finished.
+    worker_restarts: int
+        The amount of workers which were replaced after becoming unresponsive.
+    """
+
+    tasks: dict[str, TaskTypeMetrics]
+    workers: dict[str, WorkerMetrics]
+    queue_depth: int
+    active_tasks: int
+    worker_restarts: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Converts the metrics into a dictionary of primitives.
+
+        Returns
+        -------
+        dict[str, Any]
+            The metrics as a dictionary.
+        """
+        return asdict(self)
+
+    def dump(self, path: str) -> None:
+        """
+        Saves the metrics as JSON.
+
+        Parameters
+        ----------
+        path : str
+            The path to save the metrics to.
+        """
+        with open(path, "w") as file:
+            dump(self.to_dict(), file, indent=4)
+
+
+def _percentile(samples: Sequence[float], value: float) -> float:
+    return float(percentile(samples, value)) if samples else 0.0
+
+
+class TaskMetricsRecorder:
+    """
+    Records the activity of a task manager to generate its metrics.
+
+    Attributes
+    ----------
+    received: dict[int, tuple[str, float, int]]
+        The name, time received, and bytes serialized of each task that has not finished, keyed by their identity.
+    counts: dict[str, list[int]]
+        The amount of finished, failed, and cached tasks of each type.
+    queue_waits: dict[str, deque[float]]
+        The most recent queue wait times of each type of task.
+    run_times: dict[str, deque[float]]
+        The most recent run times of each type of task.
+    bytes_serialized: dict[str, int]
+        The total amount of bytes serialized for each type of task.
+    worker_started: dict[str, float]
+        The time each worker started.
+    worker_busy: dict[str, float]
+        The amount of seconds each worker spent performing tasks.
+    worker_finished: dict[str, int]
+        The amount of tasks each worker has finished.
+    worker_restarts: int
+        The amount of workers which were replaced.
+    """
+
+    received: dict[int, tuple[str, float, int]]
+    counts: dict[str, list[int]]
+    queue_waits: dict[str, deque[float]]
+    run_times: dict[str, deque[float]]
+    bytes_serialized: dict[str, int]
+    worker_started: dict[str, float]
+    worker_busy: dict[str, float]
+    worker_finished: dict[str, int]
+    worker_restarts: int
+
+    def __init__(self) -> None:
+        self.received = {}
+        self.counts = {}
+        self.queue_waits = {}
+        self.run_times = {}
+        self.bytes_serialized = {}
+        self.worker_started = {}
+        self.worker_busy = {}
+        self.worker_finished = {}
+        self.worker_restarts = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def receive(self, task: Task, size: int = 0) -> None:
+        """
+        Records that a task was received.
+
+        Parameters
+        ----------
+        task : Task
+            The task received.
+        size : int, optional
+            The amount of bytes serialized to receive the task.
+        """
+        self.received[task.identity] = (getattr(task.task, "__name__", str(task.task)), time(), size)
+
+    def add_worker(self, name: str) -> None:
+        """
+        Records that a worker was started.
+
+        Parameters
+        ----------
+        name : str
+            The name of the worker.
+        """
+        self.worker_started[name] = time()
+        self.worker_busy[name] = 0
+        self.worker_finished[name] = 0
+
+    def finish(self, task: FinishedTask, worker: str | None = None, size: int = 0) -> None:
+        """
+        Records that a task was finished.
+
+        Parameters
+        ----------
+        task : FinishedTask
+            The task finished.
+        worker : str | None, optional
+            The name of the worker which performed the task, None if the task was finished from the cache.
+        size : int, optional
+            The amount of bytes serialized to receive the result of the task.
+        """
+        if task.identity not in self.received:
+            return
+        name, received, received_size = self.received.pop(task.identity)
+        self.record(
+            name,
+            max(0.0, time() - received - task.duration),
+            task.duration,
+            task.exception is not None,
+            worker,
+            received_size + size,
+        )
+
+    def record(
+        self, name: str, queue_wait: float, run_time: float, failed: bool, worker: str | None = None, size: int = 0
+    ) -> None:
+        """
+        Records a finished task of a type.
+
+        Parameters
+        ----------
+        name : str
+            The name of the type of the task.
+        queue_wait : float
+            The amount of seconds the task waited before it was performed.
+        run_time : float
+            The amount of seconds spent performing the task.
+        failed : bool
+            If the task raised an exception.
+        worker : str | None, optional
+            The name of the worker or executor which performed the task, None if the task was finished from the cache.
+        size : int, optional
+            The amount of bytes serialized to send the task and receive its result.
+        """
+        counts = self.counts.setdefault(name, [0, 0, 0])
+        counts[0] += 1
+        if failed:
+            counts[1] += 1
+        if worker is None:
+            counts[2] += 1
+        self.queue_waits.setdefault(name, deque(maxlen=METRICS_SAMPLE_SIZE)).append(queue_wait)
+        self.run_times.setdefault(name, deque(maxlen=METRICS_SAMPLE_SIZE)).append(run_time)
+        self.bytes_serialized[name] = self.bytes_serialized.get(name, 0) + size
+        if worker is not None and worker in self.worker_busy:
+            self.worker_busy[worker] += run_time
+            self.worker_finished[worker] += 1
+
+    def snapshot(self, workers: Sequence[TaskWorkerProxy], queue_depth: int) -> TaskMetrics:
+        """
+        Generates the metrics from the activity recorded.
+
+        Parameters
+        ----------
+        workers : Sequence[TaskWorkerProxy]
+            The workers which are currently active.
+        queue_depth : int
+            The amount of tasks which are waiting on other tasks.
+
+        Returns
+        -------
+        TaskMetrics
+            The metrics of the task manager.
+        """
+        now: float = time()
+        return TaskMetrics(
+            {
+                name: TaskTypeMetrics(
+                    count,
+                    failures,
+                    cached,
+                    _percentile(self.queue_waits[name], 50),
+                    _percentile(self.queue_waits[name], 95),
+                    _percentile(self.run_times[name], 50),
+                    _percentile(self.run_times[name], 95),
+                    self.bytes_serialized[name] / count,
+                )
+                for name, (count, failures, cached) in self.counts.items()
+            },
+            {
+                worker.name: WorkerMetrics(
+                    self.worker_finished.get(worker.name, 0),
+                    self.worker_busy.get(worker.name, 0) / max(now - self.worker_started.get(worker.name, now), 1e-9),
+                    worker.load,
+                )
+                for worker in workers
+            },
+            queue_depth + sum(len(worker.pending_tasks) for worker in workers),
+            sum(len(worker.active_tasks) for worker in workers),
+            self.worker_restarts,
+        )
+
+
 @attrs(slots=True, auto_attribs=True)
 class TaskManagerProxy:
     """
@@ -780,6 +1803,44 @@ class TaskManagerProxy:
         A requester object to receive simple commands to workers.
     name: str = "manager"
         The name of the task manager, used for debugging.
+    worker_count: int | None = None
+        The amount of worker processes the task manager will use, by default the amount of CPUs.
+    idle_policy: IdlePolicy = IdlePolicy()
+        The policy the task manager follows when it is idle.
+    result_cache_size: int = RESULT_CACHE_SIZE
+        The maximum amount of bytes of results of pure tasks the task manager will cache.
+    futures: dict[int, TaskFuture] = {}
+        The futures of the scheduled tasks which have not finished, keyed by their identity.
+    thread_pool: ThreadPoolExecutor | None = None
+        The threads which perform tasks for the thread executor, None if no such task was scheduled.
+    thread_tasks: dict[int, Future[FinishedTask]] = {}
+        The tasks sent to the thread pool which have not been handled, keyed by their identity.
+    performed_tasks: deque[tuple[FinishedTask, Executor]] = deque()
+        The tasks performed by this process which have not been handled, with where they were performed.
+    queued_tasks: dict[int, Task] = {}
+        The tasks performed by this process which are waiting on the tasks they require, keyed by their identity.
+    returned_values: dict[int, Any] = {}
+        The results of finished tasks which are required by queued tasks, keyed by their identity.
+    received: dict[int, tuple[str, float]] = {}
+        The name and time scheduled of each task performed by this process which has not been handled, keyed by its
+        identity.
+    remote_dependents: dict[int, set[int]] = {}
+        The unfinished tasks performed by worker processes which require each unfinished task, keyed by its identity.
+    cancelled_tasks: set[int] = set()
+        The identities of tasks which were cancelled while this process was performing them.
+    superseding_tasks: dict[str, int] = {}
+        The identity of the most recent unfinished task performed by this process for each supersede key.
+    listeners: dict[object, Callable[[], None]] = {}
+        The functions which are called from any thread when finished tasks are ready to be handled, keyed by their
+        owner.
+    listener: TaskListener | None = None
+        The thread which blocks on the pipe on behalf of the listeners, None if there are no listeners.
+
+    Notes
+    -----
+        Tasks which are performed by a thread or inline are resolved entirely inside this process, using the same
+    dependencies, cancellation, and metrics as tasks sent to the task manager.  Their results are handled the next time
+    finished tasks are polled, so callbacks are always called from the thread which polls.
     """
 
     _task_finished: ClassVar[Signal] = Signal(name="task_finished")
@@ -788,6 +1849,21 @@ class TaskManagerProxy:
     incoming_pipe: Connection
     requester: Requester[Requests, Status]
     name: str = "manager"
+    worker_count: int | None = None
+    idle_policy: IdlePolicy = IdlePolicy()
+    result_cache_size: int = RESULT_CACHE_SIZE
+    futures: dict[int, TaskFuture] = Factory(dict)
+    thread_pool: ThreadPoolExecutor | None = None
+    thread_tasks: dict[int, Future[FinishedTask]] = Factory(dict)
+    performed_tasks: deque[tuple[FinishedTask, Executor]] = Factory(deque)
+    queued_tasks: dict[int, Task] = Factory(dict)
+    returned_values: dict[int, Any] = Factory(dict)
+    received: dict[int, tuple[str, float]] = Factory(dict)
+    remote_dependents: dict[int, set[int]] = Factory(dict)
+    cancelled_tasks: set[int] = Factory(set)
+    superseding_tasks: dict[str, int] = Factory(dict)
+    listeners: dict[object, Callable[[], None]] = Factory(dict)
+    listener: TaskListener | None = None
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__}({self.name})"
@@ -817,7 +1893,18 @@ class TaskManagerProxy:
         replier : Replier
             A network of pipes to receive simple requests from the parent process.
         """
-        run(TaskManager(self.name, outgoing_pipe, incoming_pipe, replier).update())
+        reset_signal_handlers()
+        run(
+            TaskManager(
+                self.name,
+                outgoing_pipe,
+                incoming_pipe,
+                replier,
+                self.worker_count,
+                self.idle_policy,
+                self.result_cache_size,
+            ).update()
+        )
 
     def make_request(self, request: Requests, timeout: float | None = None) -> Status:
         """
@@ -837,6 +1924,54 @@ class TaskManagerProxy:
         """
         return exit_after(synchronize(self.requester.get_answer), timeout)(request)  # type: ignore
 
+    def get_metrics(self, timeout: float | None = None) -> TaskMetrics | None:
+        """
+        Acquires the metrics of the task manager.
+
+        Parameters
+        ----------
+        timeout : float | None, optional
+            The amount of time the program will wait for the task manager to respond, by default None or infinite.
+
+        Returns
+        -------
+        TaskMetrics | None
+            The metrics of the task manager, None if it did not respond in time.
+
+        Notes
+        -----
+            Tasks performed by this process are recorded by the task manager once they are handled, so their metrics
+        are included as well.
+        """
+        metrics: TaskMetrics | None = exit_after(synchronize(self.requester.get_answer), timeout)(
+            Requests.GET_METRICS
+        )  # type: ignore
+        if metrics is None:
+            return None
+        return evolve(metrics, queue_depth=metrics.queue_depth + len(self.queued_tasks))
+
+    def dump_metrics(self, path: str, timeout: float | None = None) -> bool:
+        """
+        Saves the metrics of the task manager as JSON.
+
+        Parameters
+        ----------
+        path : str
+            The path to save the metrics to.
+        timeout : float | None, optional
+            The amount of time the program will wait for the task manager to respond, by default None or infinite.
+
+        Returns
+        -------
+        bool
+            If the metrics were received and saved.
+        """
+        metrics: TaskMetrics | None = self.get_metrics(timeout)
+        if metrics is None:
+            return False
+        metrics.dump(path)
+        return True
+
     def join(self, timeout: float | None = None) -> bool:
         """
         Stops the task manager from receiving additional tasks and waits for all pending tasks to complete.
@@ -879,6 +2014,7 @@ class TaskManagerProxy:
         """
         log.info(f"{self} making request: {Requests.STOP}")
         self.make_request(Requests.STOP, FORCE_TERMINATION_TIMEOUT)
+        self._stop_threads()
         if self.process is not None:
             self.process.terminate()
             self.process = None
@@ -889,6 +2025,7 @@ class TaskManagerProxy:
         Abruptly kills and stops operation of the manager process quickly, likely leaving pending tasks in an
         indeterminate state.
         """
+        self._stop_threads()
         if self.process is not None:
             log.info(f"{self} making request: {Requests.STOP}")
             exit_after(synchronize(self.requester.get_answer), FORCE_KILL_TIMEOUT)(Requests.STOP)
@@ -896,6 +2033,14 @@ class TaskManagerProxy:
             self.process = None
         log.info(f"{self} is killed")
 
+    def _stop_threads(self) -> None:
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+        if self.thread_pool is not None:
+            self.thread_pool.shutdown(wait=False, cancel_futures=True)
+            self.thread_pool = None
+
     def check_if_child_task_finished(self, task: TaskCallback, internal_task: Task) -> Callable[[FinishedTask], None]:
         """
         Checks if a task is finished from a receiver and performs the appropriate action depending if the task
@@ -925,7 +2070,9 @@ class TaskManagerProxy:
                 The finished task.
             """
             if internal_task.identity == result.identity:
-                if result.exception and task.exception_handler is not None:
+                if isinstance(result.exception, TaskCancelled):
+                    log.debug(f"{self} cancelled {task}")
+                elif result.exception and task.exception_handler is not None:
                     task.exception_handler(result.exception)
                 elif result.exception:
                     log.warning(f"{self} received unhandled exception {result.exception} from {task}")
@@ -934,7 +2081,7 @@ class TaskManagerProxy:
 
         return check_if_child_task_finished
 
-    def _schedule_task(self, task: TaskCallback, internal_task: Task) -> None:
+    def _schedule_task(self, task: TaskCallback, internal_task: Task) -> TaskFuture:
         if DEBUG >= log.level:
             status = self.make_request(Requests.GET_STATUS, 1)
             if status != Status.RUNNING:
@@ -942,14 +2089,68 @@ class TaskManagerProxy:
                 assert status == Status.RUNNING  # A task was scheduled in an invalid state.
 
             # Make sure the user provided a task that can be pickled, otherwise we won't be able to send it.
-            if not pickles(internal_task):
+            if internal_task.executor == Executor.PROCESS and not pickles(internal_task):
                 log.critical(f"{internal_task} is not a pickle with bad types: {badtypes(internal_task)}")
                 raise NotAPickleException(f"{internal_task} is not a pickle!")
 
         # We cannot garbage collect tasks easily, so we only keep the last 100 tasks sent.
         self.task_finished.connect(self.check_if_child_task_finished(task, internal_task), weak=False, max_uses=100)
-        self.outgoing_pipe.send(internal_task)
+        future: TaskFuture = TaskFuture(internal_task.identity, self.cancel)
+        self.futures[internal_task.identity] = future
+        self._send_task(internal_task)
         log.debug(f"{self} started task {task}")
+        return future
+
+    def _send_task(self, internal_task: Task) -> None:
+        if internal_task.executor == Executor.PROCESS:
+            # The required tasks may not be scheduled yet, so every requirement is kept until it finishes.
+            for identity in internal_task.required_tasks:
+                self.remote_dependents.setdefault(identity, set()).add(internal_task.identity)
+            self.outgoing_pipe.send(internal_task)
+            return
+
+        self.received[internal_task.identity] = (
+            getattr(internal_task.task, "__name__", str(internal_task.task)),
+            time(),
+        )
+        if internal_task.supersede_key is not None:
+            superseded: int | None = self.superseding_tasks.get(internal_task.supersede_key)
+            self.superseding_tasks[internal_task.supersede_key] = internal_task.identity
+            if superseded is not None:
+                self.cancel(superseded)
+        if internal_task.required_tasks:
+            self.queued_tasks[internal_task.identity] = internal_task
+        else:
+            self._perform_task(WorkerTask.from_task(internal_task))
+
+    def _perform_task(self, task: WorkerTask) -> None:
+        if task.task.executor == Executor.INLINE:
+            self._performed(perform_task(task), Executor.INLINE)
+            return
+
+        if self.thread_pool is None:
+            self.thread_pool = ThreadPoolExecutor(thread_name_prefix=f"{self.name}_thread")
+        future: Future[FinishedTask] = self.thread_pool.submit(
+            perform_task, task, lambda: task.identity in self.cancelled_tasks
+        )
+        self.thread_tasks[task.identity] = future
+        future.add_done_callback(lambda f: None if f.cancelled() else self._performed(f.result(), Executor.THREAD))
+
+    def _performed(self, finished_task: FinishedTask, executor: Executor) -> None:
+        # This may be called from any thread, so the task is only handled once finished tasks are polled.
+        self.performed_tasks.append((finished_task, executor))
+        self.notify_listeners()
+
+    def notify_listeners(self) -> None:
+        """
+        Notifies every listener that finished tasks are ready to be handled.
+
+        Notes
+        -----
+            This may be called from any thread.
+        """
+        for notify in list(self.listeners.values()):
+            notify()
 
     def _limit(self, limit: bool) -> bool:
         # We will keep setting limit until it provides the correct value or we timeout.
@@ -957,41 +2158,307 @@ class TaskManagerProxy:
             Requests.LIMIT
         )
 
-    def schedule_task(self, task: TaskCallback) -> None:
+    def schedule_task(self, task: TaskCallback) -> TaskFuture:
+        """
+        Schedules a single task.
+
+        Parameters
+        ----------
+        task : TaskCallback
+            The task to be scheduled.
+
+        Returns
+        -------
+        TaskFuture
+            The future of the result of the task, whose identity can be used to cancel it.
+        """
+        return self._schedule_task(task, task.internal_task)
+
+    def cancel(self, identity: int) -> None:
+        """
+        Cancels a task which has not finished.
+
+        Parameters
+        ----------
+        identity : int
+            The identity of the task to cancel.
+
+        Notes
+        -----
+            Tasks which have not started are dropped, along with every task which requires them.  Tasks which have
+        started are notified through `task_cancelled` and may stop early.  In either case, the callback of the task is
+        not called.
+        """
+        if identity in self.queued_tasks:
+            del self.queued_tasks[identity]
+            del self.received[identity]
+            self._performed(
+                FinishedTask.as_exception(identity, TaskCancelled(f"0x{identity:02X} was cancelled")), Executor.INLINE
+            )
+        elif identity in self.thread_tasks and self.thread_tasks[identity].cancel():
+            del self.thread_tasks[identity]
+            del self.received[identity]
+            self._performed(
+                FinishedTask.as_exception(identity, TaskCancelled(f"0x{identity:02X} was cancelled")), Executor.THREAD
+            )
+        elif identity in self.received:
+            self.cancelled_tasks.add(identity)
+        else:
+            self.outgoing_pipe.send(CancelTask(identity))
+            log.debug(f"{self} cancelled task 0x{identity:02X}")
+            return
+        log.debug(f"{self} cancelled task 0x{identity:02X}")
+
+        dependents: list[int] = [
+            i for i, queued_task in self.queued_tasks.items() if identity in queued_task.required_tasks
+        ]
+        for dependent in chain(dependents, self.remote_dependents.pop(identity, ())):
+            self.cancel(dependent)
+
+    def schedule_tasks(self, tasks: Mapping[str, tuple[TaskCallback, set[str]]]) -> dict[str, TaskFuture]:
+        """
+        Schedules a series of tasks.
+
+        Parameters
+        ----------
+        tasks : Mapping[str, tuple[TaskCallback, set[str]]]
+            A mapping of a task name, task, and a set of required tasks.
+
+        Returns
+        -------
+        dict[str, TaskFuture]
+            The futures of the results of each task, keyed by the task name.
+
+        Notes
+        -----
+            Only the tasks and their associated identities inside `tasks` are ensured to exist.
+        """
+        name_to_identity: dict[str, int] = {task_name: Task.generate_identity() for task_name in tasks.keys()}
+
+        # Temporarily stop tasks from finishing, to ensure that tasks don't get garbage collected too quickly.
+        self._limit(True)
+
+        futures: dict[str, TaskFuture] = {}
+        for task_name, (task, required_tasks) in tasks.items():
+            futures[task_name] = self._schedule_task(
+                task,
+                Task(
+                    task.start_task,
+                    name_to_identity[task_name],
+                    [name_to_identity[n] for n in required_tasks],
+                    task.key,
+                    task.priority,
+                    task.supersede_key,
+                    task.executor,
+                ),
+            )
+
+        self._limit(False)
+        return futures
+
+    def wait(self, future: TaskFuture, timeout: float | None = None) -> bool:
+        """
+        Blocks until a task finishes, handling every task which finishes in the meantime.
+
+        Parameters
+        ----------
+        future : TaskFuture
+            The future of the task to wait for.
+        timeout : float | None, optional
+            The maximum amount of time to wait, by default None or infinite.
+
+        Returns
+        -------
+        bool
+            If the task finished in the alloted amount of time.
+        """
+        deadline: float | None = None if timeout is None else time() + timeout
+        while not future.done():
+            remaining: float | None = None if deadline is None else max(0.0, deadline - time())
+            if not self._poll(remaining):
+                break
+            self.poll_tasks()
+        return future.done()
+
+    def _poll(self, timeout: float | None = None) -> bool:
+        deadline: float | None = None if timeout is None else time() + timeout
+        while not self.performed_tasks:
+            remaining: float | None = None if deadline is None else max(0.0, deadline - time())
+            if not self.thread_tasks:
+                return self.incoming_pipe.poll(remaining)
+            # Threads do not write to the pipe, so it is only polled briefly while they are performing tasks.
+            if self.incoming_pipe.poll(
+                SLOW_CONNECTION_POLLING_RATE if remaining is None else min(remaining, SLOW_CONNECTION_POLLING_RATE)
+            ):
+                return True
+            if remaining == 0:
+                return False
+        return True
+
+    def listen(self, owner: object, notify: Callable[[], None]) -> None:
+        """
+        Calls a function whenever finished tasks are ready to be handled, so an event loop can handle them without
+        polling.
+
+        Parameters
+        ----------
+        owner : object
+            The owner of the function, which is used to stop listening.
+        notify : Callable[[], None]
+            A function which schedules `poll_tasks` on the thread of an event loop.  It is called from another thread.
+
+        Notes
+        -----
+            The pipe is watched by a thread which blocks on it instead of by the event loop, because not every event
+        loop is able to watch a pipe, such as on Windows where it is a named pipe.  The thread does not notify the
+        listeners again until the finished tasks are polled.
+        """
+        self.listeners[owner] = notify
+        if self.listener is None:
+            self.listener = TaskListener(self)
+            self.listener.start()
+
+    def unlisten(self, owner: object) -> None:
         """
-        Schedules a single task.
+        Stops calling the function of an owner when finished tasks are ready to be handled.
 
         Parameters
         ----------
-        task : TaskCallback
-            The task to be scheduled.
+        owner : object
+            The owner of the function.
         """
-        self._schedule_task(task, task.internal_task)
+        self.listeners.pop(owner, None)
+        if not self.listeners and self.listener is not None:
+            self.listener.stop()
+            self.listener = None
 
-    def schedule_tasks(self, tasks: Mapping[str, tuple[TaskCallback, set[str]]]) -> None:
+    def watch(self, loop: AbstractEventLoop | None = None) -> None:
         """
-        Schedules a series of tasks.
+        Handles finished tasks from an asyncio event loop as soon as they are received, so futures can be awaited
+        without polling.
 
         Parameters
         ----------
-        tasks : Mapping[str, tuple[TaskCallback, set[str]]]
-            A mapping of a task name, task, and a set of required tasks.
+        loop : AbstractEventLoop | None, optional
+            The event loop to handle finished tasks from, by default the current event loop.
+        """
+        loop = loop or get_event_loop()
+        self.listen(loop, partial(loop.call_soon_threadsafe, self.poll_tasks))
 
-        Notes
-        -----
-            Only the tasks and their associated identities inside `tasks` are ensured to exist.
+    def unwatch(self, loop: AbstractEventLoop | None = None) -> None:
         """
-        name_to_identity: dict[str, int] = {task_name: Task.generate_identity() for task_name in tasks.keys()}
+        Stops handling finished tasks from an asyncio event loop.
 
-        # Temporarily stop tasks from finishing, to ensure that tasks don't get garbage collected too quickly.
-        self._limit(True)
+        Parameters
+        ----------
+        loop : AbstractEventLoop | None, optional
+            The event loop which was handling finished tasks, by default the current event loop.
+        """
+        self.unlisten(loop or get_event_loop())
 
-        for task_name, (task, required_tasks) in tasks.items():
-            self._schedule_task(
-                task, Task(task.start_task, name_to_identity[task_name], [name_to_identity[n] for n in required_tasks])
-            )
+    def map(
+        self,
+        func: Callable[[_A], _T],
+        iterable: Iterable[_A],
+        chunksize: int = MAP_CHUNK_SIZE,
+        ordered: bool = True,
+        max_in_flight: int | None = None,
+        executor: Executor = Executor.PROCESS,
+    ) -> Iterator[_T]:
+        """
+        Applies a function to every item of an iterable inside the worker processes.
 
-        self._limit(False)
+        Parameters
+        ----------
+        func : Callable[[_A], _T]
+            The function to apply, which must be able to be pickled.
+        iterable : Iterable[_A]
+            The items to apply the function to, which are only consumed as chunks are sent.
+        chunksize : int, optional
+            The amount of items sent to a worker process inside a single task, by default `MAP_CHUNK_SIZE`.
+        ordered : bool, optional
+            If the results are provided in the same order as `iterable`, otherwise results are provided as soon as
+            their chunk finishes, by default True.
+        max_in_flight : int | None, optional
+            The maximum amount of chunks which are sent and unfinished at once, by default `MAP_CHUNKS_PER_WORKER` per
+            worker process.
+        executor : Executor, optional
+            Where the chunks are performed, by default inside worker processes.
+
+        Returns
+        -------
+        Iterator[_T]
+            The results of the function for each item.
+
+        Raises
+        ------
+        ValueError
+            If `chunksize` or `max_in_flight` is less than one.
+
+        Notes
+        -----
+            Finished tasks unrelated to the map are still handled while waiting on chunks.  If a chunk raises an
+        exception, it is raised by the iterator and the remaining chunks are not sent.
+        """
+        if chunksize < 1:
+            raise ValueError(f"{self} cannot map with a chunk size of {chunksize}")
+        if max_in_flight is None:
+            max_in_flight = MAP_CHUNKS_PER_WORKER * (self.worker_count or cpu_count())
+        if max_in_flight < 1:
+            raise ValueError(f"{self} cannot map with {max_in_flight} chunks in flight")
+        return self._map(func, iter(iterable), chunksize, ordered, max_in_flight, executor)
+
+    def _map(
+        self,
+        func: Callable[[_A], _T],
+        items: Iterator[_A],
+        chunksize: int,
+        ordered: bool,
+        max_in_flight: int,
+        executor: Executor,
+    ) -> Iterator[_T]:
+        finished: dict[int, FinishedTask] = {}
+        identities: dict[int, int] = {}
+        in_flight: int = 0
+        sent_chunks: int = 0
+        next_chunk: int = 0
+
+        def finish_chunk(result: FinishedTask) -> None:
+            if result.identity in identities:
+                finished[identities.pop(result.identity)] = result
+
+        self.task_finished.connect(finish_chunk, weak=False)
+        try:
+            while True:
+                # Chunks are only taken from the iterable once there is room, so it is never read ahead of the workers.
+                while in_flight < max_in_flight:
+                    chunk: list[_A] = list(islice(items, chunksize))
+                    if not chunk:
+                        break
+                    internal_task: Task = Task(MapChunk(func, chunk), Task.generate_identity(), executor=executor)
+                    identities[internal_task.identity] = sent_chunks
+                    self._send_task(internal_task)
+                    in_flight += 1
+                    sent_chunks += 1
+
+                if not in_flight:
+                    return
+
+                ready: list[int] = ([next_chunk] if next_chunk in finished else []) if ordered else list(finished)
+                if not ready:
+                    self._poll(RESPONSIVE_TIMEOUT)
+                    self.poll_tasks()
+                    continue
+
+                for index in ready:
+                    result: FinishedTask = finished.pop(index)
+                    in_flight -= 1
+                    if result.exception is not None:
+                        raise result.exception
+                    yield from result.result  # type: ignore
+                next_chunk += 1
+        finally:
+            self.task_finished.disconnect(finish_chunk)
 
     def poll_tasks(self) -> int:
         """
@@ -1005,13 +2472,131 @@ class TaskManagerProxy:
         if WARNING >= log.level and not self.is_alive():
             log.warning(f"{self} polled a process which is not alive")
         tasks_completed = 0
-        while self.incoming_pipe.poll():
-            finished_task: FinishedTask = self.incoming_pipe.recv()
-            log.debug(f"{self} finished task {finished_task}")
-            self.task_finished.emit(finished_task)
-            tasks_completed += 1
+        try:
+            while self.performed_tasks or self.incoming_pipe.poll():
+                finished_task: FinishedTask
+                if self.performed_tasks:
+                    finished_task = self._finish_performed_task(*self.performed_tasks.popleft())
+                else:
+                    finished_task = self.incoming_pipe.recv()
+                    self.remote_dependents.pop(finished_task.identity, None)
+                log.debug(f"{self} finished task {finished_task}")
+                self.task_finished.emit(finished_task)
+                future: TaskFuture | None = self.futures.pop(finished_task.identity, None)
+                if future is not None:
+                    future.resolve(finished_task)
+                self._poll_queued_tasks(finished_task)
+                tasks_completed += 1
+        finally:
+            if self.listener is not None:
+                self.listener.handled.set()
         return tasks_completed
 
+    def _finish_performed_task(self, finished_task: FinishedTask, executor: Executor) -> FinishedTask:
+        identity: int = finished_task.identity
+        self.thread_tasks.pop(identity, None)
+        for supersede_key, superseding in list(self.superseding_tasks.items()):
+            if superseding == identity:
+                del self.superseding_tasks[supersede_key]
+        if identity in self.cancelled_tasks:
+            self.cancelled_tasks.remove(identity)
+            finished_task = FinishedTask.as_exception(
+                identity, TaskCancelled(f"0x{identity:02X} was cancelled"), finished_task.duration
+            )
+
+        # Tasks which were cancelled before they were performed are not recorded.
+        if identity in self.received:
+            name, received = self.received.pop(identity)
+            # The task manager records the task and starts any task of a worker process which requires its result.
+            self.outgoing_pipe.send(
+                PerformedTask(
+                    identity,
+                    name,
+                    executor,
+                    max(0.0, time() - received - finished_task.duration),
+                    finished_task.duration,
+                    finished_task.exception is not None,
+                    finished_task.result if self.remote_dependents.pop(identity, None) else None,
+                )
+            )
+        return finished_task
+
+    def _poll_queued_tasks(self, finished_task: FinishedTask) -> None:
+        dependents: list[int] = [
+            identity
+            for identity, queued_task in self.queued_tasks.items()
+            if finished_task.identity in queued_task.required_tasks
+        ]
+        if not dependents:
+            return
+        if isinstance(finished_task.exception, TaskCancelled):
+            for dependent in dependents:
+                self.cancel(dependent)
+            return
+
+        self.returned_values[finished_task.identity] = finished_task.result
+        for identity, queued_task in sorted(self.queued_tasks.items(), key=lambda item: item[1].priority.value):
+            if self.returned_values.keys() >= set(queued_task.required_tasks):
+                del self.queued_tasks[identity]
+                self._perform_task(
+                    WorkerTask.from_task(queued_task, *[self.returned_values[r] for r in queued_task.required_tasks])
+                )
+
+        required: set[int] = set(chain.from_iterable(q.required_tasks for q in self.queued_tasks.values()))
+        for stale_identity in set(self.returned_values).difference(required):
+            del self.returned_values[stale_identity]
+
+
+class TaskListener(Thread):
+    """
+    A thread which blocks on the pipe of a task manager proxy and notifies its listeners once finished tasks are ready
+    to be handled.
+
+    Attributes
+    ----------
+    manager: TaskManagerProxy
+        The task manager proxy whose pipe is watched.
+    handled: Event
+        Set once the finished tasks the listeners were notified of are handled.
+    stopped: Event
+        Set once the thread should stop.
+    """
+
+    manager: TaskManagerProxy
+    handled: Event
+    stopped: Event
+
+    def __init__(self, manager: TaskManagerProxy) -> None:
+        super().__init__(name=f"{manager.name}_listener", daemon=True)
+        self.manager = manager
+        self.handled = Event()
+        self.handled.set()
+        self.stopped = Event()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.manager})"
+
+    def run(self) -> None:
+        while not self.stopped.is_set():
+            try:
+                if not self.manager.incoming_pipe.poll(LISTENER_TIMEOUT):
+                    continue
+            except (EOFError, OSError):
+                log.warning(f"{self} stopped listening to a pipe which closed")
+                return
+            self.handled.clear()
+            self.manager.notify_listeners()
+            # The pipe stays readable until the finished tasks are received, so it is not polled again until then.
+            while not self.handled.wait(LISTENER_TIMEOUT) and not self.stopped.is_set():
+                pass
+
+    def stop(self) -> None:
+        """
+        Stops the thread from listening, without waiting for it to finish.
+        """
+        self.stopped.set()
+        self.handled.set()
+
 
 class TaskManager:
     """
@@ -1029,10 +2614,30 @@ class TaskManager:
         A network of pipes to easily reply to simple status requests from the parent process.
     recent_returned_values: dict[int, Any]
         A mapping of finished tasks identities and their associated values.
+    result_cache: TaskResultCache
+        The results of pure tasks which have finished.
+    running_keys: dict[int, str]
+        A mapping of the identities of pure tasks being performed and the key to cache their result under.
+    cached_tasks: deque[FinishedTask]
+        Tasks which were finished from the result cache and have not been handled.
+    metrics: TaskMetricsRecorder
+        The recorder of the activity of the task manager.
+    cancelled_tasks: set[int]
+        The identities of tasks which were cancelled while a worker was performing them.
+    superseding_tasks: dict[str, int]
+        The identity of the most recent unfinished task for each supersede key.
     queued_tasks: dict[int, Task]
         A mapping of tasks identities and their associated task that have not started.
     workers: list[TaskWorkerProxy]
         A series of workers that can perform tasks.
+    worker_count: int
+        The maximum amount of workers the task manager maintains.
+    spawned_workers: int
+        The amount of workers the task manager has started.
+    idle_policy: IdlePolicy
+        The policy the task manager follows when it is idle.
+    last_scale_down: float
+        The last time stamp that a worker was stopped from inactivity.
     status: Status
         The current status of the manager processes.
     last_event: float
@@ -1044,13 +2649,32 @@ class TaskManager:
     incoming_pipe: Connection
     replier: Replier
     recent_returned_values: dict[int, Any]
+    result_cache: TaskResultCache
+    running_keys: dict[int, str]
+    cached_tasks: deque[FinishedTask]
+    metrics: TaskMetricsRecorder
+    cancelled_tasks: set[int]
+    superseding_tasks: dict[str, int]
     queued_tasks: dict[int, Task]
     is_limited: bool
     workers: list[TaskWorkerProxy]
+    worker_count: int
+    spawned_workers: int
+    idle_policy: IdlePolicy
+    last_scale_down: float
     status: Status
     last_event: float
 
-    def __init__(self, name: str, outgoing_pipe: Connection, incoming_pipe: Connection, replier: Replier) -> None:
+    def __init__(
+        self,
+        name: str,
+        outgoing_pipe: Connection,
+        incoming_pipe: Connection,
+        replier: Replier,
+        worker_count: int | None = None,
+        idle_policy: IdlePolicy | None = None,
+        result_cache_size: int = RESULT_CACHE_SIZE,
+    ) -> None:
         self.name = name
         self.status = Status.STARTUP
         log.info(f"Starting {self}")
@@ -1060,10 +2684,24 @@ class TaskManager:
         self.replier.received_request.connect(self.handle_request)
         self.queued_tasks = {}
         self.recent_returned_values = {}
+        self.result_cache = TaskResultCache(result_cache_size)
+        self.running_keys = {}
+        self.cached_tasks = deque()
+        self.metrics = TaskMetricsRecorder()
+        self.cancelled_tasks = set()
+        self.superseding_tasks = {}
         self.is_limited = False
         self.last_event = time()
+        self.last_scale_down = self.last_event
         self.workers = []
-        for _ in range(cpu_count()):
+        self.spawned_workers = 0
+        self.worker_count = worker_count if worker_count is not None else cpu_count()
+        if self.worker_count < 1:
+            raise ValueError(f"{self} requires at least one worker, not {self.worker_count}")
+        self.idle_policy = idle_policy if idle_policy is not None else IdlePolicy()
+        # Import the preloaded modules once, so workers which are forked inherit them.
+        self.idle_policy.prepare()
+        for _ in range(self.worker_count):
             synchronize(self.add_worker)()
         run(self.update())
         current_process().terminate()  # Terminate the active process.
@@ -1076,25 +2714,62 @@ class TaskManager:
 
     async def check_time(self) -> None:
         """
-        Checks if the task manager is not actively being used.  If the task manager is not being used, it will end
-        itself.
+        Checks if the task manager is not actively being used.  If the task manager is not being used, it will scale
+        down its workers as described by its idle policy and end itself if the policy requires it or the parent process
+        no longer exists.
         """
-        if time() - self.last_event >= AUTOMATED_REMOVAL_DURATION:
-            # We will stop running the task manager if nothing has occurred in five seconds.
+        inactivity: float = time() - self.last_event
+        parent = parent_process()
+        if parent is not None and not parent.is_alive():
+            log.info(f"{self} has begun stopping from its parent exiting")
+        elif self.idle_policy.stop_delay is not None and inactivity >= self.idle_policy.stop_delay:
             log.info(f"{self} has begun stopping from inactivity")
+        else:
+            if inactivity >= self.idle_policy.scale_down_delay:
+                await self.scale_down()
+            return
 
-            self.status = Status.STOPPED
+        self.status = Status.STOPPED
 
-            for worker in self.workers:
-                log.info(f"stopping worker from inactivity {worker}")
-                await worker.join(1)
-                await worker.kill()  # Force kill a worker if it did not respond.
+        for worker in self.workers:
+            log.info(f"stopping worker from inactivity {worker}")
+            await worker.join(1)
+            await worker.kill()  # Force kill a worker if it did not respond.
+
+        self.workers.clear()
+
+        log.info(f"{self} has stopped from inactivity")
+
+        current_process().terminate()
 
-            self.workers.clear()
+    async def scale_down(self) -> None:
+        """
+        Stops a single idle worker if there are more workers than the idle policy keeps warm and enough time has
+        passed since the last worker was stopped.
+        """
+        if len(self.workers) <= self.idle_policy.warm_workers:
+            return
+        if time() - self.last_scale_down < self.idle_policy.scale_down_interval:
+            return
+        for worker in self.workers:
+            if worker.load == 0:
+                break
+        else:
+            return
 
-            log.info(f"{self} has stopped from inactivity")
+        self.workers.remove(worker)
+        self.last_scale_down = time()
+        log.info(f"stopping worker from inactivity {worker}")
+        with suppress(TimeoutError):
+            await worker.make_request(Requests.STOP, FORCE_KILL_TIMEOUT)
+        await worker.kill()
 
-            current_process().terminate()
+    async def scale_up(self) -> None:
+        """
+        Starts an additional worker if every worker is busy and the task manager has not reached its worker count.
+        """
+        if len(self.workers) < self.worker_count and not any(worker.is_idle for worker in self.workers):
+            await self.add_worker()
 
     async def add_worker(self) -> None:
         """
@@ -1104,14 +2779,42 @@ class TaskManager:
         child_outgoing_pipe, parent_incoming_pipe = dill_connection(*Pipe())
         request_pipe = RequestPipe.generate()
         worker: TaskWorkerProxy = TaskWorkerProxy(
-            None, parent_outgoing_pipe, parent_incoming_pipe, request_pipe.requester, f"worker_{len(self.workers)}"
+            None,
+            parent_outgoing_pipe,
+            parent_incoming_pipe,
+            request_pipe.requester,
+            f"worker_{self.spawned_workers}",
+            cancelled_task=Value("q", 0, lock=False),
         )
         process: Process = Process(
-            target=worker.start, args=(child_outgoing_pipe, child_incoming_pipe, request_pipe.replier)
+            target=worker.start,
+            args=(child_outgoing_pipe, child_incoming_pipe, request_pipe.replier, self.idle_policy),
         )
         worker.process = process
         process.start()
         self.workers.append(worker)
+        self.metrics.add_worker(worker.name)
+        self.spawned_workers += 1
+
+    async def replace_worker(self, worker: TaskWorkerProxy) -> None:
+        """
+        Replaces a worker which is no longer responsive with a new worker and reassigns its unfinished tasks.
+
+        Parameters
+        ----------
+        worker : TaskWorkerProxy
+            The worker to be replaced.
+        """
+        log.warning(f"{self} is replacing {worker}")
+        self.metrics.worker_restarts += 1
+        with suppress(ValueError):
+            self.workers.remove(worker)
+        await worker.kill()
+        await self.add_worker()
+        for worker_task in chain(worker.active_tasks.values(), worker.pending_tasks):
+            await least_loaded_worker(self.workers).assign(worker_task)
+        worker.active_tasks.clear()
+        worker.pending_tasks.clear()
 
     async def send_task_to_worker(self, task: Task, *args: Any) -> None:
         """
@@ -1121,11 +2824,102 @@ class TaskManager:
         ----------
         task : Task
             The task to be sent and completed.
+
+        Notes
+        -----
+            If the task is pure and an identical task has finished, the cached result is used instead.
         """
-        assigned_worker = choice(self.workers)
+        if task.key is not None:
+            key: str = task_key(task.key, *args) if args else task.key
+            if key in self.result_cache:
+                log.debug(f"{self} found cached result for {task}")
+                # The result is handled later, as this may be called while iterating over the queued tasks.
+                self.cached_tasks.append(FinishedTask(task.identity, self.result_cache.get(key)))
+                return
+            self.running_keys[task.identity] = key
+
         worker_task = WorkerTask.from_task(task, *args)
-        assigned_worker.outgoing_pipe.send(worker_task)
-        log.debug(f"{self} sent {worker_task} to {assigned_worker}")
+        await self.scale_up()
+        assigned_worker = least_loaded_worker(self.workers)
+        await assigned_worker.assign(worker_task)
+        log.debug(f"{self} assigned {worker_task} to {assigned_worker}")
+
+    async def cancel_task(self, identity: int) -> None:
+        """
+        Cancels a task and every queued task which requires it.
+
+        Parameters
+        ----------
+        identity : int
+            The identity of the task to cancel.
+
+        Notes
+        -----
+            A task which a worker process is performing cannot be stopped, so the worker process is notified and its
+        result is replaced once it finishes.
+        """
+        if identity in self.queued_tasks:
+            del self.queued_tasks[identity]
+            await self.finish_cancelled_task(identity)
+        else:
+            for worker in self.workers:
+                if worker.withdraw(identity):
+                    await self.finish_cancelled_task(identity)
+                    break
+                if identity in worker.active_tasks:
+                    self.cancelled_tasks.add(identity)
+                    if worker.cancelled_task is not None:
+                        worker.cancelled_task.value = identity
+                    break
+            else:
+                return  # The task already finished.
+        log.debug(f"{self} cancelled task 0x{identity:02X}")
+
+        for dependent in [i for i, queued_task in self.queued_tasks.items() if identity in queued_task.required_tasks]:
+            await self.cancel_task(dependent)
+
+    async def finish_cancelled_task(self, identity: int) -> None:
+        """
+        Notifies the main process that a task which was never performed is cancelled.
+
+        Parameters
+        ----------
+        identity : int
+            The identity of the task cancelled.
+        """
+        self.running_keys.pop(identity, None)
+        self.metrics.received.pop(identity, None)
+        self.outgoing_pipe.send(FinishedTask.as_exception(identity, TaskCancelled(f"0x{identity:02X} was cancelled")))
+
+    async def supersede_task(self, task: Task) -> None:
+        """
+        Cancels the unfinished task which shares the supersede key of a new task.
+
+        Parameters
+        ----------
+        task : Task
+            The new task.
+        """
+        if task.supersede_key is None:
+            return
+        superseded: int | None = self.superseding_tasks.get(task.supersede_key)
+        self.superseding_tasks[task.supersede_key] = task.identity
+        if superseded is not None:
+            log.debug(f"{self} superseded task 0x{superseded:02X} with {task}")
+            await self.cancel_task(superseded)
+
+    async def balance_workers(self) -> None:
+        """
+        Allows idle workers to steal tasks which are still pending for the busiest workers.
+        """
+        for worker in self.workers:
+            while worker.is_idle:
+                busiest_worker = max(self.workers, key=lambda w: len(w.pending_tasks))
+                if not busiest_worker.pending_tasks:
+                    return
+                stolen_task = busiest_worker.steal()
+                await worker.assign(stolen_task)
+                log.debug(f"{worker} stole {stolen_task} from {busiest_worker}")
 
     async def get_important_return_values(self) -> set[int]:
         """
@@ -1187,7 +2981,7 @@ class TaskManager:
         self.recent_returned_values |= {identity: return_value}
         await self.remove_stale_return_values()
         finished_tasks: set[int] = set(self.recent_returned_values.keys())
-        for identity, queued_task in self.queued_tasks.items():
+        for identity, queued_task in sorted(self.queued_tasks.items(), key=lambda item: item[1].priority.value):
             if finished_tasks.issuperset(queued_task.required_tasks):
                 await self.send_task_to_worker(queued_task, *await self.get_arguments_of_task(identity))
                 newly_queued_tasks.add(identity)
@@ -1199,31 +2993,86 @@ class TaskManager:
         Checks every worker to determine if any tasks have been completed and performs the required operations to
         send any finished tasks back to the main process.
         """
-        for worker in self.workers:
+        for worker in list(self.workers):
             if worker.incoming_pipe.poll():
                 log.debug(f"{self} receiving task result from {worker}")
                 try:
                     value: FinishedTask = worker.incoming_pipe.recv()
                 except EOFError:
-                    # Something went wrong, so we log and ignore it.
+                    # The worker closed its pipe, so its tasks must be given to a new worker.
                     log.warning(f"{self} dropped task from worker {worker}")
-                    return
-                self.outgoing_pipe.send(value)
-                await self.poll_queued_tasks(value.identity, value.result)
-                self.last_event = time()  # Add additional time to the process if work is actively getting done.
+                    await self.replace_worker(worker)
+                    continue
+                await worker.finish(value.identity)
+                await self.finish_performed_task(value, worker.name, worker.incoming_pipe.last_received_size)
+        while self.cached_tasks:
+            value = self.cached_tasks.popleft()
+            self.metrics.finish(value)
+            await self.finish_task(value)
+        await self.balance_workers()
+
+    async def finish_performed_task(self, value: FinishedTask, executor: str, size: int = 0) -> None:
+        """
+        Records a task which was performed by a worker and finishes it.
+
+        Parameters
+        ----------
+        value : FinishedTask
+            The task which was performed.
+        executor : str
+            The name of the worker which performed the task.
+        size : int, optional
+            The amount of bytes serialized to receive the result of the task.
+        """
+        if value.identity in self.cancelled_tasks:
+            self.cancelled_tasks.remove(value.identity)
+            value = FinishedTask.as_exception(
+                value.identity, TaskCancelled(f"0x{value.identity:02X} was cancelled"), value.duration
+            )
+        self.metrics.finish(value, executor, size)
+        await self.finish_task(value)
+
+    async def finish_task(self, value: FinishedTask) -> None:
+        """
+        Sends a finished task back to the main process and starts any tasks which depended on it.
+
+        Parameters
+        ----------
+        value : FinishedTask
+            The task which was finished.
+        """
+        key: str | None = self.running_keys.pop(value.identity, None)
+        if key is not None and value.exception is None:
+            self.result_cache.add(key, value.result)
+        for supersede_key, identity in list(self.superseding_tasks.items()):
+            if identity == value.identity:
+                del self.superseding_tasks[supersede_key]
+        self.outgoing_pipe.send(value)
+        await self.poll_queued_tasks(value.identity, value.result)
+        self.last_event = time()  # Add additional time to the process if work is actively getting done.
 
     async def poll_tasks(self) -> None:
         """
         Checks if the main process has sent any additional tasks to be performed.
         """
         while self.incoming_pipe.poll():
-            task: Task = self.incoming_pipe.recv()
+            task: Task | CancelTask | PerformedTask = self.incoming_pipe.recv()
             log.debug(f"{self} received {task}")
+            self.last_event = time()  # Update last event time.
+            if isinstance(task, CancelTask):
+                await self.cancel_task(task.identity)
+                continue
+            if isinstance(task, PerformedTask):
+                self.metrics.record(task.name, task.queue_wait, task.duration, task.failed, task.executor.name.lower())
+                await self.poll_queued_tasks(task.identity, task.result)
+                continue
+            self.metrics.receive(task, getattr(self.incoming_pipe, "last_received_size", 0))
+            await self.supersede_task(task)
             if task.required_tasks:
                 self.queued_tasks |= {task.identity: task}
             else:
-                ensure_future(self.send_task_to_worker(task))
-            self.last_event = time()  # Update last event time.
+                # The task is sent immediately, so a cancellation received afterwards is able to find it.
+                await self.send_task_to_worker(task)
 
     async def update(self) -> None:
         """
@@ -1264,6 +3113,8 @@ class TaskManager:
                 ensure_future(self.join(request.identity))
             case Requests.LIMIT:
                 ensure_future(self.limit(request.identity))
+            case Requests.GET_METRICS:
+                ensure_future(self.get_metrics(request.identity))
             case _:
                 ensure_future(self.default(request.identity))
 
@@ -1278,6 +3129,20 @@ class TaskManager:
         """
         await self.replier.reply(Reply(self.status, identity))
 
+    async def get_metrics(self, identity: int) -> None:
+        """
+        Provides the metrics of the manager process to the main process.
+
+        Parameters
+        ----------
+        identity : int
+            The identity associated with the reply.
+        """
+        if self.status == Status.RUNNING:
+            # Tasks performed by the main process are recorded once they are received, which may not have happened yet.
+            await self.poll_tasks()
+        await self.replier.reply(Reply(self.metrics.snapshot(self.workers, len(self.queued_tasks)), identity))
+
     async def start_sleeping(self, identity: int) -> None:
         """
         Tries to put the manager process into sleep mode, refusing to receive additional tasks.
@@ -1349,15 +3214,24 @@ class TaskManager:
         if self.status == Status.RUNNING:
             self.status = Status.SLEEPING
 
+            # Tasks pending inside the manager have not reached a worker yet, so they must be flushed first.
+            start_time: float = time()
+            while self.cached_tasks or any(worker.pending_tasks for worker in self.workers):
+                if time() - start_time >= MANAGER_JOIN_TIMEOUT:
+                    log.warning(f"{self} failed to send all pending tasks in time")
+                    break
+                await self.poll_workers()
+                await sleep(MANAGER_SLEEP_DURATION)
+
             async def join_worker(worker: TaskWorkerProxy) -> None:
                 # Force kill a worker if it did not respond.
                 if not await worker.join(10000):
-                    await worker.kill()
-                    await self.add_worker()
+                    await self.replace_worker(worker)
 
             if self.workers:
                 await gather(
-                    *[await join_worker(worker) for worker in self.workers], return_exceptions=True  # type: ignore
+                    *[await join_worker(worker) for worker in list(self.workers)],  # type: ignore
+                    return_exceptions=True,
                 )
 
         await self.replier.reply(Reply(self.status, identity))
@@ -1412,6 +3286,12 @@ class TaskWorkerProxy:
         A requester object to receive simple commands.
     name: str = "worker"
         The name of the worker, used for debugging.
+    active_tasks: dict[int, WorkerTask] = {}
+        The tasks sent to the worker process which have not finished, keyed by their identity.
+    pending_tasks: deque[WorkerTask] = deque()
+        The tasks assigned to the worker which have not been sent to the worker process, from most to least urgent.
+    cancelled_task: Any = None
+        A shared value containing the identity of the last task cancelled while the worker process performed it.
     """
 
     process: Process | None
@@ -1419,6 +3299,9 @@ class TaskWorkerProxy:
     incoming_pipe: Connection
     requester: Requester[Requests, Status]
     name: str = "worker"
+    active_tasks: dict[int, WorkerTask] = Factory(dict)
+    pending_tasks: deque[WorkerTask] = Factory(deque)
+    cancelled_task: Any = None
 
     def __str__(self) -> str:
         return f"<{self.name}>"
@@ -1426,7 +3309,114 @@ class TaskWorkerProxy:
     def __del__(self) -> None:
         synchronize(self.kill)()
 
-    def start(self, outgoing_pipe: Connection, incoming_pipe: Connection, replier: Replier) -> None:
+    @property
+    def load(self) -> int:
+        """
+        The amount of tasks assigned to the worker which are not finished.
+
+        Returns
+        -------
+        int
+            The amount of active and pending tasks.
+        """
+        return len(self.active_tasks) + len(self.pending_tasks)
+
+    @property
+    def is_idle(self) -> bool:
+        """
+        Determines if the worker process is able to receive additional tasks without any pending.
+
+        Returns
+        -------
+        bool
+            If the worker can immediately start another task.
+        """
+        return not self.pending_tasks and len(self.active_tasks) < WORKER_PREFETCH_LIMIT
+
+    async def dispatch(self) -> None:
+        """
+        Sends pending tasks to the worker process until it has reached its prefetch limit.
+        """
+        while self.pending_tasks and len(self.active_tasks) < WORKER_PREFETCH_LIMIT:
+            task: WorkerTask = self.pending_tasks.popleft()
+            self.outgoing_pipe.send(task)
+            self.active_tasks[task.identity] = task
+            log.debug(f"{self} sent {task}")
+
+    async def assign(self, task: WorkerTask) -> None:
+        """
+        Assigns a task to the worker, to be sent to the worker process once it has capacity.
+
+        Parameters
+        ----------
+        task : WorkerTask
+            The task to be performed by the worker.
+        """
+        for index, pending_task in enumerate(self.pending_tasks):
+            if pending_task.priority.value > task.priority.value:
+                self.pending_tasks.insert(index, task)
+                break
+        else:
+            self.pending_tasks.append(task)
+        await self.dispatch()
+
+    async def finish(self, identity: int) -> None:
+        """
+        Marks a task as finished by the worker process and sends it any pending tasks.
+
+        Parameters
+        ----------
+        identity : int
+            The identity of the task finished.
+        """
+        self.active_tasks.pop(identity, None)
+        await self.dispatch()
+
+    def steal(self) -> WorkerTask:
+        """
+        Removes the most urgent pending task, so it can be performed by another worker.  Of equally urgent tasks, the
+        most recently assigned is removed.
+
+        Returns
+        -------
+        WorkerTask
+            The task removed from the worker.
+        """
+        priority: Priority = self.pending_tasks[0].priority
+        for index in range(len(self.pending_tasks) - 1, -1, -1):
+            if self.pending_tasks[index].priority == priority:
+                break
+        task: WorkerTask = self.pending_tasks[index]
+        del self.pending_tasks[index]
+        return task
+
+    def withdraw(self, identity: int) -> bool:
+        """
+        Removes a pending task, so it will not be performed.
+
+        Parameters
+        ----------
+        identity : int
+            The identity of the task to remove.
+
+        Returns
+        -------
+        bool
+            If the task was pending for this worker.
+        """
+        for task in self.pending_tasks:
+            if task.identity == identity:
+                self.pending_tasks.remove(task)
+                return True
+        return False
+
+    def start(
+        self,
+        outgoing_pipe: Connection,
+        incoming_pipe: Connection,
+        replier: Replier,
+        idle_policy: IdlePolicy | None = None,
+    ) -> None:
         """
         Begins running the worker in another process.
 
@@ -1438,9 +3428,14 @@ class TaskWorkerProxy:
             The pipe for the worker process to receive tasks from this process.
         replier : Replier
             A network of pipes to receive simple requests from the task manager.
+        idle_policy : IdlePolicy | None, optional
+            The policy containing the modules and data to preload before receiving tasks.
         """
+        reset_signal_handlers()
+        if idle_policy is not None:
+            idle_policy.prepare()
         # We copy name to not have references
-        run(TaskWorker(copy(self.name), outgoing_pipe, incoming_pipe, replier).update())
+        run(TaskWorker(copy(self.name), outgoing_pipe, incoming_pipe, replier, self.cancelled_task).update())
 
     async def make_request(self, request: Requests, timeout: float | None = None) -> Status:
         """
@@ -1534,6 +3529,8 @@ class TaskWorker:
         The current status of the worker processes.
     task_count: int
         The number of tasks that this process is actively working on.
+    cancelled_task: Any
+        A shared value containing the identity of the last task cancelled by the manager process.
     """
 
     name: str
@@ -1542,10 +3539,19 @@ class TaskWorker:
     replier: Replier
     status: Status
     task_count: int
+    cancelled_task: Any
 
-    def __init__(self, name: str, outgoing_pipe: Connection, incoming_pipe: Connection, replier: Replier) -> None:
+    def __init__(
+        self,
+        name: str,
+        outgoing_pipe: Connection,
+        incoming_pipe: Connection,
+        replier: Replier,
+        cancelled_task: Any = None,
+    ) -> None:
         self.name = name
         self.task_count = 0
+        self.cancelled_task = cancelled_task
         log.info(f"{self} entering startup")
         self.status = Status.STARTUP
         self.outgoing_pipe = outgoing_pipe
@@ -1569,10 +3575,10 @@ class TaskWorker:
             The task to be performed.
         """
         log.debug(f"{self} begun executing {task.task} with arguments {task.arguments}")
-        try:
-            finished_task = FinishedTask(task.identity, task.begin_task())
-        except Exception as e:
-            finished_task = FinishedTask.as_exception(task.identity, e)
+        cancelled_task = self.cancelled_task
+        finished_task: FinishedTask = perform_task(
+            task, None if cancelled_task is None else lambda: cancelled_task.value == task.identity
+        )
         if DEBUG >= log.level and not pickles(finished_task):
             log.critical(f"{finished_task} is not a pickle with bad types: {badtypes(finished_task)}")
             raise NotAPickleException(f"{finished_task} is not a pickle!")
@@ -1707,7 +3713,12 @@ class TaskWorker:
         await self.replier.reply(Reply(Status.NOT_DEFINED, identity))
 
 
-def start_task_manager(name: str | None = None) -> TaskManagerProxy:
+def start_task_manager(
+    name: str | None = None,
+    worker_count: int | None = None,
+    idle_policy: IdlePolicy | None = None,
+    result_cache_size: int = RESULT_CACHE_SIZE,
+) -> TaskManagerProxy:
     """
     Provides and starts a task manager to begin receiving and executing tasks.
 
@@ -1715,6 +3726,12 @@ def start_task_manager(name: str | None = None) -> TaskManagerProxy:
     ----------
     name : str | None, optional
         The name of the task manager process.
+    worker_count : int | None, optional
+        The amount of worker processes to perform tasks, by default the amount of CPUs.
+    idle_policy : IdlePolicy | None, optional
+        The policy the task manager follows when it is idle, by default keeping a single warm worker.
+    result_cache_size : int, optional
+        The maximum amount of bytes of results of pure tasks to cache, by default `RESULT_CACHE_SIZE`.
 
     Returns
     -------
@@ -1725,7 +3742,14 @@ def start_task_manager(name: str | None = None) -> TaskManagerProxy:
     child_outgoing_pipe, parent_incoming_pipe = dill_connection(*Pipe())
     request_pipe = RequestPipe.generate()
     manager: TaskManagerProxy = TaskManagerProxy(
-        None, parent_outgoing_pipe, parent_incoming_pipe, request_pipe.requester, name or "manager"
+        None,
+        parent_outgoing_pipe,
+        parent_incoming_pipe,
+        request_pipe.requester,
+        name or "manager",
+        worker_count,
+        idle_policy or IdlePolicy(),
+        result_cache_size,
     )
     process: Process = Process(
         target=manager.start, args=(child_outgoing_pipe, child_incoming_pipe, request_pipe.replier), name=manager.name
@@ -1745,6 +3769,79 @@ def start_task_manager(name: str | None = None) -> TaskManagerProxy:
     return manager
 
 
+_running_task = local()
+
+
+def perform_task(task: WorkerTask, is_cancelled: Callable[[], bool] | None = None) -> FinishedTask:
+    """
+    Performs a task on the current thread.
+
+    Parameters
+    ----------
+    task : WorkerTask
+        The task to be performed.
+    is_cancelled : Callable[[], bool] | None, optional
+        Determines if the task was cancelled, which is provided to the task through `task_cancelled`.
+
+    Returns
+    -------
+    FinishedTask
+        The result or exception of the task and the time it took to perform.
+    """
+    _running_task.is_cancelled = is_cancelled
+    start_time: float = perf_counter()
+    try:
+        return FinishedTask(task.identity, task.begin_task(), duration=perf_counter() - start_time)
+    except Exception as e:
+        return FinishedTask.as_exception(task.identity, e, perf_counter() - start_time)
+    finally:
+        _running_task.is_cancelled = None
+
+
+def task_cancelled() -> bool:
+    """
+    Determines if the task being performed by this thread was cancelled, so it can cooperatively stop early.
+
+    Returns
+    -------
+    bool
+        If the current task was cancelled, False if this thread is not performing a task.
+    """
+    is_cancelled: Callable[[], bool] | None = getattr(_running_task, "is_cancelled", None)
+    return is_cancelled is not None and is_cancelled()
+
+
+def reset_signal_handlers() -> None:
+    """
+    Restores the default signal handlers inside a child process.
+
+    Notes
+    -----
+        Forked processes inherit the handlers `start_task_manager` installs to stop the task manager from the main
+    process.  Inside a child they would try to stop a task manager the child does not own instead of exiting, which can
+    deadlock the child while it is holding a lock.
+    """
+    signal(SIGTERM, SIG_DFL)
+    signal(SIGINT, SIG_DFL)
+
+
+def least_loaded_worker(workers: Sequence[TaskWorkerProxy]) -> TaskWorkerProxy:
+    """
+    Finds the worker with the fewest unfinished tasks.
+
+    Parameters
+    ----------
+    workers : Sequence[TaskWorkerProxy]
+        The workers to choose from.
+
+    Returns
+    -------
+    TaskWorkerProxy
+        The worker with the smallest load, preferring the earliest worker for ties.
+    """
+    return min(workers, key=lambda worker: worker.load)
+
+
 def synchronize(func):
     """
     Allows for an asynchronous coroutine to be executed in the main process.
@@ -1836,18 +3933,12 @@ class _TaskManager:
     """
 
     _task_manager: TaskManagerProxy | None
-    _last_event: float
 
     def __init__(self, is_alive: bool = False):
         self._task_manager = start_task_manager("task manager") if is_alive else None
-        self._last_event = time()
 
     def __get__(self, instance, owner) -> TaskManagerProxy:
-        if (
-            self._task_manager is not None
-            and time() - AUTOMATED_REMOVAL_DURATION > self._last_event
-            and not self._task_manager.is_alive()
-        ):
+        if self._task_manager is not None and not self._task_manager.is_alive():
             self._task_manager = None
 
         if self._task_manager is None:
@@ -1878,15 +3969,24 @@ class TaskMethod(Generic[_P, _T]):
         A signal to emit the result of fstart.
     ehandler: Callable[[Exception], None] | None
         A handler to resolve any exceptions from the task.
+    pure: bool
+        If the result of the task only depends on `fstart`, so identical tasks can be served from a cache.
+    priority: Priority
+        The urgency of the task.
+    executor: Executor
+        Where the task is performed.
     """
 
-    __slots__ = ("name", "fstart", "_freturn", "fsignal", "ehandler")
+    __slots__ = ("name", "fstart", "_freturn", "fsignal", "ehandler", "pure", "priority", "executor")
 
     name: str | None
     fstart: Callable[_P, _T]
     _freturn: Callable[[Any, _T], None] | None
     fsignal: Signal[_T] | None
     ehandler: Callable[[Exception], None] | None
+    pure: bool
+    priority: Priority
+    executor: Executor
 
     def __init__(
         self,
@@ -1895,17 +3995,23 @@ class TaskMethod(Generic[_P, _T]):
         fsignal: Signal[_T] | None = None,
         ehandler: Callable[[Exception], None] | None = None,
         name: str | None = None,
+        pure: bool = False,
+        priority: Priority = Priority.VISIBLE,
+        executor: Executor = Executor.PROCESS,
     ) -> None:
         self.name = fstart.__name__ if name is None and fstart is not None else name
         self.fstart = fstart
         self.fsignal = fsignal
         self._freturn = freturn
         self.ehandler = ehandler
+        self.pure = pure
+        self.priority = priority
+        self.executor = executor
 
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__name__}({self.fstart}, {self._freturn}, {self.fsignal}, {self.ehandler}, "
-            f"{self.name}, {self.__doc__}"
+            f"{self.name}, {self.pure}, {self.priority}, {self.executor}, {self.__doc__}"
         )
 
     def __str__(self) -> str:
@@ -1923,7 +4029,9 @@ class TaskMethod(Generic[_P, _T]):
 
         _inner.__name__ = self.fstart.__name__
 
-        _task_manager().schedule_task(TaskCallback(_inner, self.freturn(args[0]), self.ehandler))
+        _task_manager().schedule_task(
+            TaskCallback(_inner, self.freturn(args[0]), self.ehandler, self.key, self.priority, executor=self.executor)
+        )
 
     def freturn(self, instance: object) -> Callable[[_T], None]:
         """
@@ -1948,20 +4056,42 @@ class TaskMethod(Generic[_P, _T]):
 
         return freturn
 
+    @property
+    def key(self) -> str | None:
+        """
+        The key to cache the result of the task under.
+
+        Returns
+        -------
+        str | None
+            A stable hash of `fstart` if the task is pure, otherwise None.
+        """
+        return task_key(self.fstart) if self.pure else None
+
     def task_callback(self, instance: object) -> TaskCallback[_P, _T]:
-        return TaskCallback(self.fstart, self.freturn(instance), self.ehandler)
+        return TaskCallback(
+            self.fstart, self.freturn(instance), self.ehandler, self.key, self.priority, executor=self.executor
+        )
 
     def start(self, fstart: Callable[_P, _T]):
-        return type(self)(fstart, self._freturn, self.fsignal, self.ehandler, self.name)
+        return type(self)(
+            fstart, self._freturn, self.fsignal, self.ehandler, self.name, self.pure, self.priority, self.executor
+        )
 
     def return_task(self, freturn: Callable[[Any, _T], None] | None):
-        return type(self)(self.fstart, freturn, self.fsignal, self.ehandler, self.name)
+        return type(self)(
+            self.fstart, freturn, self.fsignal, self.ehandler, self.name, self.pure, self.priority, self.executor
+        )
 
     def signal(self, fsignal: Signal[_T] | None = None):
-        return type(self)(self.fstart, self._freturn, fsignal, self.ehandler, self.name)
+        return type(self)(
+            self.fstart, self._freturn, fsignal, self.ehandler, self.name, self.pure, self.priority, self.executor
+        )
 
     def handler(self, ehandler: Callable | None = None):
-        return type(self)(self.fstart, self._freturn, self.fsignal, ehandler, self.name)
+        return type(self)(
+            self.fstart, self._freturn, self.fsignal, ehandler, self.name, self.pure, self.priority, self.executor
+        )
 
 
 task: type[TaskMethod] = TaskMethod
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+import logging
+from argparse import ArgumentParser, BooleanOptionalAction
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+from foundry.game.File import ROM
+from foundry.game.level.dataset import LevelDataset, LevelTables
+from foundry.game.level.Level import Level
+from foundry.game.level.util import Level as LevelInformation
+from foundry.render import initialize_worker
+from foundry.smb3parse.objects.tileset import WORLD_MAP_OBJECT_SET
+
+logger = logging.getLogger(__name__)
+
+
+def parse_level(information: LevelInformation) -> LevelTables:
+    """
+    Parses a level of the ROM into its tables.
+
+    Parameters
+    ----------
+    information : LevelInformation
+        The level to parse.
+
+    Returns
+    -------
+    LevelTables
+        The tables of the level.
+    """
+    level = Level(
+        information.display_information.name or "",
+        information.generator_pointer - Level.HEADER_LENGTH,
+        information.enemy_pointer,
+        information.tileset,
+    )
+    return LevelTables.from_level(level, information.generator_pointer, information.enemy_pointer)
+
+
+def main(path_to_rom: str, output: Path = Path("levels.npz"), jobs: int | None = None, compress: bool = False) -> int:
+    """
+    Exports every level of a ROM to a NumPy archive.
+
+    Parameters
+    ----------
+    path_to_rom : str
+        The path to the ROM.
+    output : Path, optional
+        The path of the archive, by default 'levels.npz'.
+    jobs : int | None, optional
+        The amount of processes to parse with, by default None or one per CPU.
+    compress : bool, optional
+        If the archive is compressed, by default False so it can be memory mapped when it is loaded.
+
+    Returns
+    -------
+    int
+        The amount of levels which failed to parse.
+    """
+    ROM.load_from_file(path_to_rom)
+    levels = [level for level in ROM().settings.levels if level.tileset != WORLD_MAP_OBJECT_SET]
+
+    tables: list[LevelTables] = []
+    failed = 0
+
+    # Qt does not survive being forked, so each worker starts from a fresh interpreter.
+    with ProcessPoolExecutor(
+        jobs, mp_context=get_context("spawn"), initializer=initialize_worker, initargs=(path_to_rom,)
+    ) as executor:
+        futures = [executor.submit(parse_level, level) for level in levels]
+
+        for level, future in zip(levels, futures):
+            try:
+                tables.append(future.result())
+            except Exception:
+                logger.exception(f"Failed to parse {level}")
+                failed += 1
+
+    LevelDataset.from_tables(tables).save(output, compress)
+    print(f"Exported {len(tables)} levels to {output}, {failed} failed.")
+
+    return failed
+
+
+def start():
+    parser = ArgumentParser(description="Exports the blocks, objects, and enemies of every level of a ROM.")
+    parser.add_argument("rom", type=str, help="The path to the ROM")
+    parser.add_argument("--output", type=Path, default=Path("levels.npz"), help="The path of the NumPy archive")
+    parser.add_argument("--jobs", type=int, default=None, help="The amount of processes, one per CPU by default")
+    parser.add_argument(
+        "--compress",
+        default=False,
+        action=BooleanOptionalAction,
+        type=bool,
+        help="Compress the archive, which prevents it from being memory mapped",
+    )
+
+    args = parser.parse_args()
+    raise SystemExit(1 if main(args.rom, args.output, args.jobs, args.compress) else 0)
+
+
+if __name__ == "__main__":
+    start()
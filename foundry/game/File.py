@@ -232,6 +232,7 @@ class ROM(Rom):
     MARKER_VALUE: ClassVar[bytes] = bytes("SMB3FOUNDRY", "ascii")
 
     rom_data = bytearray()
+    generation: ClassVar[int] = 0
 
     path: str = ""
     name: str = ""
@@ -364,6 +365,7 @@ class ROM(Rom):
             data = bytearray(rom.read())
 
         ROM.rom_data = data
+        ROM.generation += 1
         ROM.path = path
         ROM.name = basename(path)
         ROM._id = ROM().get_id()
@@ -408,6 +410,11 @@ class ROM(Rom):
 
         return ROM.rom_data[position : position + count]
 
+    def write(self, offset: int, data: bytes):
+        super().write(offset, data)
+        ROM.generation += 1
+
     def bulk_write(self, data: bytearray, position: int):
         position = self.header.normalized_address(position)
         self.rom_data[position : position + len(data)] = data
+        ROM.generation += 1
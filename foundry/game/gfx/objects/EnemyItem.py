@@ -1,4 +1,9 @@
-from PySide6.QtCore import QPointF, QRect, QSize
+from functools import cache
+from math import ceil, floor
+from threading import Lock
+from typing import ClassVar
+
+from PySide6.QtCore import QPoint, QPointF, QRect, QRectF, QSize, QSizeF
 from PySide6.QtGui import QColor, QImage, QPainter, Qt
 
 from foundry.core.drawable import (
@@ -20,8 +25,55 @@ from foundry.game.EnemyDefinitions import (
 from foundry.game.gfx.objects.Enemy import Enemy
 from foundry.game.gfx.objects.ObjectLike import ObjectLike
 
+ENEMY_IMAGE_CACHE_SIZE = 2**10
+
+
+@cache
+def _graphics_set(pages: tuple[int, ...]) -> GraphicsSet:
+    return GraphicsSet(tuple(GraphicsPage(page) for page in pages))
+
+
+def _composite(parts: list[tuple[QPointF, QImage]]) -> tuple[QImage, QPoint]:
+    """
+    Draws a series of images into a single image.
+
+    Parameters
+    ----------
+    parts : list[tuple[QPointF, QImage]]
+        The images and the positions to draw them at.
+
+    Returns
+    -------
+    tuple[QImage, QPoint]
+        The image containing every part and the position of its top left corner.
+    """
+    if not parts:
+        image = QImage(1, 1, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        return image, QPoint(0, 0)
+
+    bounds = QRectF()
+    for point, image in parts:
+        bounds = bounds.united(QRectF(point, QSizeF(image.size())))
+    offset = QPoint(floor(bounds.left()), floor(bounds.top()))
+
+    image = QImage(
+        ceil(bounds.right()) - offset.x(), ceil(bounds.bottom()) - offset.y(), QImage.Format.Format_ARGB32_Premultiplied
+    )
+    image.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(image)
+    for point, part in parts:
+        painter.drawImage(point - QPointF(offset), part)
+    painter.end()
+
+    return image, offset
+
 
 class EnemyObject(ObjectLike):
+    _image_cache: ClassVar[dict[tuple, tuple[QImage, QPoint]]] = {}
+    _image_cache_lock: ClassVar[Lock] = Lock()
+
     def __init__(self, data, png_data, palette_group: PaletteGroup):
         super().__init__()
         self.enemy = Enemy.from_bytes(data)
@@ -55,7 +107,7 @@ class EnemyObject(ObjectLike):
     @property
     def graphics_set(self) -> GraphicsSet:
         if GeneratorType.SINGLE_SPRITE_OBJECT == self.definition.orientation:
-            return GraphicsSet(tuple(GraphicsPage(page) for page in self.definition.pages))
+            return _graphics_set(tuple(self.definition.pages))
         else:
             raise NotImplementedError
 
@@ -96,18 +148,65 @@ class EnemyObject(ObjectLike):
         pass
 
     def draw(self, painter: QPainter, block_length, transparency, *, is_icon=False):
-        if not GeneratorType.SINGLE_SPRITE_OBJECT == self.definition.orientation:
-            self.draw_blocks(painter, block_length, is_icon)
-        else:
-            self.draw_sprites(painter, block_length // 2, transparency, is_icon)
+        image, offset = self._cached_image(block_length, transparency, is_icon)
+        origin = QPoint(0, 0) if is_icon else QPoint(self.point.x * block_length, self.point.y * block_length)
+        painter.drawImage(origin + offset, image)
+
+    def _cached_image(self, block_length: int, transparency: bool, is_icon: bool) -> tuple[QImage, QPoint]:
+        """
+        Provides the image of this type of enemy, which is only rendered once for each palette group, scale, and
+        selection.
+
+        Parameters
+        ----------
+        block_length : int
+            The length of a block in pixels.
+        transparency : bool
+            If the mask color of sprites should be transparent.
+        is_icon : bool
+            If the enemy is drawn as an icon.
+
+        Returns
+        -------
+        tuple[QImage, QPoint]
+            The image of the enemy and the offset of its top left corner from the position of the enemy.
+        """
+        uses_blocks = not GeneratorType.SINGLE_SPRITE_OBJECT == self.definition.orientation
+        key = (
+            self.obj_index,
+            self.palette_group,
+            self.png_data.cacheKey() if uses_blocks else 0,
+            block_length,
+            transparency and not uses_blocks,
+            self.selected and uses_blocks,
+            is_icon,
+        )
+
+        image = self._image_cache.get(key)
+        if image is None:
+            if uses_blocks:
+                parts = self._block_parts(block_length, is_icon)
+            else:
+                parts = self._sprite_parts(block_length // 2, transparency, is_icon)
+            image = _composite(parts)
+
+            # Enemies may be drawn from several threads at once, when a level is composited in the background.
+            with self._image_cache_lock:
+                if len(self._image_cache) >= ENEMY_IMAGE_CACHE_SIZE:
+                    del self._image_cache[next(iter(self._image_cache))]
+                self._image_cache[key] = image
+
+        return image
+
+    def _sprite_parts(self, scale_factor: int, transparency: bool, is_icon: bool) -> list[tuple[QPointF, QImage]]:
+        parts = []
 
-    def draw_sprites(self, painter: QPainter, scale_factor: int, transparency: bool, is_icon: bool) -> None:
         for i, sprite_info in enumerate(self.sprites):
             if sprite_info.index < 0:
                 continue
 
-            x: float = (self.point.x * 2) + (i % self.width) if not is_icon else (i % self.width)
-            y: float = self.point.y + (i // self.width) if not is_icon else (i // self.width)
+            x: float = i % self.width
+            y: float = i // self.width
             x += sprite_info.x_offset / 16
             y -= sprite_info.y_offset / 16
             if is_icon:
@@ -136,12 +235,16 @@ class EnemyObject(ObjectLike):
                 mask: QImage = image.createMaskFromColor(QColor(*MASK_COLOR).rgb(), Qt.MaskMode.MaskOutColor)
                 image.setAlphaChannel(mask)
 
-            painter.drawImage(QPointF(x * scale_factor, y * scale_factor * 2), image)
+            parts.append((QPointF(x * scale_factor, y * scale_factor * 2), image))
+
+        return parts
+
+    def _block_parts(self, block_length: int, is_icon: bool) -> list[tuple[QPointF, QImage]]:
+        parts = []
 
-    def draw_blocks(self, painter: QPainter, block_length, is_icon):
         for i, image in enumerate(self.blocks):
-            x = self.point.x + (i % self.width) if not is_icon else (i % self.width)
-            y = self.point.y + (i // self.width) if not is_icon else (i // self.width)
+            x = i % self.width
+            y = i // self.width
 
             if is_icon:
                 definition = get_enemy_metadata().__root__[self.obj_index]
@@ -163,7 +266,9 @@ class EnemyObject(ObjectLike):
             if block_length != BLOCK_SIZE.width:
                 block = block.scaled(block_length, block_length)
 
-            painter.drawImage(x * block_length, y * block_length, block)
+            parts.append((QPointF(x * block_length, y * block_length), block))
+
+        return parts
 
     def get_status_info(self):
         return [("Name", self.name), ("X", self.point.x), ("Y", self.point.y)]
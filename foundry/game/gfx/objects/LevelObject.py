@@ -586,11 +586,9 @@ class LevelObject(GeneratorObject):
             else Block.from_tsa(Point(0, 0), normalized_index, self.tsa_data)
         )
 
-        image: QImage = block_to_image(block, self.palette_group, self.graphics_set, block_length)
-        if transparent:
-            image = image.copy()
-            mask: QImage = image.createMaskFromColor(QColor(*MASK_COLOR).rgb(), Qt.MaskMode.MaskOutColor)
-            image.setAlphaChannel(mask)
+        image: QImage = block_to_image(
+            block, self.palette_group, self.graphics_set, block_length, transparent=bool(transparent)
+        )
 
         painter.drawImage(QPoint(x * block_length, y * block_length), image)
 
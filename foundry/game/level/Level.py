@@ -1,7 +1,9 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
 from functools import reduce
 from typing import overload
 
-from PySide6.QtCore import QObject, Signal, SignalInstance
+from PySide6.QtCore import QObject, QTimer, Signal, SignalInstance
 
 from foundry.core.geometry import Point, Rect, Size
 from foundry.game.File import ROM
@@ -46,6 +48,55 @@ class LevelSignaller(QObject):
     data_changed: SignalInstance = Signal()
     jumps_changed: SignalInstance = Signal()
 
+    def __init__(self):
+        super().__init__()
+        self._batch_depth = 0
+        self._pending_signals: dict[str, None] = {}
+
+    @contextmanager
+    def batch(self, deliver_later: bool = False) -> Iterator[None]:
+        """
+        Coalesces the signals notified inside the context, so each is emitted once when the outermost batch exits, or
+        on the next iteration of the event loop if `deliver_later` is set.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                if deliver_later:
+                    QTimer.singleShot(0, self._flush_signals)
+                else:
+                    self._flush_signals()
+
+    def notify(self, signal_name: str) -> None:
+        """
+        Emits a signal of the level, or defers it until the outermost batch exits.
+
+        Parameters
+        ----------
+        signal_name : str
+            The name of the signal to emit, such as 'data_changed'.
+        """
+        if self._batch_depth:
+            self._pending_signals[signal_name] = None
+        else:
+            getattr(self, signal_name).emit()
+
+    def _flush_signals(self) -> None:
+        """
+        Emits every deferred signal once, unless another batch has begun.
+        """
+        if self._batch_depth:
+            # a new batch started before the event loop got to us, it will flush once it exits
+            return
+
+        pending_signals, self._pending_signals = self._pending_signals, {}
+
+        for signal_name in pending_signals:
+            getattr(self, signal_name).emit()
+
 
 class Level(LevelLike):
     MIN_LENGTH = 0x10
@@ -99,7 +150,7 @@ class Level(LevelLike):
 
         if new_level:
             self._update_level_size()
-            self.data_changed.emit()
+            self._signal_emitter.notify("data_changed")
 
     @property
     def fully_loaded(self):
@@ -138,6 +189,9 @@ class Level(LevelLike):
     def jumps_changed(self):
         return self._signal_emitter.jumps_changed
 
+    def batch(self, deliver_later: bool = False):
+        return self._signal_emitter.batch(deliver_later)
+
     def reload(self):
         (_, header_and_object_data), (_, enemy_data) = self.to_bytes()
 
@@ -145,10 +199,11 @@ class Level(LevelLike):
 
         object_data = header_and_object_data[Level.HEADER_LENGTH :]
 
-        self._parse_header()
-        self._load_level_data(object_data, enemy_data, new_level=False)
+        with self.batch():
+            self._parse_header()
+            self._load_level_data(object_data, enemy_data, new_level=False)
 
-        self.data_changed.emit()
+            self._signal_emitter.notify("data_changed")
 
     def current_object_size(self):
         return reduce(
@@ -172,7 +227,7 @@ class Level(LevelLike):
 
         self.size = Size(self.header.width, self.header.height)
 
-        self.data_changed.emit()
+        self._signal_emitter.notify("data_changed")
 
     def _load_enemies(self, data: bytearray):
         self.enemies.clear()
@@ -640,12 +695,12 @@ class Level(LevelLike):
     def add_jump(self):
         self.jumps.append(Jump.from_properties(0, 0, 0, 0))
 
-        self.data_changed.emit()
+        self._signal_emitter.notify("data_changed")
 
     def remove_jump(self, jump: Jump):
         self.jumps.remove(jump)
 
-        self.data_changed.emit()
+        self._signal_emitter.notify("data_changed")
 
     def index_of(self, obj: EnemyObject | LevelObject) -> int:
         if isinstance(obj, LevelObject):
@@ -765,5 +820,6 @@ class Level(LevelLike):
         self.header_bytes = object_bytes[0 : Level.HEADER_LENGTH]
         objects = object_bytes[Level.HEADER_LENGTH :]
 
-        self._parse_header()
-        self._load_level_data(objects, enemies, new_level)
+        with self.batch():
+            self._parse_header()
+            self._load_level_data(objects, enemies, new_level)
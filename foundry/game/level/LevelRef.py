@@ -1,14 +1,11 @@
-from PySide6.QtCore import QObject, Signal, SignalInstance
+from functools import partial
 
 from foundry.core.UndoController import UndoController
 from foundry.game.level import LevelByteData
-from foundry.game.level.Level import Level
+from foundry.game.level.Level import Level, LevelSignaller
 
 
-class LevelRef(QObject):
-    data_changed: SignalInstance = Signal()  # type: ignore
-    jumps_changed: SignalInstance = Signal()  # type: ignore
-
+class LevelRef(LevelSignaller):
     def __init__(self):
         super().__init__()
         self._internal_level = None
@@ -24,7 +21,7 @@ class LevelRef(QObject):
         self._is_loaded = True
 
         # actively emit, because we weren't connected yet, when the level sent it out
-        self.data_changed.emit()
+        self.notify("data_changed")
 
     def unload_level(self) -> None:
         self._internal_level = None
@@ -43,8 +40,9 @@ class LevelRef(QObject):
 
         self._undo_controller = UndoController(self._internal_level.to_bytes())
 
-        self._internal_level.data_changed.connect(self.data_changed.emit)
-        self._internal_level.jumps_changed.connect(self.jumps_changed.emit)
+        # forward through notify, so the signals of the level are coalesced inside our batches as well
+        self._internal_level.data_changed.connect(partial(self.notify, "data_changed"))
+        self._internal_level.jumps_changed.connect(partial(self.notify, "jumps_changed"))
 
     @property
     def selected_objects(self):
@@ -62,7 +60,7 @@ class LevelRef(QObject):
         for obj in self._internal_level.get_all_objects():
             obj.selected = obj in selected_objects
 
-        self.data_changed.emit()
+        self.notify("data_changed")
 
     @property
     def state(self) -> LevelByteData:
@@ -74,7 +72,7 @@ class LevelRef(QObject):
         assert self._undo_controller is not None
 
         data = self._undo_controller.do(level_data if level_data is not None else self.level.to_bytes())
-        self.data_changed.emit()
+        self.notify("data_changed")
         return data
 
     @property
@@ -104,19 +102,21 @@ class LevelRef(QObject):
         return new_state
 
     def set_level_state(self, object_data, enemy_data):
-        self.level.from_bytes(object_data, enemy_data, new_level=False)
-        self.level.changed = True
+        with self.batch():
+            self.level.from_bytes(object_data, enemy_data, new_level=False)
+            self.level.changed = True
 
-        self.data_changed.emit()
+            self.notify("data_changed")
 
     def save_level_state(self):
         assert self._internal_level is not None
         assert self._undo_controller is not None
 
-        self.do(self._internal_level.to_bytes())
-        self.level.changed = True
+        with self.batch():
+            self.do(self._internal_level.to_bytes())
+            self.level.changed = True
 
-        self.data_changed.emit()
+            self.notify("data_changed")
 
     def __bool__(self):
         return self.is_loaded
@@ -1,4 +1,7 @@
-from PySide6.QtCore import QSize
+from __future__ import annotations
+
+from PySide6.QtCore import QPoint, QSize
+from PySide6.QtGui import QPainter, QPixmap
 
 from foundry.core.drawable import BLOCK_SIZE, Block
 from foundry.core.geometry import Point
@@ -19,8 +22,12 @@ OVERWORLD_GRAPHIC_SET = 0
 
 
 class WorldMap(LevelLike):
+    _cache: dict[int, WorldMap] = {}
+    _cache_generation: int = -1
+
     def __init__(self, world_index):
         self._internal_world_map = _WorldMap.from_world_number(ROM(), world_index)
+        self._screen_pixmaps: dict[tuple[int, PaletteGroup, int], list[QPixmap]] = {}
 
         super().__init__(0, self._internal_world_map.layout_address)
 
@@ -41,7 +48,77 @@ class WorldMap(LevelLike):
 
         self._calc_size()
 
+    @classmethod
+    def from_cache(cls, world_index: int) -> WorldMap:
+        """
+        Provides a world map which is shared until the ROM is modified, so it is only parsed and rendered once.
+
+        The world map provided should not be edited.
+
+        Parameters
+        ----------
+        world_index : int
+            The world of the world map.
+
+        Returns
+        -------
+        WorldMap
+            The world map of the world.
+        """
+        if cls._cache_generation != ROM.generation:
+            cls._cache.clear()
+            cls._cache_generation = ROM.generation
+        if world_index not in cls._cache:
+            cls._cache[world_index] = cls(world_index)
+        return cls._cache[world_index]
+
+    @property
+    def screen_count(self) -> int:
+        return self.width // WORLD_MAP_SCREEN_WIDTH
+
+    def screen_pixmaps(self, zoom: int) -> list[QPixmap]:
+        """
+        Provides an image of each screen of the world map, which are only rendered again if the ROM or the palette
+        changed.
+
+        Parameters
+        ----------
+        zoom : int
+            The scale of the images.
+
+        Returns
+        -------
+        list[QPixmap]
+            The images of each screen, from left to right.
+        """
+        key = ROM.generation, self.palette_group, zoom
+        if key not in self._screen_pixmaps:
+            self._screen_pixmaps.clear()
+            self._screen_pixmaps[key] = [self._render_screen(screen, zoom) for screen in range(self.screen_count)]
+        return self._screen_pixmaps[key]
+
+    def _render_screen(self, screen: int, zoom: int) -> QPixmap:
+        block_length = BLOCK_SIZE.width * zoom
+
+        pixmap = QPixmap(QSize(WORLD_MAP_SCREEN_WIDTH, WORLD_MAP_HEIGHT) * block_length)
+        painter = QPainter(pixmap)
+        painter.translate(QPoint(-screen * WORLD_MAP_SCREEN_WIDTH * block_length, 0))
+
+        for obj in self.objects:
+            if obj.x_position // WORLD_MAP_SCREEN_WIDTH == screen:
+                obj.draw(painter, block_length)
+
+        painter.end()
+        return pixmap
+
+    def draw_screens(self, painter: QPainter, zoom: int):
+        screen_length = WORLD_MAP_SCREEN_WIDTH * BLOCK_SIZE.width * zoom
+
+        for screen, pixmap in enumerate(self.screen_pixmaps(zoom)):
+            painter.drawPixmap(QPoint(screen * screen_length, 0), pixmap)
+
     def _load_objects(self):
+        self._screen_pixmaps.clear()
         self.objects.clear()
 
         for index, world_position in enumerate(self._internal_world_map.gen_positions()):
@@ -61,6 +138,7 @@ class WorldMap(LevelLike):
         self.size = self.width, self.height
 
     def add_object(self, obj, _):
+        self._screen_pixmaps.clear()
         self.objects.append(obj)
 
         self.objects.sort(key=self._array_index)
@@ -115,6 +193,7 @@ class WorldMap(LevelLike):
         return self.objects[index]
 
     def remove_object(self, obj):
+        self._screen_pixmaps.clear()
         self.objects.remove(obj)
 
     def level_at_position(self, point: Point):
@@ -0,0 +1,295 @@
+from attr import attrs
+from numpy import (
+    array,
+    ascontiguousarray,
+    bool_,
+    concatenate,
+    full,
+    int16,
+    intp,
+    nonzero,
+    ones,
+    take_along_axis,
+    uint8,
+    where,
+    zeros,
+)
+from numpy.typing import NDArray
+from PySide6.QtGui import QImage, qRgb
+
+from foundry.core.drawable import BLOCK_SIZE, MASK_COLOR
+from foundry.core.palette import COLORS_PER_PALETTE, PaletteGroup
+from foundry.game.File import ROM
+from foundry.game.gfx.objects.LevelObject import BLANK, GROUND, LevelObject
+from foundry.game.level.Level import Level
+from foundry.smb3parse.constants import TILESET_BACKGROUND_BLOCKS
+from foundry.smb3parse.levels import LEVEL_MAX_LENGTH
+from foundry.smb3parse.objects.tileset import (
+    DESERT_OBJECT_SET,
+    DUNGEON_OBJECT_SET,
+    ICE_OBJECT_SET,
+)
+
+SPECIAL_BACKGROUND_OBJECTS = [
+    "blue background",
+    "starry background",
+    "underground background under this",
+    "sets background to actual background color",
+]
+
+DUNGEON_BACKGROUND_BLOCK = 140
+DUNGEON_CEILING_BLOCK = 139
+DUNGEON_FLOOR_BLOCKS = ((20, 21), (22, 23))
+DESERT_FLOOR_BLOCK = 86
+ICE_BACKGROUND_BLOCK = 0x80
+
+MASK_INDEX = 4 * COLORS_PER_PALETTE
+"""The pixel index of the mask color, which follows the colors of the four palettes of a palette group."""
+
+
+def _default_blocks(level: Level) -> NDArray[int16]:
+    """
+    Provides the blocks a level is filled with before any object is placed.
+    """
+    grid = full((level.height, level.width), TILESET_BACKGROUND_BLOCKS[level.tileset_number], dtype=int16)
+
+    if level.tileset_number == DUNGEON_OBJECT_SET:
+        grid[:] = DUNGEON_BACKGROUND_BLOCK
+        grid[0] = DUNGEON_CEILING_BLOCK
+        for row, blocks in enumerate(DUNGEON_FLOOR_BLOCKS, GROUND - len(DUNGEON_FLOOR_BLOCKS)):
+            if row < level.height:
+                grid[row, 0::2] = blocks[0]
+                grid[row, 1::2] = blocks[1]
+    elif level.tileset_number == DESERT_OBJECT_SET:
+        if GROUND - 1 < level.height:
+            grid[GROUND - 1] = DESERT_FLOOR_BLOCK
+    elif level.tileset_number == ICE_OBJECT_SET:
+        grid[:] = ICE_BACKGROUND_BLOCK
+
+    return grid
+
+
+def _normalize_block_index(block_index: int) -> int:
+    return block_index if block_index <= 0xFF else ROM().get_byte(block_index)
+
+
+@attrs(slots=True, auto_attribs=True)
+class BlockGrid:
+    """
+    The blocks of a level resolved into arrays, so the level can be rendered in a single pass without any overdraw.
+
+    Attributes
+    ----------
+    layers: NDArray[int16]
+        The blocks of each cell from bottom to top, in the shape of (depth, height, width), where cells above the top
+        of their stack are ``BLANK``.  Only the bottom layer is drawn opaque, every other layer shows the layers below
+        it through its background pixels.
+    depth: NDArray[intp]
+        The amount of layers in the stack of each cell.
+    masked: NDArray[bool_]
+        The cells whose bottom layer is drawn with the mask color instead of the background color.
+    """
+
+    layers: NDArray[int16]
+    depth: NDArray[intp]
+    masked: NDArray[bool_]
+
+    @property
+    def width(self) -> int:
+        return self.layers.shape[2]
+
+    @property
+    def height(self) -> int:
+        return self.layers.shape[1]
+
+    @property
+    def top(self) -> NDArray[int16]:
+        """
+        Provides the top block of every cell of the level.
+
+        Returns
+        -------
+        NDArray[int16]
+            The block indexes in the shape of (height, width).
+        """
+        return take_along_axis(self.layers, (self.depth - 1)[None], 0)[0]
+
+    @classmethod
+    def from_level(cls, level: Level, transparent: bool = True):
+        """
+        Resolves the blocks of the objects of a level, in the order they are stored inside the level.
+
+        Parameters
+        ----------
+        level : Level
+            The level to resolve, whose objects must already be rendered.
+        transparent : bool, optional
+            If the background pixels of objects show the blocks below them, by default True.  Otherwise, each object
+            replaces the blocks below it and shows the mask color in place of its background.
+
+        Returns
+        -------
+        BlockGrid
+            The blocks of the level.
+        """
+        grid = cls(
+            _default_blocks(level)[None],
+            ones((level.height, level.width), dtype=intp),
+            zeros((level.height, level.width), dtype=bool_),
+        )
+
+        for level_object in level.objects:
+            if level_object.name.lower() in SPECIAL_BACKGROUND_OBJECTS:
+                cells = zeros((grid.height, grid.width), dtype=bool_)
+                cells[
+                    max(level_object.point.y, 0) : GROUND,
+                    max(level_object.point.x, 0) : level_object.point.x + LEVEL_MAX_LENGTH,
+                ] = True
+                grid._place_opaque(nonzero(cells), _normalize_block_index(level_object.blocks[0]))
+            else:
+                grid._place(level_object, transparent)
+
+        return grid
+
+    def _place(self, level_object: LevelObject, transparent: bool):
+        width = max(level_object._rendered_size.width, 1)
+        blocks = array(level_object.rendered_blocks, dtype=intp)
+        if not len(blocks):
+            return
+
+        indexes = nonzero(blocks != BLANK)[0]
+        position = level_object.rendered_position
+        ys = position.y + indexes // width
+        xs = position.x + indexes % width
+
+        visible = (ys >= 0) & (ys < self.height) & (xs >= 0) & (xs < self.width)
+        ys, xs, indexes = ys[visible], xs[visible], indexes[visible]
+        if not len(indexes):
+            return
+
+        values = blocks[indexes]
+        if (values > 0xFF).any():
+            values = array([_normalize_block_index(value) for value in values], dtype=intp)
+
+        if transparent:
+            depth = self.depth[ys, xs]
+            if depth.max() >= self.layers.shape[0]:
+                extra = depth.max() + 1 - self.layers.shape[0]
+                self.layers = concatenate([self.layers, full((extra, self.height, self.width), BLANK, dtype=int16)])
+            self.layers[depth, ys, xs] = values
+            self.depth[ys, xs] += 1
+        else:
+            self._place_opaque((ys, xs), values)
+
+    def _place_opaque(self, cells: tuple[NDArray[intp], NDArray[intp]], values: NDArray[intp] | int):
+        ys, xs = cells
+        self.layers[0, ys, xs] = values
+        self.layers[1:, ys, xs] = BLANK
+        self.depth[ys, xs] = 1
+        self.masked[ys, xs] = True
+
+    def to_indexes(
+        self, atlas: NDArray[uint8], x: int = 0, y: int = 0, width: int | None = None, height: int | None = None
+    ) -> NDArray[uint8]:
+        """
+        Expands an area of the grid into the pixel indexes of a palette group.
+
+        Parameters
+        ----------
+        atlas : NDArray[uint8]
+            The pixel indexes of every block, as provided by `block_atlas`.
+        x : int, optional
+            The left most column of the area in blocks, by default 0.
+        y : int, optional
+            The top most row of the area in blocks, by default 0.
+        width : int | None, optional
+            The width of the area in blocks, by default None or to the right side of the grid.
+        height : int | None, optional
+            The height of the area in blocks, by default None or to the bottom of the grid.
+
+        Returns
+        -------
+        NDArray[uint8]
+            The pixel indexes of the area, where `MASK_INDEX` is the mask color.
+        """
+        width = self.width - x if width is None else width
+        height = self.height - y if height is None else height
+        layers = self.layers[:, y : y + height, x : x + width]
+        height, width = layers.shape[1:]
+
+        pixels = atlas[layers[0]]
+        masked = self.masked[y : y + height, x : x + width, None, None] & (pixels % COLORS_PER_PALETTE == 0)
+        pixels = where(masked, uint8(MASK_INDEX), pixels)
+
+        for layer in layers[1:]:
+            present = layer != BLANK
+            if not present.any():
+                continue
+            layer_pixels = atlas[where(present, layer, 0)]
+            pixels = where(present[..., None, None] & (layer_pixels % COLORS_PER_PALETTE != 0), layer_pixels, pixels)
+
+        return pixels.transpose(0, 2, 1, 3).reshape(height * BLOCK_SIZE.height, width * BLOCK_SIZE.width)
+
+    def to_image(
+        self,
+        atlas: NDArray[uint8],
+        palette_group: PaletteGroup,
+        x: int = 0,
+        y: int = 0,
+        width: int | None = None,
+        height: int | None = None,
+    ) -> QImage:
+        """
+        Renders an area of the grid.
+
+        Parameters
+        ----------
+        atlas : NDArray[uint8]
+            The pixel indexes of every block, as provided by `block_atlas`.
+        palette_group : PaletteGroup
+            The palette group the pixel indexes refer to.
+        x : int, optional
+            The left most column of the area in blocks, by default 0.
+        y : int, optional
+            The top most row of the area in blocks, by default 0.
+        width : int | None, optional
+            The width of the area in blocks, by default None or to the right side of the grid.
+        height : int | None, optional
+            The height of the area in blocks, by default None or to the bottom of the grid.
+
+        Returns
+        -------
+        QImage
+            A premultiplied ARGB image of the area.
+        """
+        pixels = ascontiguousarray(self.to_indexes(atlas, x, y, width, height))
+        image = QImage(pixels.data, pixels.shape[1], pixels.shape[0], pixels.shape[1], QImage.Format.Format_Indexed8)
+        image.setColorTable(color_table(palette_group))
+
+        # Converting copies the pixels, so the image does not outlive the array it was created from.
+        return image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+
+
+def color_table(palette_group: PaletteGroup) -> list[int]:
+    """
+    Provides the colors of the pixel indexes of a palette group.
+
+    Parameters
+    ----------
+    palette_group : PaletteGroup
+        The palette group to provide the colors of.
+
+    Returns
+    -------
+    list[int]
+        The RGB value of each pixel index, followed by the mask color.
+    """
+    colors = [qRgb(0, 0, 0)] * MASK_INDEX
+    for palette_index, palette in enumerate(palette_group.palettes[: MASK_INDEX // COLORS_PER_PALETTE]):
+        table = palette.rgb_table
+        for color_index in range(min(COLORS_PER_PALETTE, len(table) // 3)):
+            colors[palette_index * COLORS_PER_PALETTE + color_index] = qRgb(
+                *table[color_index * 3 : color_index * 3 + 3]
+            )
+
+    return colors + [qRgb(*MASK_COLOR.to_rgb_bytes())]
@@ -0,0 +1,315 @@
+from pathlib import Path
+from struct import unpack
+from zipfile import ZIP_STORED, ZipFile
+
+from attr import attrs
+from numpy import (
+    array,
+    concatenate,
+    cumsum,
+    dtype,
+    int16,
+    int32,
+    int64,
+    memmap,
+    savez,
+    savez_compressed,
+    uint8,
+    uint16,
+    zeros,
+)
+from numpy.lib.format import (
+    read_array,
+    read_array_header_1_0,
+    read_array_header_2_0,
+    read_magic,
+)
+from numpy.typing import NDArray
+
+from foundry.game.level.block_grid import BlockGrid
+from foundry.game.level.Level import Level
+
+HEADER_FIELDS: tuple[str, ...] = (
+    "start_y_index",
+    "screens",
+    "start_x_index",
+    "enemy_palette_index",
+    "object_palette_index",
+    "pipe_ends_level",
+    "scroll_type_index",
+    "is_vertical",
+    "jump_tileset_number",
+    "start_action",
+    "graphic_set_index",
+    "time_index",
+    "music_index",
+    "jump_level_address",
+    "jump_enemy_address",
+)
+"""The fields of the level header which are exported for each level."""
+
+LEVEL_DTYPE = dtype(
+    [
+        ("generator_pointer", int32),
+        ("enemy_pointer", int32),
+        ("tileset", uint8),
+        ("width", uint16),
+        ("height", uint16),
+        *[(field, int32) for field in HEADER_FIELDS],
+        ("blocks_offset", int64),
+        ("objects_offset", int64),
+        ("objects_count", int32),
+        ("enemies_offset", int64),
+        ("enemies_count", int32),
+    ]
+)
+
+OBJECT_DTYPE = dtype(
+    [
+        ("level", int32),
+        ("domain", uint8),
+        ("index", uint8),
+        ("x", int16),
+        ("y", int16),
+        ("length", int16),
+        ("size", uint8),
+    ]
+)
+
+ENEMY_DTYPE = dtype([("level", int32), ("index", uint8), ("x", int16), ("y", int16)])
+
+_LOCAL_FILE_HEADER_SIZE = 30
+
+
+@attrs(slots=True, auto_attribs=True)
+class LevelTables:
+    """
+    The data of a single level, as it is stored inside a level dataset.
+
+    Attributes
+    ----------
+    name: str
+        The name of the level.
+    level: NDArray
+        A single row of `LEVEL_DTYPE`, whose offsets are not assigned yet.
+    blocks: NDArray[int16]
+        The top block of every cell of the level, in the shape of (height, width).
+    objects: NDArray
+        The rows of `OBJECT_DTYPE` of the objects of the level, in the order they are stored inside the level.
+    enemies: NDArray
+        The rows of `ENEMY_DTYPE` of the enemies of the level, in the order they are stored inside the level.
+    """
+
+    name: str
+    level: NDArray
+    blocks: NDArray[int16]
+    objects: NDArray
+    enemies: NDArray
+
+    @classmethod
+    def from_level(cls, level: Level, generator_pointer: int, enemy_pointer: int):
+        """
+        Resolves a level into its tables.
+
+        Parameters
+        ----------
+        level : Level
+            The level to resolve.
+        generator_pointer : int
+            The location of the objects of the level, as listed inside the level list of the ROM.
+        enemy_pointer : int
+            The location of the enemies of the level, as listed inside the level list of the ROM.
+
+        Returns
+        -------
+        LevelTables
+            The tables of the level.
+        """
+        for level_object in level.objects:
+            level_object.render()
+
+        row = zeros(1, dtype=LEVEL_DTYPE)
+        row["generator_pointer"] = generator_pointer
+        row["enemy_pointer"] = enemy_pointer
+        row["tileset"] = level.tileset_number
+        row["width"] = level.width
+        row["height"] = level.height
+        for field in HEADER_FIELDS:
+            row[field] = int(getattr(level.header, field))
+        row["objects_count"] = len(level.objects)
+        row["enemies_count"] = len(level.enemies)
+
+        return cls(
+            level.name,
+            row,
+            BlockGrid.from_level(level).top,
+            array(
+                [
+                    (0, obj.domain, obj.obj_index, obj.point.x, obj.point.y, obj.length, obj.size)
+                    for obj in level.objects
+                ],
+                dtype=OBJECT_DTYPE,
+            ),
+            array([(0, enemy.obj_index, enemy.point.x, enemy.point.y) for enemy in level.enemies], dtype=ENEMY_DTYPE),
+        )
+
+
+@attrs(slots=True, auto_attribs=True)
+class LevelDataset:
+    """
+    The levels of a ROM resolved into flat tables, which can be saved to and loaded from a NumPy archive.
+
+    The blocks, objects, and enemies of every level are concatenated, where each level stores the offset and the
+    amount of its rows inside each table.
+
+    Attributes
+    ----------
+    names: NDArray
+        The name of each level.
+    levels: NDArray
+        A row of `LEVEL_DTYPE` for each level.
+    blocks: NDArray[int16]
+        The top block of every cell of every level, flattened row by row.
+    objects: NDArray
+        The rows of `OBJECT_DTYPE` of every level, where `level` is the index of the level of the object.
+    enemies: NDArray
+        The rows of `ENEMY_DTYPE` of every level, where `level` is the index of the level of the enemy.
+    """
+
+    names: NDArray
+    levels: NDArray
+    blocks: NDArray[int16]
+    objects: NDArray
+    enemies: NDArray
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    @classmethod
+    def from_tables(cls, tables: list[LevelTables]):
+        """
+        Concatenates the tables of levels into a dataset.
+
+        Parameters
+        ----------
+        tables : list[LevelTables]
+            The tables of each level, in the order of the dataset.
+
+        Returns
+        -------
+        LevelDataset
+            The dataset of the levels.
+        """
+        levels = concatenate([table.level for table in tables]) if tables else zeros(0, dtype=LEVEL_DTYPE)
+        objects = concatenate([table.objects for table in tables] + [zeros(0, dtype=OBJECT_DTYPE)])
+        enemies = concatenate([table.enemies for table in tables] + [zeros(0, dtype=ENEMY_DTYPE)])
+
+        block_counts = array([table.blocks.size for table in tables], dtype=int64)
+        levels["blocks_offset"] = cumsum(block_counts) - block_counts
+        levels["objects_offset"] = cumsum(levels["objects_count"], dtype=int64) - levels["objects_count"]
+        levels["enemies_offset"] = cumsum(levels["enemies_count"], dtype=int64) - levels["enemies_count"]
+
+        for index, table in enumerate(tables):
+            objects["level"][levels["objects_offset"][index] :][: len(table.objects)] = index
+            enemies["level"][levels["enemies_offset"][index] :][: len(table.enemies)] = index
+
+        return cls(
+            array([table.name for table in tables], dtype=str),
+            levels,
+            concatenate([table.blocks.ravel() for table in tables] + [zeros(0, dtype=int16)]),
+            objects,
+            enemies,
+        )
+
+    def level_blocks(self, index: int) -> NDArray[int16]:
+        """
+        Provides the top block of every cell of a level, without copying them.
+
+        Parameters
+        ----------
+        index : int
+            The index of the level.
+
+        Returns
+        -------
+        NDArray[int16]
+            The block indexes in the shape of (height, width).
+        """
+        level = self.levels[index]
+        offset, height, width = int(level["blocks_offset"]), int(level["height"]), int(level["width"])
+        return self.blocks[offset : offset + height * width].reshape(height, width)
+
+    def level_objects(self, index: int) -> NDArray:
+        offset = int(self.levels[index]["objects_offset"])
+        return self.objects[offset : offset + int(self.levels[index]["objects_count"])]
+
+    def level_enemies(self, index: int) -> NDArray:
+        offset = int(self.levels[index]["enemies_offset"])
+        return self.enemies[offset : offset + int(self.levels[index]["enemies_count"])]
+
+    def save(self, path: Path, compress: bool = False):
+        """
+        Saves the dataset to a NumPy archive.
+
+        Parameters
+        ----------
+        path : Path
+            The path of the archive.
+        compress : bool, optional
+            If the archive is compressed, by default False.  A compressed archive is smaller, but it has to be
+            decompressed into memory when it is loaded, instead of being memory mapped.
+        """
+        (savez_compressed if compress else savez)(
+            path, names=self.names, levels=self.levels, blocks=self.blocks, objects=self.objects, enemies=self.enemies
+        )
+
+    @classmethod
+    def load(cls, path: Path):
+        """
+        Loads a dataset from a NumPy archive, memory mapping every array which was not compressed.
+
+        Parameters
+        ----------
+        path : Path
+            The path of the archive.
+
+        Returns
+        -------
+        LevelDataset
+            The dataset of the archive.
+        """
+        arrays = _load_archive(path)
+        return cls(arrays["names"], arrays["levels"], arrays["blocks"], arrays["objects"], arrays["enemies"])
+
+
+def _load_archive(path: Path) -> dict[str, NDArray]:
+    arrays = {}
+
+    with ZipFile(path) as archive, open(path, "rb") as file:
+        for info in archive.infolist():
+            name = info.filename.removesuffix(".npy")
+
+            with archive.open(info) as member:
+                if info.compress_type != ZIP_STORED:
+                    arrays[name] = read_array(member, allow_pickle=False)
+                    continue
+
+                version = read_magic(member)
+                read_header = read_array_header_1_0 if version == (1, 0) else read_array_header_2_0
+                shape, fortran_order, array_dtype = read_header(member)
+                array_header_size = member.tell()
+
+            # The offset of the data of a member is only stored inside its own local file header.
+            file.seek(info.header_offset)
+            local_header = file.read(_LOCAL_FILE_HEADER_SIZE)
+            name_size, extra_size = unpack("<HH", local_header[26:30])
+            offset = info.header_offset + _LOCAL_FILE_HEADER_SIZE + name_size + extra_size + array_header_size
+
+            if not shape or 0 in shape:
+                arrays[name] = zeros(shape, dtype=array_dtype)
+            else:
+                arrays[name] = memmap(
+                    path, array_dtype, "r", offset, shape, order="F" if fortran_order else "C"  # type: ignore
+                )
+
+    return arrays
@@ -66,6 +66,10 @@ def open_file(parent: QWidget, path: str | None = None) -> str | None:
 
 
 class GraphicEditor(MainWindow):
+    max_undo_depth = 500
+    max_undo_size = 64 * 1024 * 1024
+    undo_compaction_interval = 100
+
     _updated = Signal()
 
     _file_path: str | None = None
@@ -3,18 +3,16 @@ from PySide6.QtCore import QPoint, QRect, Signal, SignalInstance
 from PySide6.QtGui import (
     QBrush,
     QCloseEvent,
-    QColor,
     QImage,
     QMouseEvent,
     QPainter,
     QPaintEvent,
     QResizeEvent,
-    Qt,
 )
 from PySide6.QtWidgets import QLayout, QStatusBar, QToolBar, QWidget
 
 from foundry import icon
-from foundry.core.drawable import BLOCK_SIZE, MASK_COLOR, Block, block_to_image
+from foundry.core.drawable import BLOCK_SIZE, Block, block_to_image
 from foundry.core.geometry import Point
 from foundry.core.graphics_set.GraphicsSet import GraphicsSet
 from foundry.core.palette import PaletteGroup
@@ -221,7 +219,5 @@ class BlockEditorView(QWidget):
         painter.drawRect(QRect(QPoint(0, 0), self.size()))
 
         block: Block = Block.from_tsa(Point(0, 0), self.block_index, self.tsa_data)
-        image: QImage = block_to_image(block, self.palette_group, self.graphics_set, self.block_scale).copy()
-        mask: QImage = image.createMaskFromColor(QColor(*MASK_COLOR).rgb(), Qt.MaskMode.MaskOutColor)
-        image.setAlphaChannel(mask)
+        image: QImage = block_to_image(block, self.palette_group, self.graphics_set, self.block_scale, transparent=True)
         painter.drawImage(QPoint(0, 0), image)
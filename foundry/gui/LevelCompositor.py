@@ -0,0 +1,263 @@
+from logging import Logger, NullHandler, getLogger
+from threading import Lock
+from typing import ClassVar, Literal
+
+from attr import attrs
+from PySide6.QtCore import (
+    QObject,
+    QRect,
+    QRunnable,
+    QThreadPool,
+    Signal,
+    SignalInstance,
+)
+from PySide6.QtGui import QColor, QImage, QPainter, Qt
+
+from foundry.core.drawable import BLOCK_SIZE
+from foundry.game.level.Level import Level
+from foundry.gui.LevelDrawer import LevelDrawer
+
+LOGGER_NAME: Literal["COMPOSITOR"] = "COMPOSITOR"
+
+log: Logger = getLogger(LOGGER_NAME)
+log.addHandler(NullHandler())
+
+
+class _CompositorSignaller(QObject):
+    chunk_finished: SignalInstance = Signal()
+
+
+def _snapshot(level: Level) -> Level:
+    """
+    Copies a level, so it can be drawn from other threads while the original level is edited.
+
+    Parameters
+    ----------
+    level : Level
+        The level to copy.
+
+    Returns
+    -------
+    Level
+        A level which is detached from the ROM and from any view, with the same objects, enemies, and selection.
+    """
+    snapshot = Level(level.name, tileset=level.tileset_number)
+    snapshot.from_bytes(*level.to_bytes())
+
+    for copied, original in zip(snapshot.get_all_objects(), level.get_all_objects()):
+        copied.selected = original.selected
+
+    return snapshot
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True)
+class _Frame:
+    """
+    The state a frame is drawn from, which is never modified once the frame was requested.
+
+    Attributes
+    ----------
+    generation: int
+        The frame of the compositor.
+    level: Level
+        A snapshot of the level, which was prepared by `drawer`.
+    drawer: LevelDrawer
+        A drawer which is only used by the chunks of this frame.
+    """
+
+    generation: int
+    level: Level
+    drawer: LevelDrawer
+
+
+class _ChunkTask(QRunnable):
+    """
+    Draws a single chunk of a level into an image from a thread of a thread pool.
+
+    Attributes
+    ----------
+    compositor: LevelCompositor
+        The compositor which receives the chunk.
+    frame: _Frame
+        The frame which the chunk belongs to.
+    rect: QRect
+        The part of the level the chunk covers, in pixels.
+    """
+
+    def __init__(self, compositor: "LevelCompositor", frame: _Frame, rect: QRect):
+        super().__init__()
+        self.compositor = compositor
+        self.frame = frame
+        self.rect = rect
+
+    def run(self):
+        if self.frame.generation != self.compositor.generation:
+            return
+
+        image = QImage(self.rect.size(), QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(image)
+        try:
+            painter.translate(-self.rect.topLeft())
+            painter.setClipRect(self.rect)
+            self.frame.drawer.draw(painter, self.frame.level, self.rect, prepare=False)
+        except Exception:
+            log.exception(f"Failed to draw the chunk at {self.rect} of frame {self.frame.generation}")
+            return
+        finally:
+            painter.end()
+
+        self.compositor._deliver(self.frame.generation, self.rect, image)
+
+
+class LevelCompositor(QObject):
+    """
+    Draws levels in chunks from a pool of background threads, so the thread of the user interface only has to blit
+    the finished chunks.
+
+    Until the chunks of a new frame are finished, the chunks of the previous frame are drawn in their place.
+
+    Each frame is drawn from a snapshot of the level and a drawer of its own, so the level can be edited and new
+    frames can be requested while the chunks of previous frames are still being drawn.
+
+    Attributes
+    ----------
+    CHUNK_LENGTH: ClassVar[int]
+        The width and height of a chunk in blocks.
+    drawer: LevelDrawer
+        The drawer whose settings each frame is drawn with.
+    thread_pool: QThreadPool
+        The threads which draw the chunks.
+    level: Level | None
+        The level of the current frame.
+    generation: int
+        The current frame, which is incremented every time a new frame is requested.
+    revision: int
+        The version of the images drawn by `draw`, which is incremented every time a frame is requested and every time
+        a chunk is finished, so images derived from them can be cached.
+    chunks: dict[tuple[int, int], QImage]
+        The latest finished image of each chunk, keyed by the position of the chunk in pixels.
+    pending: dict[tuple[int, int], QRect]
+        The chunks of the current frame which are not finished yet, keyed by their position in pixels.
+    placeholder: QColor
+        The color drawn in place of a pending chunk, which has no image from a previous frame.
+    """
+
+    CHUNK_LENGTH: ClassVar[int] = 32
+
+    placeholder: QColor = QColor(0x80, 0x80, 0x80)
+
+    frame_changed: SignalInstance = Signal()
+
+    def __init__(self, drawer: LevelDrawer, parent: QObject | None = None):
+        super().__init__(parent)
+        self.drawer = drawer
+        self.thread_pool = QThreadPool(self)
+        self.level: Level | None = None
+        self.generation = 0
+        self.revision = 0
+        self.chunks: dict[tuple[int, int], QImage] = {}
+        self.pending: dict[tuple[int, int], QRect] = {}
+
+        self._lock = Lock()
+        self._signaller = _CompositorSignaller()
+        self._signaller.chunk_finished.connect(self.frame_changed)
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(frame {self.generation}, {len(self.pending)} pending)"
+
+    def chunk_rects(self, level: Level) -> list[QRect]:
+        """
+        Splits a level into the chunks it is drawn in.
+
+        Parameters
+        ----------
+        level : Level
+            The level to split.
+
+        Returns
+        -------
+        list[QRect]
+            The chunks of the level, in pixels.
+        """
+        level_rect = level.get_rect(BLOCK_SIZE.width).to_qt()
+        length = self.CHUNK_LENGTH * BLOCK_SIZE.width
+
+        return [
+            QRect(x, y, length, length).intersected(level_rect)
+            for y in range(0, level_rect.height(), length)
+            for x in range(0, level_rect.width(), length)
+        ]
+
+    def request(self, level: Level):
+        """
+        Starts drawing a new frame of a level, abandoning any chunks of previous frames which did not start yet.
+
+        Parameters
+        ----------
+        level : Level
+            The level to draw.
+        """
+        self.thread_pool.clear()
+        self.level = level
+
+        drawer = LevelDrawer(self.drawer.user_settings, self.drawer.use_block_grid)
+        snapshot = _snapshot(level)
+        drawer.prepare(snapshot)
+
+        rects = self.chunk_rects(level)
+
+        with self._lock:
+            self.generation += 1
+            self.revision += 1
+            self.pending = {(rect.x(), rect.y()): rect for rect in rects}
+            self.chunks = {position: image for position, image in self.chunks.items() if position in self.pending}
+            frame = _Frame(self.generation, snapshot, drawer)
+
+        for rect in rects:
+            self.thread_pool.start(_ChunkTask(self, frame, rect))
+
+    def _deliver(self, generation: int, rect: QRect, image: QImage):
+        with self._lock:
+            if generation != self.generation:
+                return
+            self.chunks[(rect.x(), rect.y())] = image
+            self.revision += 1
+            self.pending.pop((rect.x(), rect.y()), None)
+
+        self._signaller.chunk_finished.emit()
+
+    def wait(self, timeout: int = -1) -> bool:
+        """
+        Waits for the chunks of the current frame to finish.
+
+        Parameters
+        ----------
+        timeout : int, optional
+            The maximum amount of milliseconds to wait, by default -1 or infinite.
+
+        Returns
+        -------
+        bool
+            If every chunk finished in the alloted amount of time.
+        """
+        return self.thread_pool.waitForDone(timeout)
+
+    def draw(self, painter: QPainter):
+        """
+        Blits the latest finished image of each chunk, or a placeholder if a chunk was never finished.
+
+        Parameters
+        ----------
+        painter : QPainter
+            The painter to draw the chunks with.
+        """
+        with self._lock:
+            chunks = list(self.chunks.items())
+            placeholders = [rect for position, rect in self.pending.items() if position not in self.chunks]
+
+        for rect in placeholders:
+            painter.fillRect(rect, self.placeholder)
+        for (x, y), image in chunks:
+            painter.drawImage(x, y, image)
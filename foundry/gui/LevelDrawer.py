@@ -1,13 +1,15 @@
-from itertools import product
+from functools import lru_cache
 from json import loads
 
+from numpy import uint8
+from numpy.typing import NDArray
 from PySide6.QtCore import QPoint, QRect
 from PySide6.QtGui import QBrush, QColor, QImage, QPainter, QPen, Qt
 
 from foundry import data_dir, namespace_path
 from foundry.core.drawable import BLOCK_SIZE, MASK_COLOR, Block
 from foundry.core.drawable import Drawable as DrawableValidator
-from foundry.core.drawable import apply_selection_overlay, block_to_image
+from foundry.core.drawable import apply_selection_overlay, block_atlas, block_to_image
 from foundry.core.geometry import Point
 from foundry.core.graphics_set.GraphicsSet import GraphicsSet
 from foundry.core.icon import Icon
@@ -26,6 +28,15 @@ from foundry.game.gfx.objects.ObjectLike import (
     EXPANDS_HORIZ,
     EXPANDS_VERT,
 )
+from foundry.game.level.block_grid import (
+    DESERT_FLOOR_BLOCK,
+    DUNGEON_BACKGROUND_BLOCK,
+    DUNGEON_CEILING_BLOCK,
+    DUNGEON_FLOOR_BLOCKS,
+    ICE_BACKGROUND_BLOCK,
+    SPECIAL_BACKGROUND_OBJECTS,
+    BlockGrid,
+)
 from foundry.game.level.Level import Level
 from foundry.gui.AutoScrollDrawer import AutoScrollDrawer
 from foundry.gui.settings import UserSettings
@@ -102,58 +113,173 @@ ITEM_ARROW = lambda: level_images["item_arrow"].image()  # noqa: E731
 EMPTY_IMAGE = lambda: level_images["empty"].image()  # noqa: E731
 
 
-SPECIAL_BACKGROUND_OBJECTS = [
-    "blue background",
-    "starry background",
-    "underground background under this",
-    "sets background to actual background color",
-]
+CULLING_MARGIN = 4
+"""The amount of blocks outside of a region, where objects are still drawn when only the region is drawn."""
 
 
-def _block_from_index(block_index: int, scale_factor: int, level: Level, transparent: bool = False) -> QImage:
+@lru_cache(2**6)
+def _block_pattern(
+    blocks: tuple[tuple[Block, ...], ...],
+    palette_group: PaletteGroup,
+    graphics_set: GraphicsSet,
+    scale_factor: int,
+    use_background_color: bool = True,
+) -> QImage:
     """
-    Returns the block at the given index, from the TSA table for the given level.
+    Renders a repeating pattern of blocks once, so an area can be tiled with it in a single fill.
+
+    Parameters
+    ----------
+    blocks : tuple[tuple[Block, ...], ...]
+        The rows of blocks that compose a single repetition of the pattern.
+    palette_group : PaletteGroup
+        The palette group to render the blocks with.
+    graphics_set : GraphicsSet
+        The graphics set to render the blocks with.
+    scale_factor : int
+        The length of a block in pixels.
+    use_background_color : bool, optional
+        If the natural background color should be used or if a mask color should be applied, by default True.
+
+    Returns
+    -------
+    QImage
+        The pattern of the blocks.
     """
+    image = QImage(len(blocks[0]) * scale_factor, len(blocks) * scale_factor, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(image)
+    for y, row in enumerate(blocks):
+        for x, block in enumerate(row):
+            painter.drawImage(
+                QPoint(x * scale_factor, y * scale_factor),
+                block_to_image(block, palette_group, graphics_set, scale_factor, use_background_color),
+            )
+    painter.end()
+
+    return image
+
 
+def _pattern_from_indexes(indexes: tuple[tuple[int, ...], ...], scale_factor: int, level: Level) -> QImage:
+    """
+    Returns the pattern of the blocks at the given indexes, from the TSA table for the given level.
+    """
     palette_group: PaletteGroup = PaletteGroup.from_tileset(level.tileset_number, level.header.object_palette_index)
     graphics_set: GraphicsSet = GraphicsSet.from_tileset(level.header.graphic_set_index)
     tsa_data: bytearray = ROM().get_tsa_data(level.tileset_number)
-    block: Block = Block.from_tsa(Point(0, 0), block_index, tsa_data)
+    blocks = tuple(tuple(Block.from_tsa(Point(0, 0), index, tsa_data) for index in row) for row in indexes)
 
-    if transparent:
-        image: QImage = block_to_image(block, palette_group, graphics_set, scale_factor).copy()
-        mask: QImage = image.createMaskFromColor(QColor(*MASK_COLOR).rgb(), Qt.MaskMode.MaskOutColor)
-        image.setAlphaChannel(mask)
-    else:
-        image: QImage = block_to_image(block, palette_group, graphics_set, scale_factor, True)
+    return _block_pattern(blocks, palette_group, graphics_set, scale_factor)
 
-    return image
+
+def _fill_with_pattern(painter: QPainter, rect: QRect, pattern: QImage):
+    """
+    Tiles an area with a pattern, starting at the top left corner of the area.
+    """
+    if rect.isEmpty():
+        return
+
+    painter.save()
+    painter.setBrushOrigin(rect.topLeft())
+    painter.fillRect(rect, QBrush(pattern))
+    painter.restore()
 
 
 class LevelDrawer:
-    def __init__(self, user_settings: UserSettings):
+    def __init__(self, user_settings: UserSettings, use_block_grid: bool = True):
         self.user_settings = user_settings
 
         self.block_length = BLOCK_SIZE.width
 
+        # Draws the blocks of the level from a block grid in one pass, instead of drawing each object over the others.
+        self.use_block_grid = use_block_grid
+        self.block_grid: BlockGrid | None = None
+        self.block_atlas: NDArray[uint8] | None = None
+        self.block_palette_group: PaletteGroup | None = None
+
+        # Outlines are cosmetic, so they stay a single pixel wide when the level is zoomed by a painter transform.
+        self.outline_pen = QPen(QColor(0x00, 0x00, 0x00, 0xFF))
+        self.outline_pen.setCosmetic(True)
         self.grid_pen = QPen(QColor(0x80, 0x80, 0x80, 0x80))
         self.grid_pen.setWidth(1)
+        self.grid_pen.setCosmetic(True)
         self.screen_pen = QPen(QColor(0xFF, 0x00, 0x00, 0xFF))
         self.screen_pen.setWidth(1)
+        self.screen_pen.setCosmetic(True)
+
+    def prepare(self, level: Level):
+        """
+        Readies the objects of a level to be drawn, by rendering them with the palettes of the level.
+
+        Parameters
+        ----------
+        level : Level
+            The level to prepare.
+
+        Notes
+        -----
+        This modifies the objects of the level, so it must be done from the thread which owns the level before the
+        level is drawn from any other thread.
+        """
+        if namespace is None:
+            load_namespace()
+
+        bg_palette_group = PaletteGroup.from_tileset(level.tileset_number, level.header.object_palette_index)
+        spr_palette_group = PaletteGroup.from_tileset(level.tileset_number, 8 + level.header.enemy_palette_index)
 
-    def draw(self, painter: QPainter, level: Level):
-        self._draw_background(painter, level)
+        for level_object in level.objects:
+            level_object.palette_group = bg_palette_group
+        for enemy in level.enemies:
+            enemy.palette_group = spr_palette_group
 
-        self._draw_default_graphics(painter, level)
+        for level_object in level.get_all_objects():
+            level_object.render()
 
-        if level.tileset_number == DESERT_OBJECT_SET:
-            self._draw_desert_default_graphics(painter, level)
-        elif level.tileset_number == DUNGEON_OBJECT_SET:
-            self._draw_dungeon_default_graphics(painter, level)
-        elif level.tileset_number == ICE_OBJECT_SET:
-            self._draw_ice_default_graphics(painter, level)
+        if self.use_block_grid:
+            self.block_grid = BlockGrid.from_level(level, self.user_settings.block_transparency)
+            self.block_atlas = block_atlas(
+                bytes(ROM().get_tsa_data(level.tileset_number)),
+                bytes(GraphicsSet.from_tileset(level.header.graphic_set_index)),
+            )
+            self.block_palette_group = bg_palette_group
+
+    def draw(self, painter: QPainter, level: Level, region: QRect | None = None, prepare: bool = True):
+        """
+        Draws a level.
+
+        Parameters
+        ----------
+        painter : QPainter
+            The painter to draw the level with.
+        level : Level
+            The level to draw.
+        region : QRect | None, optional
+            The part of the level that will be visible, so objects outside of it can be skipped, by default None or
+            the entire level.
+        prepare : bool, optional
+            If the level should be prepared first, by default True.
+        """
+        if prepare:
+            self.prepare(level)
+
+        painter.setPen(self.outline_pen)
+
+        if self.use_block_grid:
+            self._draw_block_grid(painter, level, region)
+        else:
+            self._draw_background(painter, level)
+
+            self._draw_default_graphics(painter, level)
 
-        self._draw_objects(painter, level)
+            if level.tileset_number == DESERT_OBJECT_SET:
+                self._draw_desert_default_graphics(painter, level)
+            elif level.tileset_number == DUNGEON_OBJECT_SET:
+                self._draw_dungeon_default_graphics(painter, level)
+            elif level.tileset_number == ICE_OBJECT_SET:
+                self._draw_ice_default_graphics(painter, level)
+
+        self._draw_objects(painter, level, region)
 
         self._draw_overlays(painter, level)
 
@@ -172,6 +298,31 @@ class LevelDrawer:
         if self.user_settings.draw_autoscroll:
             self._draw_auto_scroll(painter, level)
 
+    def _draw_block_grid(self, painter: QPainter, level: Level, region: QRect | None = None):
+        assert self.block_grid is not None and self.block_atlas is not None and self.block_palette_group is not None
+
+        if region is None:
+            region = level.get_rect(self.block_length).to_qt()
+
+        left, top = max(region.left() // self.block_length, 0), max(region.top() // self.block_length, 0)
+        right = min(region.right() // self.block_length + 1, self.block_grid.width)
+        bottom = min(region.bottom() // self.block_length + 1, self.block_grid.height)
+        if right <= left or bottom <= top:
+            return
+
+        image = self.block_grid.to_image(
+            self.block_atlas, self.block_palette_group, left, top, right - left, bottom - top
+        )
+        painter.drawImage(
+            QRect(
+                left * self.block_length,
+                top * self.block_length,
+                (right - left) * self.block_length,
+                (bottom - top) * self.block_length,
+            ),
+            image,
+        )
+
     def _draw_background(self, painter: QPainter, level: Level):
         painter.save()
 
@@ -189,80 +340,92 @@ class LevelDrawer:
         painter.restore()
 
     def _draw_dungeon_default_graphics(self, painter: QPainter, level: Level):
-        # draw_background
-        bg_block = _block_from_index(140, self.block_length, level)
+        width = level.width * self.block_length
 
-        for x, y in product(range(level.width), range(level.height)):
-            painter.drawImage(QPoint(x * self.block_length, y * self.block_length), bg_block)
+        # draw_background
+        _fill_with_pattern(
+            painter,
+            level.get_rect(self.block_length).to_qt(),
+            _pattern_from_indexes(((DUNGEON_BACKGROUND_BLOCK,),), self.block_length, level),
+        )
 
         # draw ceiling
-        ceiling_block = _block_from_index(139, self.block_length, level)
-
-        for x in range(level.width):
-            painter.drawImage(QPoint(x * self.block_length, 0), ceiling_block)
+        _fill_with_pattern(
+            painter,
+            QRect(0, 0, width, self.block_length),
+            _pattern_from_indexes(((DUNGEON_CEILING_BLOCK,),), self.block_length, level),
+        )
 
         # draw floor
-        upper_floor_blocks = [
-            _block_from_index(20, self.block_length, level),
-            _block_from_index(21, self.block_length, level),
-        ]
-        lower_floor_blocks = [
-            _block_from_index(22, self.block_length, level),
-            _block_from_index(23, self.block_length, level),
-        ]
-
-        upper_y = (GROUND - 2) * self.block_length
-        lower_y = (GROUND - 1) * self.block_length
-
-        for block_x in range(level.width):
-            pixel_x = block_x * self.block_length
-            painter.drawImage(QPoint(pixel_x, upper_y), upper_floor_blocks[block_x % 2])
-            painter.drawImage(QPoint(pixel_x, lower_y), lower_floor_blocks[block_x % 2])
+        _fill_with_pattern(
+            painter,
+            QRect(0, (GROUND - 2) * self.block_length, width, 2 * self.block_length),
+            _pattern_from_indexes(DUNGEON_FLOOR_BLOCKS, self.block_length, level),
+        )
 
     def _draw_desert_default_graphics(self, painter: QPainter, level: Level):
-        floor_level = (GROUND - 1) * self.block_length
-        floor_block_index = 86
-        floor_block = _block_from_index(floor_block_index, self.block_length, level)
-
-        for x in range(level.width):
-            painter.drawImage(QPoint(x * self.block_length, floor_level), floor_block)
+        _fill_with_pattern(
+            painter,
+            QRect(0, (GROUND - 1) * self.block_length, level.width * self.block_length, self.block_length),
+            _pattern_from_indexes(((DESERT_FLOOR_BLOCK,),), self.block_length, level),
+        )
 
     def _draw_ice_default_graphics(self, painter: QPainter, level: Level):
-        bg_block = _block_from_index(0x80, self.block_length, level)
-
-        for x, y in product(range(level.width), range(level.height)):
-            painter.drawImage(QPoint(x * self.block_length, y * self.block_length), bg_block)
+        _fill_with_pattern(
+            painter,
+            level.get_rect(self.block_length).to_qt(),
+            _pattern_from_indexes(((ICE_BACKGROUND_BLOCK,),), self.block_length, level),
+        )
 
     def _draw_default_graphics(self, painter: QPainter, level: Level):
-        bg_block = _block_from_index(TILESET_BACKGROUND_BLOCKS[level.tileset_number], self.block_length, level)
-
-        for x, y in product(range(level.width), range(level.height)):
-            painter.drawImage(QPoint(x * self.block_length, y * self.block_length), bg_block)
-
-    def _draw_objects(self, painter: QPainter, level: Level):
-        bg_palette_group = PaletteGroup.from_tileset(level.tileset_number, level.header.object_palette_index)
-        spr_palette_group = PaletteGroup.from_tileset(level.tileset_number, 8 + level.header.enemy_palette_index)
+        _fill_with_pattern(
+            painter,
+            level.get_rect(self.block_length).to_qt(),
+            _pattern_from_indexes(((TILESET_BACKGROUND_BLOCKS[level.tileset_number],),), self.block_length, level),
+        )
 
-        for level_object in level.objects:
-            level_object.palette_group = bg_palette_group
-        for enemy in level.enemies:
-            enemy.palette_group = spr_palette_group
+    def _draw_objects(self, painter: QPainter, level: Level, region: QRect | None = None):
+        if region is not None:
+            # enemies can be drawn slightly outside of their rect
+            margin = CULLING_MARGIN * self.block_length
+            region = region.adjusted(-margin, -margin, margin, margin)
 
         for level_object in level.get_all_objects():
+            is_special_background = level_object.name.lower() in SPECIAL_BACKGROUND_OBJECTS and isinstance(
+                level_object, LevelObject
+            )
+
+            if (
+                region is not None
+                and not is_special_background
+                and not region.intersects(level_object.get_rect(self.block_length).to_qt())
+            ):
+                continue
 
-            level_object.render()
-
-            if level_object.name.lower() in SPECIAL_BACKGROUND_OBJECTS and isinstance(level_object, LevelObject):
-                width = LEVEL_MAX_LENGTH
-                height = GROUND - level_object.point.y
-
-                blocks_to_draw = [level_object.blocks[0]] * width * height
-
-                for index, block_index in enumerate(blocks_to_draw):
-                    x = level_object.point.x + index % width
-                    y = level_object.point.y + index // width
-
-                    level_object._draw_block(painter, block_index, x, y, self.block_length, False)
+            if self.use_block_grid and isinstance(level_object, LevelObject):
+                # its blocks were already drawn as part of the block grid
+                pass
+            elif is_special_background:
+                block_index = level_object.blocks[0]
+                block_index = block_index if block_index <= 0xFF else ROM().get_byte(block_index)
+                block = Block.from_tsa(Point(0, 0), block_index, level_object.tsa_data)
+
+                _fill_with_pattern(
+                    painter,
+                    QRect(
+                        level_object.point.x * self.block_length,
+                        level_object.point.y * self.block_length,
+                        LEVEL_MAX_LENGTH * self.block_length,
+                        (GROUND - level_object.point.y) * self.block_length,
+                    ),
+                    _block_pattern(
+                        ((block,),),
+                        level_object.palette_group,
+                        level_object.graphics_set,
+                        self.block_length,
+                        use_background_color=False,
+                    ),
+                )
             else:
                 if isinstance(level_object, LevelObject):
                     level_object.draw(painter, self.block_length, self.user_settings.block_transparency)
@@ -274,6 +437,7 @@ class LevelDrawer:
 
                 pen = QPen(QColor(0x00, 0x00, 0x00, 0x80))
                 pen.setWidth(1)
+                pen.setCosmetic(True)
                 painter.setPen(pen)
                 painter.drawRect(level_object.get_rect(self.block_length).to_qt())
 
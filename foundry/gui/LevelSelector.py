@@ -261,7 +261,7 @@ class WorldMapLevelSelect(QScrollArea):
     def __init__(self, world_number: int):
         super().__init__()
 
-        self.world = WorldMap(world_number)
+        self.world = WorldMap.from_cache(world_number)
 
         self.world_view = WorldMapView(self, self.world)
         self.world_view.setMouseTracking(True)
@@ -7,6 +7,7 @@ from PySide6.QtGui import (
     QDragEnterEvent,
     QDragMoveEvent,
     QDropEvent,
+    QImage,
     QMouseEvent,
     QPainter,
     QPaintEvent,
@@ -35,6 +36,7 @@ from foundry.game.level.Level import Level
 from foundry.game.level.LevelRef import LevelRef
 from foundry.game.level.WorldMap import WorldMap
 from foundry.gui.ContextMenu import ContextMenu
+from foundry.gui.LevelCompositor import LevelCompositor
 from foundry.gui.LevelDrawer import LevelDrawer
 from foundry.gui.SelectionSquare import SelectionSquare
 from foundry.gui.settings import FileSettings, ResizeModes, UserSettings
@@ -54,8 +56,10 @@ RESIZE_MODES = [MODE_RESIZE_HORIZ, MODE_RESIZE_VERT, MODE_RESIZE_DIAG]
 
 def undoable(func):
     def wrapped(self, *args):
-        func(self, *args)
-        self.level_ref.save_level_state()
+        # only refresh once, no matter how many changes the function makes
+        with self.level_ref.batch():
+            func(self, *args)
+            self.level_ref.save_level_state()
 
     return wrapped
 
@@ -95,6 +99,11 @@ class LevelView(QWidget):
         self.context_menu = context_menu
 
         self.level_drawer = LevelDrawer(self.user_settings)
+        self.compositor = LevelCompositor(self.level_drawer, self)
+        self.compositor.frame_changed.connect(super().update)
+
+        self._mip_chain: list[QImage] = []
+        self._mip_revision = -1
 
         self.zoom = 1
         self.block_length = BLOCK_SIZE.width * self.zoom
@@ -262,6 +271,9 @@ class LevelView(QWidget):
     def update(self):
         self.resize(self.sizeHint())
 
+        if self.level_ref:
+            self.compositor.request(self.level_ref.level)
+
         super().update()
 
     def _on_right_mouse_button_down(self, event: MouseEvent):
@@ -658,6 +670,8 @@ class LevelView(QWidget):
     def make_screenshot(self) -> QPixmap:
         assert self.level_ref is not None
 
+        self.compositor.wait()
+
         return self.grab()
 
     def dragEnterEvent(self, event: QDragEnterEvent):
@@ -706,17 +720,85 @@ class LevelView(QWidget):
 
             return self.level_ref.level.enemy_item_factory.from_properties(enemy_id, Point(0, 0))
 
+    def _mip_level(self, zoom: float) -> tuple[QImage, float]:
+        """
+        Provides the level at its natural size halved until it is at most twice the size of the zoom, so zoomed out
+        overviews are filtered instead of skipping pixels.
+
+        The mip levels are cached until the compositor finishes a chunk or starts a new frame, so painting again only
+        has to blit them.
+
+        Parameters
+        ----------
+        zoom : float
+            The zoom of the level, which is less than one.
+
+        Returns
+        -------
+        tuple[QImage, float]
+            The mip level and the scale that remains to be applied to it.
+        """
+        revision = self.compositor.revision
+        if revision != self._mip_revision:
+            self._mip_chain = []
+            self._mip_revision = revision
+
+        if not self._mip_chain:
+            image = QImage(
+                self.level_ref.level.get_rect(BLOCK_SIZE.width).size.to_qt(),
+                QImage.Format.Format_ARGB32_Premultiplied,
+            )
+            image.fill(Qt.GlobalColor.transparent)
+
+            painter = QPainter(image)
+            self.compositor.draw(painter)
+            painter.end()
+
+            self._mip_chain.append(image)
+
+        level = 0
+        while zoom <= 0.5:
+            level += 1
+            if level == len(self._mip_chain):
+                image = self._mip_chain[-1]
+                self._mip_chain.append(
+                    image.scaled(
+                        max(1, image.width() // 2),
+                        max(1, image.height() // 2),
+                        Qt.AspectRatioMode.IgnoreAspectRatio,
+                        Qt.TransformationMode.SmoothTransformation,
+                    )
+                )
+            zoom *= 2
+
+        return self._mip_chain[level], zoom
+
     def paintEvent(self, event: QPaintEvent):
         painter = QPainter(self)
 
         if self.level_ref is None:
             return
 
-        self.level_drawer.block_length = self.block_length
+        if self.compositor.level is not self.level_ref.level:
+            self.compositor.request(self.level_ref.level)
 
-        self.level_drawer.draw(painter, self.level_ref.level)
+        # The level is always composited from blocks at their natural size, so zooming never misses the block cache.
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, False)
+
+        painter.save()
+        if self.zoom < 1 and self.user_settings.smooth_zoom_out:
+            image, scale = self._mip_level(self.zoom)
+            painter.scale(scale, scale)
+            painter.drawImage(0, 0, image)
+        else:
+            painter.scale(self.zoom, self.zoom)
+            self.compositor.draw(painter)
+        painter.restore()
 
         self.selection_square.draw(painter)
 
         if self.currently_dragged_object is not None:
-            self.currently_dragged_object.draw(painter, self.block_length, self.user_settings.block_transparency)
+            painter.save()
+            painter.scale(self.zoom, self.zoom)
+            self.currently_dragged_object.draw(painter, BLOCK_SIZE.width, self.user_settings.block_transparency)
+            painter.restore()
@@ -1,5 +1,5 @@
 from PySide6.QtCore import QPoint, QSize
-from PySide6.QtGui import QCloseEvent, QColor, QImage, QPainter, QPaintEvent, Qt
+from PySide6.QtGui import QCloseEvent, QImage, QPainter, QPaintEvent
 from PySide6.QtWidgets import (
     QComboBox,
     QHBoxLayout,
@@ -10,7 +10,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from foundry.core.drawable import BLOCK_SIZE, MASK_COLOR, Block, block_to_image
+from foundry.core.drawable import BLOCK_SIZE, Block, block_to_image
 from foundry.core.geometry import Point
 from foundry.core.graphics_set.util import GRAPHIC_SET_NAMES
 from foundry.game.File import ROM
@@ -223,9 +223,8 @@ class BlockArray(QWidget):
                 self.level_object.palette_group,
                 self.level_object.graphics_set,
                 BLOCK_SIZE.width,
-            ).copy()
-            mask: QImage = image.createMaskFromColor(QColor(*MASK_COLOR).rgb(), Qt.MaskMode.MaskOutColor)
-            image.setAlphaChannel(mask)
+                transparent=True,
+            )
             self.layout().addWidget(
                 BlockArea(
                     image,
@@ -5,6 +5,7 @@ from foundry.core.palette import (
     PALETTE_GROUPS_PER_OBJECT_SET,
     PALETTES_PER_PALETTES_GROUP,
     PaletteGroup,
+    PaletteRepository,
     get_internal_palette_offset,
 )
 from foundry.game.File import ROM
@@ -61,3 +62,7 @@ class PaletteGroupModel:
             rom = ROM()
         rom.write(bg_offset, bytes(self.background_palette_group))
         rom.write(spr_offset, bytes(self.sprite_palette_group))
+
+        repository = PaletteRepository.current()
+        repository.invalidate(self.tileset, self.background_index)
+        repository.invalidate(self.tileset, self.sprite_index + PALETTE_GROUPS_PER_OBJECT_SET)
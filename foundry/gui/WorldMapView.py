@@ -15,7 +15,7 @@ class WorldMapView(QWidget):
     def paintEvent(self, event: QPaintEvent):
         painter = QPainter(self)
 
-        self.world.draw(painter, self.zoom)
+        self.world.draw_screens(painter, self.zoom)
 
     def sizeHint(self) -> QSize:
         return self.world.q_size * self.zoom
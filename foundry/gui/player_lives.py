@@ -23,7 +23,7 @@ from PySide6.QtWidgets import (
     QLineEdit,
 )
 
-from foundry.core.redux_store import Action, ReduxStore
+from foundry.core.redux_store import Action, ImmutableReduxStore
 from foundry.game.File import ROM
 from foundry.gui.CustomDialog import CustomDialog
 from foundry.gui.HorizontalLine import HorizontalLine
@@ -68,7 +68,7 @@ class ActionNames(Enum):
     CARD_GAME_1UP = "[PlayerLives] CardGame"
 
 
-@dataclass
+@dataclass(frozen=True)
 class State:
     """Stores the current state of the UI
 
@@ -92,7 +92,7 @@ class State:
     card_game_1up: bool
 
 
-class Store(ReduxStore[State]):
+class Store(ImmutableReduxStore[State]):
     """Concrete implementation of the ReduxStore for the PlayerLives UI"""
 
     def _reduce(self, state: State, action: Action) -> State:
@@ -108,32 +108,32 @@ class Store(ReduxStore[State]):
 
         if action.type == ActionNames.STARTING_LIVES.value:
             if Store._is_bounded_int(action.payload, 0, 99):
-                state.starting_lives = int(action.payload)
+                state = self.evolve(state, starting_lives=int(action.payload))
 
         elif action.type == ActionNames.CONTINUE_LIVES.value:
             if Store._is_bounded_int(action.payload, 0, 99):
-                state.continue_lives = int(action.payload)
+                state = self.evolve(state, continue_lives=int(action.payload))
 
         elif action.type == ActionNames.DEATH_TAKES_LIVES.value:
-            state.death_takes_lives = action.payload
+            state = self.evolve(state, death_takes_lives=action.payload)
 
         elif action.type == ActionNames.HUNDRED_COINS_1UP.value:
-            state.hundred_coins_1up = action.payload
+            state = self.evolve(state, hundred_coins_1up=action.payload)
 
         elif action.type == ActionNames.END_CARD_1UP.value:
-            state.end_card_1up = action.payload
+            state = self.evolve(state, end_card_1up=action.payload)
 
         elif action.type == ActionNames.MUSHROOM_1UP.value:
-            state.mushroom_1up = action.payload
+            state = self.evolve(state, mushroom_1up=action.payload)
 
         elif action.type == ActionNames.DICE_GAME_1UP.value:
-            state.dice_game_1up = action.payload
+            state = self.evolve(state, dice_game_1up=action.payload)
 
         elif action.type == ActionNames.ROULETTE_1UP.value:
-            state.roulette_1up = action.payload
+            state = self.evolve(state, roulette_1up=action.payload)
 
         elif action.type == ActionNames.CARD_GAME_1UP.value:
-            state.card_game_1up = action.payload
+            state = self.evolve(state, card_game_1up=action.payload)
 
         elif action.type == ActionNames.LOAD.value:
             state = self.get_default_state()
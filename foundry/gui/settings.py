@@ -121,6 +121,8 @@ class UserSettings:
         Draws autoscroll routes.
     block_transparency: bool
         Causes generators to be drawn with transparency.
+    smooth_zoom_out: bool
+        Filters the level through mip levels when it is zoomed out, instead of skipping pixels.
     object_scroll_enabled: bool
         Enables the editing of generators through the use of the scroll wheel.
     object_tooltip_enabled: bool
@@ -143,6 +145,7 @@ class UserSettings:
     draw_invisible_items: bool = True
     draw_autoscroll: bool = False
     block_transparency: bool = True
+    smooth_zoom_out: bool = True
     object_scroll_enabled: bool = False
     object_tooltip_enabled: bool = True
 
@@ -168,6 +171,7 @@ class PydanticUserSettings(BaseModel):
     draw_invisible_items: bool = True
     draw_autoscroll: bool = False
     block_transparency: bool = True
+    smooth_zoom_out: bool = True
     object_scroll_enabled: bool = False
     object_tooltip_enabled: bool = True
 
@@ -197,6 +201,7 @@ class PydanticUserSettings(BaseModel):
             draw_invisible_items=self.draw_invisible_items,
             draw_autoscroll=self.draw_autoscroll,
             block_transparency=self.block_transparency,
+            smooth_zoom_out=self.smooth_zoom_out,
             object_scroll_enabled=self.object_scroll_enabled,
             object_tooltip_enabled=self.object_tooltip_enabled,
         )
@@ -224,6 +229,7 @@ def user_setting_to_json(user_setting: UserSettings, path: str):
         draw_invisible_items=user_setting.draw_invisible_items,
         draw_autoscroll=user_setting.draw_autoscroll,
         block_transparency=user_setting.block_transparency,
+        smooth_zoom_out=user_setting.smooth_zoom_out,
         object_scroll_enabled=user_setting.object_scroll_enabled,
         object_tooltip_enabled=user_setting.object_tooltip_enabled,
     )
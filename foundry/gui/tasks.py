@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+from asyncio import (
+    AbstractEventLoop,
+    Future,
+    Handle,
+    Task,
+    TimerHandle,
+    _get_running_loop,
+    _set_running_loop,
+    ensure_future,
+)
+from collections.abc import Awaitable, Callable, Coroutine
+from contextvars import Context
+from logging import Logger, NullHandler, getLogger
+from time import monotonic
+from typing import Any, Literal, TypeVar
+
+from PySide6.QtCore import QEventLoop, QObject, Qt, QThread, QTimer, Signal
+
+from foundry.core.tasks import TaskManagerProxy
+
+_T = TypeVar("_T")
+
+LOGGER_NAME: Literal["TASK"] = "TASK"
+
+log: Logger = getLogger(LOGGER_NAME)
+log.addHandler(NullHandler())
+
+
+class TaskNotifier(QObject):
+    """
+    Handles the finished tasks of a task manager from the Qt event loop as soon as they are received, instead of
+    polling the task manager on a timer.
+
+    Attributes
+    ----------
+    manager: TaskManagerProxy
+        The task manager whose finished tasks are handled.
+    tasks_ready: Signal
+        A signal emitted from the thread listening to the task manager, which is queued to the thread of this object.
+    """
+
+    manager: TaskManagerProxy
+    tasks_ready: Signal = Signal()
+
+    def __init__(self, manager: TaskManagerProxy, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.manager = manager
+        self.tasks_ready.connect(self._on_tasks_ready, Qt.ConnectionType.QueuedConnection)
+        manager.listen(self, self.tasks_ready.emit)
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}({self.manager})"
+
+    def _on_tasks_ready(self) -> None:
+        try:
+            self.manager.poll_tasks()
+        except EOFError:
+            log.warning(f"{self} stopped watching a task manager which closed its pipe")
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops handling the finished tasks of the task manager.
+        """
+        self.manager.unlisten(self)
+
+
+class _HandleScheduler(QObject):
+    scheduled: Signal = Signal(object)
+
+
+class QtEventLoop(AbstractEventLoop):
+    """
+    An asyncio event loop which runs its callbacks from the Qt event loop, so coroutines can await scheduled tasks
+    without blocking painting.
+
+    Attributes
+    ----------
+    scheduler: QObject
+        The object which receives callbacks from any thread and runs them from the thread which created the loop.
+    exception_handler: Callable[[AbstractEventLoop, dict[str, Any]], None] | None
+        The handler of exceptions raised by callbacks, None if they are logged.
+    event_loop: QEventLoop | None
+        The Qt event loop started by `run_forever`, None if it is not running.
+    closed: bool
+        If the loop was closed.
+
+    Notes
+    -----
+        Coroutines are started with `create_task` while the Qt application runs, so user input is never handled from
+    inside a callback.  `run_forever` and `run_until_complete` start their own Qt event loop, so they refuse to run
+    while a Qt event loop is already running on this thread.
+    """
+
+    scheduler: _HandleScheduler
+    exception_handler: Callable[[AbstractEventLoop, dict[str, Any]], None] | None
+    event_loop: QEventLoop | None
+    closed: bool
+
+    def __init__(self) -> None:
+        self.scheduler = _HandleScheduler()
+        self.scheduler.scheduled.connect(self._run_handle, Qt.ConnectionType.QueuedConnection)
+        self.exception_handler = None
+        self.event_loop = None
+        self.closed = False
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} running={self.is_running()} closed={self.closed}>"
+
+    def _run_handle(self, handle: Handle) -> None:
+        if handle.cancelled() or self.closed:
+            return
+        previous: AbstractEventLoop | None = _get_running_loop()
+        _set_running_loop(self)
+        try:
+            handle._run()
+        finally:
+            _set_running_loop(previous)
+
+    def _timer_handle_cancelled(self, handle: TimerHandle) -> None:
+        pass  # Cancelled handles are skipped once their timer fires.
+
+    def time(self) -> float:
+        return monotonic()
+
+    def call_soon(self, callback: Callable[..., Any], *args: Any, context: Context | None = None) -> Handle:
+        handle = Handle(callback, args, self, context)
+        self.scheduler.scheduled.emit(handle)
+        return handle
+
+    def call_soon_threadsafe(self, callback: Callable[..., Any], *args: Any, context: Context | None = None) -> Handle:
+        # Signals emitted from another thread are queued to the thread of the scheduler.
+        return self.call_soon(callback, *args, context=context)
+
+    def call_later(
+        self, delay: float, callback: Callable[..., Any], *args: Any, context: Context | None = None
+    ) -> TimerHandle:
+        return self.call_at(self.time() + delay, callback, *args, context=context)
+
+    def call_at(
+        self, when: float, callback: Callable[..., Any], *args: Any, context: Context | None = None
+    ) -> TimerHandle:
+        handle = TimerHandle(when, callback, args, self, context)
+        QTimer.singleShot(max(0, round((when - self.time()) * 1000)), lambda: self._run_handle(handle))
+        return handle
+
+    def create_future(self) -> Future:
+        return Future(loop=self)
+
+    def create_task(
+        self, coro: Coroutine[Any, Any, _T], *, name: str | None = None, context: Context | None = None
+    ) -> Task[_T]:
+        return Task(coro, loop=self, name=name, context=context)
+
+    def run_forever(self) -> None:
+        """
+        Runs a Qt event loop until `stop` is called.
+
+        Raises
+        ------
+        RuntimeError
+            If this loop or another Qt event loop is already running on this thread.
+        """
+        if self.closed:
+            raise RuntimeError(f"{self} is closed")
+        if self.is_running() or QThread.currentThread().loopLevel() > 0:
+            raise RuntimeError(f"{self} cannot run inside of a running event loop, create a task instead")
+        self.event_loop = QEventLoop()
+        previous: AbstractEventLoop | None = _get_running_loop()
+        _set_running_loop(self)
+        try:
+            self.event_loop.exec()
+        finally:
+            _set_running_loop(previous)
+            self.event_loop = None
+
+    def run_until_complete(self, future: Awaitable[_T]) -> _T:
+        """
+        Runs a Qt event loop until a future or coroutine is complete.
+
+        Parameters
+        ----------
+        future : Awaitable[_T]
+            The future or coroutine to wait for.
+
+        Returns
+        -------
+        _T
+            The result of the future.
+        """
+        task: Future[_T] = ensure_future(future, loop=self)
+        task.add_done_callback(lambda _: self.stop())
+        self.run_forever()
+        return task.result()
+
+    def stop(self) -> None:
+        if self.event_loop is not None:
+            self.event_loop.quit()
+
+    def is_running(self) -> bool:
+        return self.event_loop is not None
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    def close(self) -> None:
+        if self.is_running():
+            raise RuntimeError(f"{self} cannot be closed while it is running")
+        self.closed = True
+
+    def get_debug(self) -> bool:
+        return False
+
+    def set_exception_handler(self, handler: Callable[[AbstractEventLoop, dict[str, Any]], None] | None) -> None:
+        self.exception_handler = handler
+
+    def get_exception_handler(self) -> Callable[[AbstractEventLoop, dict[str, Any]], None] | None:
+        return self.exception_handler
+
+    def default_exception_handler(self, context: dict[str, Any]) -> None:
+        log.error(context.get("message", f"{self} received an unhandled exception"), exc_info=context.get("exception"))
+
+    def call_exception_handler(self, context: dict[str, Any]) -> None:
+        if self.exception_handler is None:
+            self.default_exception_handler(context)
+        else:
+            self.exception_handler(self, context)
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+import logging
+import os
+import re
+from argparse import ArgumentParser, BooleanOptionalAction
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from hashlib import sha256
+from json import dumps, loads
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Literal
+
+from attr import attrs
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QGuiApplication, QImage, QPainter, Qt
+
+from foundry.core.drawable import BLOCK_SIZE
+from foundry.core.graphics_set.GraphicsSet import GraphicsSet
+from foundry.core.palette import PaletteGroup
+from foundry.game.File import ROM, WORLD_COUNT, INESHeader
+from foundry.game.level.Level import Level
+from foundry.game.level.util import Level as LevelInformation
+from foundry.game.level.WorldMap import OVERWORLD_GRAPHIC_SET, WorldMap
+from foundry.gui.LevelDrawer import LevelDrawer
+from foundry.gui.settings import UserSettings
+from foundry.smb3parse.objects.tileset import WORLD_MAP_OBJECT_SET
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME: Literal[".foundry-render.json"] = ".foundry-render.json"
+"""The file inside the output directory which stores the digest of every image of the previous run."""
+
+LAYERS: dict[str, str] = {
+    "mario": "draw_mario",
+    "jumps": "draw_jumps",
+    "grid": "draw_grid",
+    "expansion": "draw_expansion",
+    "jump_on_objects": "draw_jump_on_objects",
+    "items": "draw_items_in_blocks",
+    "invisible_items": "draw_invisible_items",
+    "autoscroll": "draw_autoscroll",
+    "transparency": "block_transparency",
+}
+"""The layers which can be drawn on top of a level, mapped to the user setting which enables them."""
+
+DEFAULT_LAYERS: list[str] = [layer for layer, setting in LAYERS.items() if getattr(UserSettings(), setting)]
+
+_application: QGuiApplication | None = None
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True)
+class RenderOptions:
+    """
+    The options shared by every image of a run.
+
+    Attributes
+    ----------
+    output: Path
+        The directory the images are saved to.
+    zoom: int
+        The scale of the images, where a block is 16 pixels at a zoom of one.
+    layers: tuple[str, ...]
+        The layers drawn on top of the levels.
+    """
+
+    output: Path
+    zoom: int
+    layers: tuple[str, ...]
+
+    @property
+    def user_settings(self) -> UserSettings:
+        settings = UserSettings()
+        for layer, setting in LAYERS.items():
+            setattr(settings, setting, layer in self.layers)
+        return settings
+
+    def digest(self, *data: bytes) -> str:
+        """
+        Provides a digest of the data an image is drawn from, so unchanged images can be skipped.
+
+        Parameters
+        ----------
+        data : bytes
+            The data the image is drawn from.
+
+        Returns
+        -------
+        str
+            The digest of the data and the options, which affect the image as well.
+        """
+        digest = sha256(dumps([self.zoom, sorted(self.layers)]).encode())
+        for part in data:
+            digest.update(sha256(part).digest())
+        return digest.hexdigest()
+
+
+def _slug(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def level_filename(level: LevelInformation) -> str:
+    """
+    Provides the name of the image of a level, which is unique even among levels of the same name.
+
+    Parameters
+    ----------
+    level : LevelInformation
+        The level to name.
+
+    Returns
+    -------
+    str
+        The file name of the image.
+    """
+    locations = level.display_information.locations
+    world = locations[0].world if locations else 0
+    return f"{world}-{_slug(level.display_information.name or 'level')}-{level.generator_pointer:05X}.png"
+
+
+def world_map_filename(world: int) -> str:
+    return f"world-map-{world}.png"
+
+
+def _character_data() -> bytes:
+    return bytes(ROM.rom_data[INESHeader.INES_HEADER_SIZE + ROM.header.program_size :])
+
+
+def initialize_worker(path_to_rom: str):
+    """
+    Readies a process of a process pool to work with a ROM, by loading the ROM and starting an offscreen Qt
+    application.
+
+    Parameters
+    ----------
+    path_to_rom : str
+        The path to the ROM.
+    """
+    global _application
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    _application = QGuiApplication.instance() or QGuiApplication([])
+
+    ROM.load_from_file(path_to_rom)
+
+
+def _save(image: QImage, path: Path):
+    if not image.save(str(path)):
+        raise OSError(f"Failed to save {path}")
+
+
+def render_level(information: LevelInformation, options: RenderOptions, previous: str | None) -> tuple[str, str, bool]:
+    """
+    Renders a level to a PNG inside the output directory, unless its data is unchanged since the previous run.
+
+    Parameters
+    ----------
+    information : LevelInformation
+        The level to render.
+    options : RenderOptions
+        The options of the run.
+    previous : str | None
+        The digest of the image of the previous run, if there was one.
+
+    Returns
+    -------
+    tuple[str, str, bool]
+        The file name of the image, its digest, and if it was rendered.
+    """
+    filename = level_filename(information)
+    level = Level(
+        information.display_information.name or "",
+        information.generator_pointer - Level.HEADER_LENGTH,
+        information.enemy_pointer,
+        information.tileset,
+    )
+
+    (_, object_data), (_, enemy_data) = level.to_bytes()
+    digest = options.digest(
+        bytes(object_data),
+        bytes(enemy_data),
+        bytes(ROM.get_tsa_data(level.tileset_number)),
+        bytes(PaletteGroup.from_tileset(level.tileset_number, level.header.object_palette_index)),
+        bytes(PaletteGroup.from_tileset(level.tileset_number, 8 + level.header.enemy_palette_index)),
+        _character_data(),
+    )
+    if digest == previous and (options.output / filename).exists():
+        return filename, digest, False
+
+    image = QImage(level.get_rect(BLOCK_SIZE.width).size.to_qt() * options.zoom, QImage.Format.Format_ARGB32)
+    image.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(image)
+    painter.scale(options.zoom, options.zoom)
+    LevelDrawer(options.user_settings).draw(painter, level)
+    painter.end()
+
+    _save(image, options.output / filename)
+    return filename, digest, True
+
+
+def render_world_map(world: int, options: RenderOptions, previous: str | None) -> tuple[str, str, bool]:
+    """
+    Renders a world map to a PNG inside the output directory, unless its data is unchanged since the previous run.
+
+    Parameters
+    ----------
+    world : int
+        The world of the world map, starting at one.
+    options : RenderOptions
+        The options of the run.
+    previous : str | None
+        The digest of the image of the previous run, if there was one.
+
+    Returns
+    -------
+    tuple[str, str, bool]
+        The file name of the image, its digest, and if it was rendered.
+    """
+    filename = world_map_filename(world)
+    world_map = WorldMap(world)
+
+    digest = options.digest(
+        bytes(world_map._internal_world_map.layout_bytes),
+        bytes(world_map.tsa_data),
+        bytes(world_map.palette_group),
+        bytes(GraphicsSet.from_tileset(OVERWORLD_GRAPHIC_SET)),
+    )
+    if digest == previous and (options.output / filename).exists():
+        return filename, digest, False
+
+    image = QImage(
+        QSize(world_map.width, world_map.height) * BLOCK_SIZE.width * options.zoom, QImage.Format.Format_ARGB32
+    )
+    image.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(image)
+    world_map.draw_screens(painter, options.zoom)
+    painter.end()
+
+    _save(image, options.output / filename)
+    return filename, digest, True
+
+
+def _load_manifest(output: Path) -> dict[str, str]:
+    try:
+        with open(output / MANIFEST_NAME) as f:
+            return loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(output: Path, manifest: dict[str, str]):
+    with open(output / MANIFEST_NAME, "w") as f:
+        f.write(dumps(manifest, indent=4, sort_keys=True))
+
+
+def main(
+    path_to_rom: str,
+    output: Path = Path("renders"),
+    jobs: int | None = None,
+    zoom: int = 1,
+    layers: list[str] | None = None,
+    force: bool = False,
+) -> int:
+    """
+    Renders every level of a ROM and every world map to a PNG.
+
+    Parameters
+    ----------
+    path_to_rom : str
+        The path to the ROM.
+    output : Path, optional
+        The directory to save the images to, by default 'renders'.
+    jobs : int | None, optional
+        The amount of processes to render with, by default None or one per CPU.
+    zoom : int, optional
+        The scale of the images, by default 1.
+    layers : list[str] | None, optional
+        The layers to draw on top of the levels, by default None or the layers drawn by default inside the editor.
+    force : bool, optional
+        If every image should be rendered, even if its data did not change since the previous run, by default False.
+
+    Returns
+    -------
+    int
+        The amount of images which failed to render.
+    """
+    output.mkdir(parents=True, exist_ok=True)
+    options = RenderOptions(output, zoom, tuple(DEFAULT_LAYERS if layers is None else layers))
+
+    ROM.load_from_file(path_to_rom)
+    levels = [level for level in ROM().settings.levels if level.tileset != WORLD_MAP_OBJECT_SET]
+
+    previous = {} if force else _load_manifest(output)
+    manifest: dict[str, str] = {}
+    rendered = failed = 0
+
+    # Qt does not survive being forked, so each worker starts from a fresh interpreter.
+    with ProcessPoolExecutor(
+        jobs, mp_context=get_context("spawn"), initializer=initialize_worker, initargs=(path_to_rom,)
+    ) as executor:
+        futures = {
+            executor.submit(render_level, level, options, previous.get(level_filename(level))): level_filename(level)
+            for level in levels
+        }
+        futures |= {
+            executor.submit(render_world_map, world, options, previous.get(world_map_filename(world))): (
+                world_map_filename(world)
+            )
+            for world in range(1, WORLD_COUNT + 1)
+        }
+
+        for future in as_completed(futures):
+            try:
+                filename, digest, was_rendered = future.result()
+            except Exception:
+                logger.exception(f"Failed to render {futures[future]}")
+                failed += 1
+                continue
+
+            manifest[filename] = digest
+            rendered += was_rendered
+
+    _save_manifest(output, manifest)
+    print(f"Rendered {rendered} images, skipped {len(manifest) - rendered} unchanged, {failed} failed.")
+
+    return failed
+
+
+def start():
+    parser = ArgumentParser(description="Renders every level and world map of a ROM to PNG images.")
+    parser.add_argument("rom", type=str, help="The path to the ROM")
+    parser.add_argument("--output", type=Path, default=Path("renders"), help="The directory to save the images to")
+    parser.add_argument("--jobs", type=int, default=None, help="The amount of processes, one per CPU by default")
+    parser.add_argument("--zoom", type=int, default=1, help="The scale of the images")
+    parser.add_argument(
+        "--layers",
+        nargs="*",
+        choices=list(LAYERS),
+        default=None,
+        help=f"The layers to draw on top of the levels, by default {' '.join(DEFAULT_LAYERS)}",
+    )
+    parser.add_argument(
+        "--force",
+        default=False,
+        action=BooleanOptionalAction,
+        type=bool,
+        help="Render every image, even if its data did not change since the last run",
+    )
+
+    args = parser.parse_args()
+    raise SystemExit(1 if main(args.rom, args.output, args.jobs, args.zoom, args.layers, args.force) else 0)
+
+
+if __name__ == "__main__":
+    start()
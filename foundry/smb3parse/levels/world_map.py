@@ -114,6 +114,8 @@ class WorldMap(LevelBase):
         screen_count    How many screens this world map spans.
     """
 
+    _level_index: dict[tuple[int, int, int], tuple[int, int, int, str]] | None
+
     def __init__(self, layout_address: int, rom: Rom):
         super().__init__(WORLD_MAP_OBJECT_SET, layout_address)
 
@@ -147,6 +149,9 @@ class WorldMap(LevelBase):
 
         self._parse_structure_data_block(rom)
 
+        self._level_index = None
+        self._level_index = self.level_index
+
     @property
     def world_index(self):
         return self.number - 1
@@ -216,6 +221,44 @@ class WorldMap(LevelBase):
             warn("Spade and mushroom house currently not supported, when getting a level address.")
             return None
 
+        level = self.level_index.get((screen, point.y, point.x))
+        return None if level is None else level[:3]
+
+    @property
+    def level_index(self) -> dict[tuple[int, int, int], tuple[int, int, int, str]]:
+        """
+        Provides every level of the world map by its position, so levels can be found without walking the level
+        lists of the ROM.
+
+        Returns
+        -------
+        dict[tuple[int, int, int], tuple[int, int, int, str]]
+            A map from the screen, row and column of each level to its object set number, the absolute level address,
+            the enemy address, and its name.
+        """
+        if self._level_index is None:
+            self._level_index = {}
+
+            for position in self.gen_positions():
+                level = self._read_level_for_position(position.screen, position.point)
+
+                if level is not None:
+                    self._level_index[(position.screen, position.point.y, position.point.x)] = (
+                        *level,
+                        self.level_name_for_position(position.screen, position.point),
+                    )
+
+        return self._level_index
+
+    def _read_level_for_position(self, screen: int, point: Point) -> tuple[int, int, int] | None:
+        """
+        Reads the level of a position from the level lists of the ROM, as described by `level_for_position`.
+        """
+        tile = self.tile_at(screen, point)
+
+        if tile in [TILE_SPADE_HOUSE, TILE_MUSHROOM_HOUSE_1, TILE_MUSHROOM_HOUSE_2]:
+            return None
+
         if not self.is_enterable(tile):
             return None
 
@@ -268,6 +311,8 @@ class WorldMap(LevelBase):
 
         self._rom.write_little_endian(enemy_offset_address, enemy_offset)
 
+        self._level_index = None
+
     def level_indexes(self, point: WorldMapPosition) -> tuple[Point, int, int] | None:
         """
         Provide the level index from a given screen and point.
@@ -400,14 +445,8 @@ class WorldMap(LevelBase):
         """
         Returns a generator, which yields all levels accessible from this world map.
         """
-        for point in self.gen_positions():
-            level_info_tuple = self.level_for_position(point.screen, point.point)
-
-            if level_info_tuple is None:
-                continue
-
-            else:
-                yield Level(self._rom, *level_info_tuple)
+        for tileset_number, level_address, enemy_address, _ in self.level_index.values():
+            yield Level(self._rom, tileset_number, level_address, enemy_address)
 
     @staticmethod
     def from_world_number(rom: Rom, world_number: int) -> "WorldMap":
@@ -1,10 +1,12 @@
 from gc import collect
 from itertools import count
+from threading import Thread
 
 from pytest import raises
 
 from foundry.core.gui import (
     Signal,
+    SignalBatch,
     SignalBlocker,
     SignalInstance,
     SignalTester,
@@ -156,6 +158,39 @@ class TestSignal:
         assert value == 1
         SimpleObject.class_signal.disconnect(change_value, obj2)
 
+    def test_weak_subscriber_removed_eagerly(self):
+        signal = self.__test_class__()
+        obj, obj2 = SimpleObject(), SimpleObject()
+        signal.connect(obj.test, obj)
+        signal.connect(obj2.test, obj2)
+        del obj
+        collect()
+        assert len(signal) == 1
+        assert len(signal.subscribers_of(obj2)) == 1
+
+    def test_max_uses_removed_eagerly(self):
+        signal = self.__test_class__()
+        obj = SimpleObject()
+        signal.connect(obj.test, obj, max_uses=1)
+        signal.emit(1, obj)
+        assert not signal
+        signal.emit(2, obj)
+        assert obj.test_value == 1
+
+    def test_emit_ignores_unrelated_subscribers(self):
+        signal = self.__test_class__()
+        unrelated_objects = [SimpleObject() for _ in range(10000)]
+        for unrelated in unrelated_objects:
+            signal.connect(unrelated.test, unrelated)
+        obj = SimpleObject()
+        signal.connect(obj.test, obj)
+
+        # Emitting only has to visit the subscribers of the instance, instead of scanning every subscriber.
+        assert len(signal.subscribers_of(obj)) == 1
+        signal.emit(1, obj)
+        assert obj.test_value == 1
+        assert not any(unrelated.test_value for unrelated in unrelated_objects)
+
 
 class TestSignalInstance:
     __test_class__: type[SignalInstance] = SignalInstance
@@ -173,7 +208,7 @@ class TestSignalInstance:
     def test_get_subscriber(self):
         SimpleObject.class_signal.clear()
         obj = SimpleObject()
-        obj.signal_instance.connect(lambda _: None)
+        obj.signal_instance.connect(lambda _: None, weak=False)
         element = obj.class_signal.subscribers[0]
         assert element in obj.signal_instance
         assert element is obj.signal_instance[element]
@@ -343,3 +378,45 @@ class TestSignalTester:
             assert 1 == tester.count
             obj.signal_instance.emit(0)
             assert 2 == tester.count
+
+
+def test_signal_batch_coalesces():
+    signal = Signal()
+    obj, obj2 = SimpleObject(), SimpleObject()
+    values: list[int] = []
+    signal.connect(values.append, obj, weak=False)
+    signal.connect(obj2.test, obj2)
+    with SignalBatch():
+        signal.emit(1, obj)
+        with SignalBatch():
+            signal.emit(2, obj)
+            signal.emit(3, obj2)
+        assert not values
+        signal.emit(4, obj)
+    assert values == [4]
+    assert obj2.test_value == 3
+
+
+def test_signal_batch_deliver_later(qtbot):
+    signal = Signal()
+    obj = SimpleObject()
+    signal.connect(obj.test, obj)
+    with SignalBatch(deliver_later=True):
+        signal.emit(1, obj)
+        signal.emit(2, obj)
+    assert obj.test_value == 0
+    qtbot.waitUntil(lambda: obj.test_value == 2)
+
+
+def test_signal_batch_is_thread_local():
+    signal = Signal()
+    obj = SimpleObject()
+    signal.connect(obj.test, obj)
+    with SignalBatch():
+        thread = Thread(target=signal.emit, args=(1, obj))
+        thread.start()
+        thread.join()
+        assert obj.test_value == 1
+        signal.emit(2, obj)
+        assert obj.test_value == 1
+    assert obj.test_value == 2
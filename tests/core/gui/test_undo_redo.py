@@ -1,3 +1,5 @@
+from functools import partial
+
 from attr import attrs
 from pytest import raises
 
@@ -8,6 +10,7 @@ from foundry.core.gui import (
     UndoRedoActor,
     UndoRedoForwarder,
     UndoRedoRoot,
+    estimate_size,
 )
 
 
@@ -124,6 +127,82 @@ class TestUndoRedo:
         assert 1 == undo_redo.redo()()
 
 
+def _step(value: int) -> Action:
+    return Action(None, lambda: value, lambda: value - 1, str(value))
+
+
+class TestBoundedUndoRedo:
+    def test_max_depth(self):
+        undo_redo: UndoRedo = UndoRedo(0, max_depth=3)
+        for value in range(1, 6):
+            undo_redo.do(_step(value))
+        assert 3 == len(undo_redo.undo_stack)
+        assert 2 == undo_redo.stats.discarded
+        assert 4 == undo_redo.undo()()
+
+    def test_max_size(self):
+        undo_redo: UndoRedo = UndoRedo(bytes(1_000), max_size=10_000, measure=len)
+        for value in range(1, 8):
+            undo_redo.do(Action(None, partial(bytes, [value] * 1_000), partial(bytes, [value - 1] * 1_000), str(value)))
+        assert 10_000 == undo_redo.stats.size
+        assert 5 == len(undo_redo.undo_stack)
+        assert 2 == undo_redo.stats.discarded
+
+    def test_max_size_keeps_latest_action(self):
+        undo_redo: UndoRedo = UndoRedo(b"", max_size=10, measure=len)
+        undo_redo.do(Action(None, partial(bytes, 100), partial(bytes, 0), "1"))
+        assert undo_redo.can_undo
+
+    def test_size_released_by_redo_stack(self):
+        undo_redo: UndoRedo = UndoRedo(b"", max_size=10_000, measure=len)
+        undo_redo.do(Action(None, partial(bytes, 100), partial(bytes, 0), "1"))
+        undo_redo.undo()
+        assert 100 == undo_redo.stats.size
+        undo_redo.do(Action(None, partial(bytes, 10), partial(bytes, 0), "2"))
+        assert 10 == undo_redo.stats.size
+
+    def test_compaction(self):
+        undo_redo: UndoRedo = UndoRedo(0, compaction_interval=5, compaction_stride=4)
+        for value in range(1, 14):
+            undo_redo.do(_step(value))
+        assert 5 + 2 == len(undo_redo.undo_stack)
+        assert 8 == undo_redo.stats.compacted
+
+        values = [undo_redo.undo()() for _ in range(len(undo_redo.undo_stack))]
+        assert [12, 11, 10, 9, 8, 4, 0] == values
+
+    def test_compaction_redo(self):
+        undo_redo: UndoRedo = UndoRedo(0, compaction_interval=2, compaction_stride=2)
+        for value in range(1, 7):
+            undo_redo.do(_step(value))
+        while undo_redo.can_undo:
+            undo_redo.undo()
+        values = [undo_redo.redo()() for _ in range(len(undo_redo.redo_stack))]
+        assert [2, 4, 5, 6] == values
+
+    def test_compaction_removes_no_op_snapshots(self):
+        undo_redo: UndoRedo = UndoRedo(0, compaction_interval=1, compaction_stride=2)
+        undo_redo.do(Action(None, lambda: 1, lambda: 0, "1"))
+        undo_redo.do(Action(None, lambda: 0, lambda: 1, "0"))
+        undo_redo.do(Action(None, lambda: 1, lambda: 0, "1"))
+        assert 1 == len(undo_redo.undo_stack)
+        assert 2 == undo_redo.stats.compacted
+
+    def test_stats(self):
+        undo_redo: UndoRedo = UndoRedo(0)
+        undo_redo.do(_step(1))
+        undo_redo.do(_step(2))
+        undo_redo.undo()
+        stats = undo_redo.stats
+        assert (1, 1, 0, 0) == (stats.undo_depth, stats.redo_depth, stats.discarded, stats.compacted)
+        assert 0 < stats.size
+
+    def test_estimate_size_counts_shared_objects_once(self):
+        data = bytes(1_000)
+        assert estimate_size([data, data]) < 2 * estimate_size(data)
+        assert estimate_size(SimpleModel(1)) > 0
+
+
 class TestUndoRedoActor:
     __test_class__: type[SimpleUndoRedoActor] = SimpleUndoRedoActor
 
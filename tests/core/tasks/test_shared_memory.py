@@ -0,0 +1,87 @@
+from io import BytesIO
+from multiprocessing import Pipe
+from multiprocessing.shared_memory import SharedMemory
+
+from numpy import arange, array_equal
+from pytest import fixture, raises
+
+from foundry.core.tasks import (
+    SHARED_MEMORY_THRESHOLD,
+    SharedMemoryPickler,
+    dill_connection,
+)
+
+
+@fixture
+def connections():
+    sender, receiver = dill_connection(*Pipe())
+    yield sender, receiver
+    sender.close()
+    receiver.close()
+
+
+def test_small_buffers_are_serialized(connections):
+    sender, receiver = connections
+    sender.send(b"small")
+    assert receiver.recv() == b"small"
+    assert not sender._sent_segments
+
+
+def test_bytes(connections):
+    sender, receiver = connections
+    data = bytes(range(256)) * (SHARED_MEMORY_THRESHOLD // 256)
+    sender.send({"rom": data})
+    assert sender._sent_segments
+    assert receiver.recv() == {"rom": data}
+
+
+def test_bytearray(connections):
+    sender, receiver = connections
+    data = bytearray(SHARED_MEMORY_THRESHOLD)
+    data[-1] = 0xFF
+    sender.send(data)
+    result = receiver.recv()
+    assert isinstance(result, bytearray)
+    assert result == data
+
+
+def test_memoryview(connections):
+    sender, receiver = connections
+    data = memoryview(bytes(SHARED_MEMORY_THRESHOLD))
+    sender.send(data)
+    result = receiver.recv()
+    assert isinstance(result, memoryview)
+    assert result == data
+
+
+def test_ndarray(connections):
+    sender, receiver = connections
+    data = arange(SHARED_MEMORY_THRESHOLD, dtype="u2").reshape(-1, 16)
+    sender.send(data)
+    result = receiver.recv()
+    assert result.dtype == data.dtype
+    assert array_equal(result, data)
+
+
+def test_segment_is_unlinked_after_every_reference_is_loaded(connections):
+    sender, receiver = connections
+    data = bytes(SHARED_MEMORY_THRESHOLD)
+    sender.send((data, data, data))
+    (segment,) = sender._sent_segments
+    name = segment.name
+    assert receiver.recv() == (data, data, data)
+
+    sender.release_segments()
+    assert not sender._sent_segments
+    with raises(FileNotFoundError):
+        SharedMemory(name)
+
+
+def test_discard_unlinks_segments():
+    pickler = SharedMemoryPickler(BytesIO())
+    pickler.dump(bytes(SHARED_MEMORY_THRESHOLD))
+    names = [segment.name for _, _, segment in pickler.segments.values()]
+    pickler.discard()
+    for name in names:
+        with raises(FileNotFoundError):
+            SharedMemory(name)
@@ -0,0 +1,79 @@
+from asyncio import new_event_loop
+
+from pytest import raises
+
+from foundry.core.tasks import (
+    FinishedTask,
+    TaskCallback,
+    TaskCancelled,
+    TaskFuture,
+    TaskManagerProxy,
+    start_task_manager,
+)
+
+
+def _one() -> int:
+    return 1
+
+
+def _fail() -> int:
+    raise ValueError
+
+
+def _ignore(*_) -> None:
+    pass
+
+
+def test_task_future_resolve():
+    future: TaskFuture = TaskFuture(1)
+    future.resolve(FinishedTask(1, 2))
+    assert future.result() == 2
+
+
+def test_task_future_resolve_exception():
+    future: TaskFuture = TaskFuture(1)
+    future.resolve(FinishedTask.as_exception(1, ValueError()))
+    with raises(ValueError):
+        future.result()
+
+
+def test_task_future_resolve_cancelled():
+    future: TaskFuture = TaskFuture(1)
+    future.resolve(FinishedTask.as_exception(1, TaskCancelled()))
+    assert future.cancelled()
+
+
+def test_task_future_cancel_notifies_manager():
+    cancelled: list[int] = []
+    future: TaskFuture = TaskFuture(1, cancelled.append)
+    assert future.cancel()
+    assert cancelled == [1]
+    assert not future.cancel()
+
+
+def test_task_manager_wait():
+    manager: TaskManagerProxy = start_task_manager(worker_count=1)
+    future = manager.schedule_task(TaskCallback(_one, _ignore))
+    assert manager.wait(future, 10)
+    assert future.result() == 1
+    failure = manager.schedule_task(TaskCallback(_fail, _ignore, _ignore))
+    assert manager.wait(failure, 10)
+    assert isinstance(failure.exception(), ValueError)
+    manager.terminate()
+
+
+def test_task_manager_await():
+    manager: TaskManagerProxy = start_task_manager(worker_count=1)
+    loop = new_event_loop()
+    manager.watch(loop)
+
+    async def run() -> int:
+        return await manager.schedule_task(TaskCallback(_one, _ignore))
+
+    try:
+        assert loop.run_until_complete(run()) == 1
+    finally:
+        manager.unwatch(loop)
+        loop.close()
+        manager.terminate()
+
@@ -1,15 +1,38 @@
-from pytest import fixture
+from collections import deque
+from json import load
+from multiprocessing import Value
+from os import getpid
+from time import sleep
+
+from dill import dumps
+from pytest import fixture, raises
 
 from foundry.core.gui import Signal, SignalInstance, SignalTester
 from foundry.core.tasks import (
+    WORKER_PREFETCH_LIMIT,
+    Executor,
+    FinishedTask,
+    IdlePolicy,
+    Priority,
+    RequestPipe,
     Requests,
     Status,
+    Task,
     TaskCallback,
+    TaskCancelled,
+    TaskManager,
     TaskManagerProxy,
+    TaskMetricsRecorder,
+    TaskResultCache,
+    TaskWorkerProxy,
+    WorkerTask,
     exit_after,
+    least_loaded_worker,
     start_task_manager,
     synchronize,
     task,
+    task_cancelled,
+    task_key,
     wait_until,
 )
 
@@ -57,6 +80,125 @@ def test_task_manager_terminate():
     assert not task_manager.is_alive()
 
 
+class RecordingConnection:
+    """
+    A stand in for a connection which records every object sent.
+    """
+
+    def __init__(self):
+        self.sent = []
+
+    def send(self, obj) -> None:
+        self.sent.append(obj)
+
+    def poll(self, timeout: float = 0.0) -> bool:
+        return False
+
+
+def _worker_proxy(name: str) -> TaskWorkerProxy:
+    return TaskWorkerProxy(None, RecordingConnection(), RecordingConnection(), None, name)  # type: ignore
+
+
+def _worker_task(priority: Priority = Priority.VISIBLE) -> WorkerTask:
+    return WorkerTask(Task(int, Task.generate_identity(), priority=priority))
+
+
+def _task_manager(*workers: TaskWorkerProxy) -> TaskManager:
+    manager = TaskManager.__new__(TaskManager)
+    manager.name = "manager"
+    manager.workers = list(workers)
+    manager.worker_count = len(workers)
+    manager.outgoing_pipe = RecordingConnection()
+    manager.queued_tasks = {}
+    manager.running_keys = {}
+    manager.metrics = TaskMetricsRecorder()
+    manager.cancelled_tasks = set()
+    manager.superseding_tasks = {}
+    manager.thread_pool = None
+    manager.thread_tasks = {}
+    manager.performed_tasks = deque()
+    return manager
+
+
+def test_worker_proxy_prefetch_limit():
+    worker = _worker_proxy("worker")
+    tasks = [_worker_task() for _ in range(WORKER_PREFETCH_LIMIT + 2)]
+    for worker_task in tasks:
+        synchronize(worker.assign)(worker_task)
+    assert worker.outgoing_pipe.sent == tasks[:WORKER_PREFETCH_LIMIT]
+    assert len(worker.pending_tasks) == 2
+    assert worker.load == len(tasks)
+    assert not worker.is_idle
+
+    synchronize(worker.finish)(tasks[0].identity)
+    assert worker.outgoing_pipe.sent == tasks[: WORKER_PREFETCH_LIMIT + 1]
+    assert len(worker.pending_tasks) == 1
+
+
+def test_worker_proxy_steal():
+    worker = _worker_proxy("worker")
+    tasks = [_worker_task() for _ in range(WORKER_PREFETCH_LIMIT + 2)]
+    for worker_task in tasks:
+        synchronize(worker.assign)(worker_task)
+    assert worker.steal() == tasks[-1]
+    assert worker.load == len(tasks) - 1
+
+
+def test_least_loaded_worker():
+    busy_worker, idle_worker = _worker_proxy("busy"), _worker_proxy("idle")
+    synchronize(busy_worker.assign)(_worker_task())
+    assert least_loaded_worker([busy_worker, idle_worker]) is idle_worker
+    synchronize(idle_worker.assign)(_worker_task())
+    synchronize(idle_worker.assign)(_worker_task())
+    assert least_loaded_worker([busy_worker, idle_worker]) is busy_worker
+
+
+def test_send_task_to_least_loaded_worker():
+    busy_worker, idle_worker = _worker_proxy("busy"), _worker_proxy("idle")
+    synchronize(busy_worker.assign)(_worker_task())
+    manager = _task_manager(busy_worker, idle_worker)
+    internal_task = Task(int, Task.generate_identity())
+    synchronize(manager.send_task_to_worker)(internal_task)
+    assert [t.identity for t in idle_worker.outgoing_pipe.sent] == [internal_task.identity]
+
+
+def test_balance_workers():
+    busy_worker, idle_worker = _worker_proxy("busy"), _worker_proxy("idle")
+    tasks = [_worker_task() for _ in range(WORKER_PREFETCH_LIMIT + 2)]
+    for worker_task in tasks:
+        synchronize(busy_worker.assign)(worker_task)
+    synchronize(_task_manager(busy_worker, idle_worker).balance_workers)()
+    assert idle_worker.outgoing_pipe.sent == [tasks[-1]]
+    assert busy_worker.load == len(tasks) - 1
+
+
+def test_task_manager_invalid_worker_count():
+    with raises(ValueError):
+        TaskManager("manager", None, None, RequestPipe.generate().replier, 0)  # type: ignore
+
+
+def test_task_manager_worker_count():
+    results: list[int] = []
+
+    def square(value: int):
+        def square():
+            return value * value
+
+        return square
+
+    manager: TaskManagerProxy = start_task_manager(worker_count=2)
+    for value in range(8):
+        manager.schedule_task(TaskCallback(square(value), results.append))
+
+    def wait() -> int:
+        manager.poll_tasks()
+        return len(results)
+
+    assert wait_until(wait, 8, 10)()
+    manager.terminate()
+    assert sorted(results) == [value * value for value in range(8)]
+
+
 def test_task_method_simple():
     class Obj:
         _updated = Signal(name="test_updated")
@@ -202,3 +344,393 @@ class TestTaskManager:
         assert obj2.value == 2
         assert obj2.return_times == 1
         assert obj2.exception_times == 0
+
+
+def test_idle_policy_validation():
+    with raises(ValueError):
+        IdlePolicy(warm_workers=-1)
+    with raises(ValueError):
+        IdlePolicy(stop_delay=-1)
+
+
+def test_idle_policy_prepare():
+    calls: list[bool] = []
+    IdlePolicy(preload=("json",), initializer=lambda: calls.append(True)).prepare()
+    assert calls == [True]
+
+
+def test_task_manager_stays_warm_while_idle():
+    results: list[int] = []
+
+    def one():
+        return 1
+
+    manager: TaskManagerProxy = start_task_manager(
+        worker_count=2, idle_policy=IdlePolicy(scale_down_delay=0, scale_down_interval=0)
+    )
+    sleep(0.5)
+    assert manager.is_alive()
+    manager.schedule_task(TaskCallback(one, results.append))
+
+    def wait() -> int:
+        manager.poll_tasks()
+        return len(results)
+
+    assert wait_until(wait, 1, 10)()
+    manager.terminate()
+
+
+def test_task_manager_stop_delay():
+    manager: TaskManagerProxy = start_task_manager(worker_count=1, idle_policy=IdlePolicy(stop_delay=0.1))
+    assert wait_until(manager.is_alive, False, 10)()
+
+
+def test_task_key_is_stable():
+    def constant():
+        return 1
+
+    assert task_key(constant) == task_key(constant)
+    assert task_key(constant, 1) != task_key(constant, 2)
+
+
+def test_task_result_cache_evicts_least_recently_used():
+    cache = TaskResultCache(len(dumps(b"a" * 64)) * 2)
+    assert cache.add("first", b"a" * 64)
+    assert cache.add("second", b"b" * 64)
+    assert cache.get("first") == b"a" * 64
+    assert cache.add("third", b"c" * 64)
+    assert "first" in cache
+    assert "second" not in cache
+    assert "third" in cache
+    assert cache.size <= cache.maximum_size
+
+
+def test_task_result_cache_ignores_large_results():
+    cache = TaskResultCache(8)
+    assert not cache.add("large", b"a" * 64)
+    assert len(cache) == 0
+
+
+def test_pure_tasks_are_cached():
+    results: list[int] = []
+
+    def random_value():
+        from random import random
+
+        return random()
+
+    manager: TaskManagerProxy = start_task_manager(worker_count=1)
+
+    def wait() -> int:
+        manager.poll_tasks()
+        return len(results)
+
+    manager.schedule_task(TaskCallback.as_pure(random_value, results.append))
+    assert wait_until(wait, 1, 10)()
+    manager.schedule_task(TaskCallback.as_pure(random_value, results.append))
+    manager.schedule_task(TaskCallback(random_value, results.append))
+    assert wait_until(wait, 3, 10)()
+    manager.terminate()
+    assert results[0] == results[1]
+    assert results[2] not in results[:2]
+
+
+def test_task_method_pure_key():
+    def constant():
+        return 1
+
+    assert task(constant).key is None
+    assert task(constant, pure=True).key == task_key(constant)
+    assert task(constant, pure=True).handler(None).pure
+
+
+def test_task_metrics_recorder():
+    recorder = TaskMetricsRecorder()
+    worker = _worker_proxy("worker")
+    recorder.add_worker(worker.name)
+    succeeded, failed = Task(int, Task.generate_identity()), Task(int, Task.generate_identity())
+    recorder.receive(succeeded, 10)
+    recorder.receive(failed, 10)
+    recorder.finish(FinishedTask(succeeded.identity, 0, duration=0.5), worker.name, 5)
+    recorder.finish(FinishedTask.as_exception(failed.identity, ValueError(), 0.25), worker.name, 5)
+
+    metrics = recorder.snapshot([worker], 3)
+    assert metrics.tasks["int"].count == 2
+    assert metrics.tasks["int"].failures == 1
+    assert metrics.tasks["int"].cached == 0
+    assert metrics.tasks["int"].run_time_p95 <= 0.5
+    assert metrics.tasks["int"].bytes_serialized == 15
+    assert metrics.workers["worker"].tasks_finished == 2
+    assert metrics.workers["worker"].busy_ratio > 0
+    assert metrics.queue_depth == 3
+    assert metrics.active_tasks == 0
+
+
+def test_task_manager_metrics(tmp_path):
+    results: list[int] = []
+
+    def one():
+        return 1
+
+    manager: TaskManagerProxy = start_task_manager(worker_count=1)
+    for _ in range(4):
+        manager.schedule_task(TaskCallback(one, results.append))
+
+    def wait() -> int:
+        manager.poll_tasks()
+        return len(results)
+
+    assert wait_until(wait, 4, 10)()
+    metrics = manager.get_metrics(10)
+    assert metrics is not None
+    assert metrics.tasks["one"].count == 4
+    assert metrics.tasks["one"].bytes_serialized > 0
+    assert len(metrics.workers) == 1
+
+    path = tmp_path / "metrics.json"
+    assert manager.dump_metrics(str(path), 10)
+    manager.terminate()
+    with open(path) as file:
+        assert load(file)["tasks"]["one"]["count"] == 4
+
+
+def _one_task() -> int:
+    return 1
+
+
+def _ignore(*_) -> None:
+    pass
+
+
+def _square(value: int) -> int:
+    return value * value
+
+
+def _invert(value: int) -> float:
+    return 1 / value
+
+
+def test_task_manager_map_ordered():
+    manager: TaskManagerProxy = start_task_manager(worker_count=2)
+    assert list(manager.map(_square, range(50), chunksize=4)) == [value * value for value in range(50)]
+    manager.terminate()
+
+
+def test_task_manager_map_unordered():
+    manager: TaskManagerProxy = start_task_manager(worker_count=2)
+    assert sorted(manager.map(_square, range(50), chunksize=3, ordered=False)) == [value * value for value in range(50)]
+    manager.terminate()
+
+
+def test_task_manager_map_backpressure():
+    consumed: list[int] = []
+
+    def items():
+        for value in range(20):
+            consumed.append(value)
+            yield value
+
+    manager: TaskManagerProxy = start_task_manager(worker_count=1)
+    results = manager.map(_square, items(), chunksize=2, max_in_flight=1)
+    assert next(results) == 0
+    assert len(consumed) == 2
+    assert list(results) == [value * value for value in range(1, 20)]
+    manager.terminate()
+
+
+def test_task_manager_map_exception():
+    manager: TaskManagerProxy = start_task_manager(worker_count=1)
+    with raises(ZeroDivisionError):
+        list(manager.map(_invert, [1, 0, 2], chunksize=1))
+    manager.terminate()
+
+
+def test_task_manager_map_invalid_arguments():
+    manager = TaskManagerProxy(None, None, None, None)  # type: ignore
+    with raises(ValueError):
+        manager.map(_square, range(4), chunksize=0)
+    with raises(ValueError):
+        manager.map(_square, range(4), max_in_flight=0)
+
+
+def test_worker_proxy_orders_pending_tasks_by_priority():
+    worker = _worker_proxy("worker")
+    active = _worker_task(Priority.BACKGROUND)
+    background = _worker_task(Priority.BACKGROUND)
+    interactive = _worker_task(Priority.INTERACTIVE)
+    for worker_task in (active, background, interactive):
+        synchronize(worker.assign)(worker_task)
+    assert list(worker.active_tasks.values()) == [active]
+    assert list(worker.pending_tasks) == [interactive, background]
+    assert worker.steal() == interactive
+
+
+def _cancelled(connection: RecordingConnection) -> list[int]:
+    return [finished.identity for finished in connection.sent if isinstance(finished.exception, TaskCancelled)]
+
+
+def test_cancel_pending_task():
+    worker = _worker_proxy("worker")
+    active, pending = _worker_task(), _worker_task()
+    synchronize(worker.assign)(active)
+    synchronize(worker.assign)(pending)
+    manager = _task_manager(worker)
+    synchronize(manager.cancel_task)(pending.identity)
+    assert not worker.pending_tasks
+    assert _cancelled(manager.outgoing_pipe) == [pending.identity]
+
+
+def test_cancel_queued_task_cancels_dependents():
+    manager = _task_manager(_worker_proxy("worker"))
+    required = Task(int, Task.generate_identity())
+    dependent = Task(int, Task.generate_identity(), [required.identity])
+    manager.queued_tasks = {required.identity: Task(int, required.identity, [0]), dependent.identity: dependent}
+    synchronize(manager.cancel_task)(required.identity)
+    assert not manager.queued_tasks
+    assert _cancelled(manager.outgoing_pipe) == [required.identity, dependent.identity]
+
+
+def test_cancel_active_task():
+    worker = _worker_proxy("worker")
+    worker.cancelled_task = Value("q", 0, lock=False)
+    active = _worker_task()
+    synchronize(worker.assign)(active)
+    manager = _task_manager(worker)
+    synchronize(manager.cancel_task)(active.identity)
+    assert manager.cancelled_tasks == {active.identity}
+    assert worker.cancelled_task.value == active.identity
+    assert not manager.outgoing_pipe.sent
+
+
+def test_supersede_task():
+    worker = _worker_proxy("worker")
+    manager = _task_manager(worker)
+    first = Task(int, Task.generate_identity(), supersede_key="thumbnail")
+    second = Task(int, Task.generate_identity(), supersede_key="thumbnail")
+    synchronize(manager.send_task_to_worker)(Task(int, Task.generate_identity()))
+    synchronize(manager.supersede_task)(first)
+    synchronize(manager.send_task_to_worker)(first)
+    synchronize(manager.supersede_task)(second)
+    assert _cancelled(manager.outgoing_pipe) == [first.identity]
+    assert manager.superseding_tasks == {"thumbnail": second.identity}
+
+
+def test_task_cancelled_outside_of_worker():
+    assert not task_cancelled()
+
+
+def _wait_for_cancellation() -> bool:
+    from time import time
+
+    start = time()
+    while not task_cancelled():
+        if time() - start > 10:
+            return False
+    return True
+
+
+def test_task_manager_cancel_running_task():
+    results: list[int] = []
+    exceptions: list[Exception] = []
+
+    def one():
+        return 1
+
+    manager: TaskManagerProxy = start_task_manager(worker_count=1)
+    future = manager.schedule_task(TaskCallback(_wait_for_cancellation, results.append, exceptions.append))
+    sleep(0.2)
+    manager.cancel(future.identity)
+    manager.schedule_task(TaskCallback(one, results.append, exceptions.append))
+
+    def wait() -> int:
+        manager.poll_tasks()
+        return len(results)
+
+    assert wait_until(wait, 1, 10)()
+    manager.terminate()
+    assert results == [1]
+    assert not exceptions
+
+
+def _increment(value: int) -> int:
+    return value + 1
+
+
+def test_task_manager_executors_share_dependencies():
+    manager: TaskManagerProxy = start_task_manager(worker_count=1)
+    futures = manager.schedule_tasks(
+        {
+            "process": (TaskCallback(_one_task, _ignore), set()),
+            "thread": (TaskCallback(_increment, _ignore, executor=Executor.THREAD), {"process"}),
+            "inline": (TaskCallback(_increment, _ignore, executor=Executor.INLINE), {"thread"}),
+        }
+    )
+    assert manager.wait(futures["inline"], 10)
+    assert [futures[name].result() for name in ("process", "thread", "inline")] == [1, 2, 3]
+
+    metrics = manager.get_metrics(10)
+    assert metrics is not None
+    assert metrics.tasks["_increment"].count == 2
+    assert metrics.tasks["_increment"].cached == 0
+    manager.terminate()
+
+
+def test_task_manager_executors_require_later_tasks():
+    manager: TaskManagerProxy = start_task_manager(worker_count=1)
+    futures = manager.schedule_tasks(
+        {
+            "process": (TaskCallback(_increment, _ignore), {"thread"}),
+            "thread": (TaskCallback(_one_task, _ignore, executor=Executor.THREAD), set()),
+        }
+    )
+    assert manager.wait(futures["process"], 10)
+    assert futures["process"].result() == 2
+    manager.terminate()
+
+
+def test_task_manager_thread_task_runs_in_main_process():
+    marker = object()
+    manager: TaskManagerProxy = start_task_manager(worker_count=1)
+    future = manager.schedule_task(TaskCallback(lambda: (getpid(), marker), _ignore, executor=Executor.THREAD))
+    assert manager.wait(future, 10)
+    pid, result = future.result()
+    assert pid == getpid()
+    assert result is marker
+    manager.terminate()
+
+
+def test_task_manager_inline_task_returns_unpicklable_result():
+    manager: TaskManagerProxy = start_task_manager(worker_count=1)
+    future = manager.schedule_task(
+        TaskCallback(lambda: (value for value in range(3)), _ignore, executor=Executor.INLINE)
+    )
+    assert manager.wait(future, 10)
+    assert list(future.result()) == [0, 1, 2]
+    manager.terminate()
+
+
+def test_task_manager_map_threads():
+    manager: TaskManagerProxy = start_task_manager(worker_count=1)
+    assert list(manager.map(_square, range(20), chunksize=3, executor=Executor.THREAD)) == [
+        value * value for value in range(20)
+    ]
+    manager.terminate()
+
+
+def test_task_manager_cancel_thread_task():
+    manager: TaskManagerProxy = start_task_manager(worker_count=1)
+    future = manager.schedule_task(TaskCallback(_wait_for_cancellation, _ignore, executor=Executor.THREAD))
+    sleep(0.2)
+    future.cancel()
+    other = manager.schedule_task(TaskCallback(_one_task, _ignore, executor=Executor.THREAD))
+    assert manager.wait(other, 10)
+    assert future.cancelled()
+    manager.terminate()
+
+
+def test_task_method_executor():
+    def constant():
+        return 1
+
+    assert task(constant, executor=Executor.THREAD).task_callback(None).executor == Executor.THREAD
+    assert task(constant, executor=Executor.INLINE).handler(None).executor == Executor.INLINE
@@ -0,0 +1,61 @@
+from random import Random
+
+from PySide6.QtGui import QColor, QImage
+
+from foundry.core.drawable import (
+    MASK_COLOR,
+    PATTERN_LOCATIONS,
+    Block,
+    _Tile,
+    block_atlas,
+    mask_out_color,
+)
+from foundry.core.geometry import Point
+from foundry.core.palette import Palette
+
+
+def test_mask_out_color():
+    image = QImage(2, 1, QImage.Format.Format_RGB888)
+    image.setPixelColor(0, 0, QColor(*MASK_COLOR))
+    image.setPixelColor(1, 0, QColor(0x10, 0x20, 0x30))
+
+    masked = mask_out_color(image)
+
+    assert masked.format() == QImage.Format.Format_ARGB32_Premultiplied
+    assert masked.pixelColor(0, 0).alpha() == 0
+    assert masked.pixelColor(1, 0) == QColor(0x10, 0x20, 0x30)
+
+
+def test_mask_out_color_does_not_modify_image():
+    image = QImage(1, 1, QImage.Format.Format_RGB888)
+    image.setPixelColor(0, 0, QColor(*MASK_COLOR))
+
+    mask_out_color(image)
+
+    assert image.format() == QImage.Format.Format_RGB888
+    assert image.pixelColor(0, 0) == QColor(*MASK_COLOR)
+
+
+class _Graphics:
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def __bytes__(self) -> bytes:
+        return self.data
+
+
+def test_block_atlas():
+    random = Random(0)
+    graphics = bytes(random.randrange(0x100) for _ in range(0x100 * 16))
+    tsa = bytes(random.randrange(0x100) for _ in range(0x400))
+
+    atlas = block_atlas(tsa, graphics)
+
+    assert atlas.shape == (0x100, 16, 16)
+    for index in (0x00, 0x3F, 0x40, 0x9A, 0xFF):
+        block = Block.from_tsa(Point(0, 0), index, tsa)
+        for pattern, point in zip(block.patterns, PATTERN_LOCATIONS):
+            pixels = list(_Tile(pattern, Palette((0, 1, 2, 3)), _Graphics(graphics)).pixels_indexes)
+            expected = [block.palette_index * 4 + pixel for pixel in pixels]
+
+            assert atlas[index, point.y : point.y + 8, point.x : point.x + 8].flatten().tolist() == expected
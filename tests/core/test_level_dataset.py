@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import pytest
+from numpy import arange, array, int16, memmap, zeros
+
+from foundry.game.level.dataset import (
+    ENEMY_DTYPE,
+    LEVEL_DTYPE,
+    OBJECT_DTYPE,
+    LevelDataset,
+    LevelTables,
+)
+
+
+def _tables(name: str, width: int, height: int, objects: int, enemies: int) -> LevelTables:
+    level = zeros(1, dtype=LEVEL_DTYPE)
+    level["width"], level["height"] = width, height
+    level["objects_count"], level["enemies_count"] = objects, enemies
+
+    return LevelTables(
+        name,
+        level,
+        arange(width * height, dtype=int16).reshape(height, width),
+        array([(0, 1, index, index, index, index, 3) for index in range(objects)], dtype=OBJECT_DTYPE),
+        array([(0, index, index, index) for index in range(enemies)], dtype=ENEMY_DTYPE),
+    )
+
+
+@pytest.fixture
+def dataset() -> LevelDataset:
+    return LevelDataset.from_tables([_tables("first", 3, 2, 2, 0), _tables("second", 2, 4, 1, 3)])
+
+
+def test_from_tables(dataset: LevelDataset):
+    assert len(dataset) == 2
+    assert dataset.levels["blocks_offset"].tolist() == [0, 6]
+    assert dataset.objects["level"].tolist() == [0, 0, 1]
+    assert dataset.enemies["level"].tolist() == [1, 1, 1]
+    assert dataset.level_blocks(1).tolist() == [[0, 1], [2, 3], [4, 5], [6, 7]]
+    assert dataset.level_objects(1)["index"].tolist() == [0]
+    assert len(dataset.level_enemies(0)) == 0
+
+
+def test_from_no_tables():
+    assert len(LevelDataset.from_tables([])) == 0
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_save_and_load(dataset: LevelDataset, tmp_path: Path, compress: bool):
+    path = tmp_path / "levels.npz"
+    dataset.save(path, compress)
+
+    loaded = LevelDataset.load(path)
+
+    assert isinstance(loaded.blocks, memmap) != compress
+    assert loaded.names.tolist() == ["first", "second"]
+    assert (loaded.levels == dataset.levels).all()
+    assert (loaded.blocks == dataset.blocks).all()
+    assert (loaded.objects == dataset.objects).all()
+    assert (loaded.enemies == dataset.enemies).all()
+    assert loaded.level_blocks(1).tolist() == dataset.level_blocks(1).tolist()
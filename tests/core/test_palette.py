@@ -0,0 +1,64 @@
+from numpy import array, uint8
+from numpy.random import default_rng
+from pytest import raises
+
+from foundry.core.palette import (
+    QUANTIZE_CHUNK_SIZE,
+    Color,
+    ColorPalette,
+    ColorSequence,
+    Palette,
+)
+
+
+def test_rgb_table():
+    color_palette = ColorPalette.from_default()
+    table = color_palette.rgb_table
+
+    assert len(color_palette.colors) * 3 == len(table)
+    for index, color in enumerate(color_palette.colors):
+        assert color.to_rgb_bytes() == table[index * 3 : index * 3 + 3]
+
+
+def test_palette_rgb_table():
+    palette = Palette((0x0F, 0x16, 0x36, 0x30))
+
+    assert b"".join(palette[i, Color].to_rgb_bytes() for i in range(4)) == palette.rgb_table
+
+
+def test_index_returns_first_color():
+    colors = ColorSequence([Color(0, 0, 0), Color(1, 1, 1), Color(0, 0, 0)])
+
+    assert 0 == colors.index(Color(0, 0, 0))
+    assert 2 == colors.index(Color(0, 0, 0), 1)
+    assert 1 == colors[Color(1, 1, 1)]
+    assert Color(1, 1, 1) in colors
+
+
+def test_index_missing_color():
+    with raises(ValueError):
+        ColorSequence([Color(0, 0, 0)]).index(Color(1, 1, 1))
+
+
+def test_nearest():
+    colors = ColorSequence([Color(0, 0, 0), Color(128, 128, 128), Color(255, 255, 255)])
+
+    assert 1 == colors.nearest(Color(128, 128, 128))
+    assert 1 == colors.nearest(Color(100, 140, 120))
+    assert 2 == colors.nearest(Color(250, 240, 255))
+
+
+def test_quantize():
+    colors = ColorSequence([Color(0, 0, 0), Color(255, 0, 0), Color(0, 0, 255)])
+    pixels = array([[[10, 0, 0], [200, 10, 10]], [[0, 20, 250], [5, 5, 5]]], dtype=uint8)
+
+    assert [[0, 1], [2, 0]] == colors.quantize(pixels).tolist()
+
+
+def test_quantize_across_chunks():
+    colors = ColorPalette.from_default().colors
+    pixels = default_rng(0).integers(0, 256, (QUANTIZE_CHUNK_SIZE * 2 + 7, 1, 3), dtype=uint8)
+
+    expected = [[colors.nearest(Color(*(int(value) for value in pixel[0])))] for pixel in pixels]
+
+    assert expected == colors.quantize(pixels).tolist()
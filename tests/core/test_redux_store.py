@@ -1,7 +1,13 @@
 """ Test of the ReduxStore """
 import unittest
+from dataclasses import dataclass
 
-from foundry.core.redux_store import Action, ReduxStore, StateNoneError
+from foundry.core.redux_store import (
+    Action,
+    ImmutableReduxStore,
+    ReduxStore,
+    StateNoneError,
+)
 
 
 class _TestReduxStore(ReduxStore[int]):
@@ -19,3 +25,70 @@ class TestStringMethods(unittest.TestCase):
         """verify that a StateNoneError is thrown on a None state initialization"""
         with self.assertRaises(StateNoneError):
             _TestReduxStore(None)
+
+    def test_subscribers_are_per_store(self):
+        """verify that subscribing to one store does not subscribe to every store"""
+        calls = []
+        _TestReduxStore(1).subscribe(lambda: calls.append(1))
+        _TestReduxStore(1).dispatch(Action("", None))
+        self.assertEqual([], calls)
+
+
+@dataclass(frozen=True)
+class _TestState:
+    """Immutable state for testing."""
+
+    value: int
+    items: tuple[int, ...]
+
+
+class _TestImmutableReduxStore(ImmutableReduxStore[_TestState]):
+    """Create a concrete implementation for testing."""
+
+    def _reduce(self, state: _TestState, action: Action) -> _TestState:
+        """Implement abstract function."""
+        if action.type == "value":
+            return self.evolve(state, value=action.payload)
+        return state
+
+
+class TestImmutableReduxStore(unittest.TestCase):
+    """Tests for the store of immutable states"""
+
+    def test_state_is_not_copied(self):
+        """verify that the state is shared instead of copied"""
+        state = _TestState(0, (1, 2, 3))
+        store = _TestImmutableReduxStore(state)
+        self.assertIs(state, store.get_state())
+        self.assertIs(state, store.get_default_state())
+
+    def test_dispatch_shares_unchanged_fields(self):
+        """verify that a new state shares the unchanged fields of the old state"""
+        state = _TestState(0, (1, 2, 3))
+        store = _TestImmutableReduxStore(state)
+        store.dispatch(Action("value", 1))
+        self.assertEqual(1, store.get_state().value)
+        self.assertIs(state.items, store.get_state().items)
+        self.assertEqual(0, state.value)
+
+    def test_subscribers_are_notified(self):
+        """verify that subscribers are called without arguments, like the subscribers of ReduxStore"""
+        store = _TestImmutableReduxStore(_TestState(0, ()))
+        states = []
+        store.subscribe(lambda: states.append(store.get_state()))
+        store.dispatch(Action("value", 1))
+        self.assertEqual([store.get_state()], states)
+
+    def test_no_change_does_not_notify(self):
+        """verify that actions which do not change the state do not notify subscribers"""
+        store = _TestImmutableReduxStore(_TestState(0, ()))
+        states = []
+        store.subscribe(lambda: states.append(store.get_state()))
+        store.dispatch(Action("value", 0))
+        store.dispatch(Action("", None))
+        self.assertEqual([], states)
+
+    def test_evolve_requires_dataclass_or_attrs(self):
+        """verify that evolve rejects states which cannot be evolved"""
+        with self.assertRaises(TypeError):
+            ImmutableReduxStore.evolve(object(), value=1)
@@ -0,0 +1,43 @@
+from pathlib import Path
+
+from foundry.game.level.util import generate_default_level_information
+from foundry.gui.settings import UserSettings
+from foundry.render import (
+    DEFAULT_LAYERS,
+    LAYERS,
+    RenderOptions,
+    _load_manifest,
+    _save_manifest,
+    level_filename,
+)
+
+
+def test_level_filenames_are_unique():
+    levels = generate_default_level_information()
+
+    assert len({level_filename(level) for level in levels}) == len(levels)
+
+
+def test_layers_are_user_settings():
+    settings = RenderOptions(Path("."), 1, ("grid",)).user_settings
+
+    assert all(hasattr(UserSettings(), setting) for setting in LAYERS.values())
+    assert settings.draw_grid
+    assert not settings.draw_mario
+
+
+def test_digest_depends_on_options():
+    options = RenderOptions(Path("."), 1, tuple(DEFAULT_LAYERS))
+
+    assert options.digest(b"level") == RenderOptions(Path("other"), 1, tuple(reversed(DEFAULT_LAYERS))).digest(b"level")
+    assert options.digest(b"level") != RenderOptions(Path("."), 2, tuple(DEFAULT_LAYERS)).digest(b"level")
+    assert options.digest(b"level") != options.digest(b"other level")
+    assert options.digest(b"ab", b"c") != options.digest(b"a", b"bc")
+
+
+def test_manifest(tmp_path: Path):
+    assert _load_manifest(tmp_path) == {}
+
+    _save_manifest(tmp_path, {"level.png": "digest"})
+
+    assert _load_manifest(tmp_path) == {"level.png": "digest"}
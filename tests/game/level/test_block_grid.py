@@ -0,0 +1,54 @@
+import pytest
+
+from foundry.game.gfx.objects.LevelObject import BLANK
+from foundry.game.level.block_grid import SPECIAL_BACKGROUND_OBJECTS, BlockGrid
+from foundry.game.level.Level import Level
+from foundry.smb3parse.constants import TILESET_BACKGROUND_BLOCKS
+from foundry.smb3parse.objects.tileset import PLAINS_OBJECT_SET
+from tests.conftest import level_1_1_enemy_address, level_1_1_object_address
+
+
+@pytest.fixture
+def level(rom_singleton, qtbot):
+    level = Level("Level 1-1", level_1_1_object_address, level_1_1_enemy_address, PLAINS_OBJECT_SET)
+    for level_object in level.objects:
+        level_object.render()
+    return level
+
+
+def _top_blocks(level: Level) -> list[list[int]]:
+    top = [[TILESET_BACKGROUND_BLOCKS[level.tileset_number]] * level.width for _ in range(level.height)]
+
+    for level_object in level.objects:
+        assert level_object.name.lower() not in SPECIAL_BACKGROUND_OBJECTS
+        width = max(level_object._rendered_size.width, 1)
+        position = level_object.rendered_position
+
+        for index, block_index in enumerate(level_object.rendered_blocks):
+            x, y = position.x + index % width, position.y + index // width
+            if block_index != BLANK and 0 <= x < level.width and 0 <= y < level.height:
+                top[y][x] = block_index
+
+    return top
+
+
+@pytest.mark.parametrize("transparent", [True, False])
+def test_top_is_last_object_drawn(level: Level, transparent: bool):
+    grid = BlockGrid.from_level(level, transparent)
+
+    assert grid.top.tolist() == _top_blocks(level)
+
+
+def test_opaque_objects_replace_blocks_below(level: Level):
+    grid = BlockGrid.from_level(level, transparent=False)
+
+    assert grid.layers.shape[0] == 1
+    assert (grid.depth == 1).all()
+    assert grid.masked.any()
+
+
+def test_transparent_objects_stack(level: Level):
+    grid = BlockGrid.from_level(level, transparent=True)
+
+    assert grid.layers.shape[0] == grid.depth.max() > 1
+    assert not grid.masked.any()
@@ -0,0 +1,19 @@
+from foundry.game.level.block_grid import BlockGrid
+from foundry.game.level.dataset import LevelTables
+from foundry.game.level.Level import Level
+from foundry.smb3parse.objects.tileset import PLAINS_OBJECT_SET
+from tests.conftest import level_1_1_enemy_address, level_1_1_object_address
+
+
+def test_tables_from_level(qtbot):
+    level = Level("Level 1-1", level_1_1_object_address, level_1_1_enemy_address, PLAINS_OBJECT_SET)
+
+    tables = LevelTables.from_level(level, level_1_1_object_address + Level.HEADER_LENGTH, level_1_1_enemy_address)
+
+    assert tables.name == "Level 1-1"
+    assert tables.level["tileset"][0] == PLAINS_OBJECT_SET
+    assert tables.level["graphic_set_index"][0] == level.header.graphic_set_index
+    assert (tables.blocks == BlockGrid.from_level(level).top).all()
+    assert tables.objects["index"].tolist() == [level_object.obj_index for level_object in level.objects]
+    assert tables.objects["x"].tolist() == [level_object.point.x for level_object in level.objects]
+    assert tables.enemies["index"].tolist() == [enemy.obj_index for enemy in level.enemies]
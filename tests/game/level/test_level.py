@@ -4,7 +4,7 @@ from foundry.core.geometry import Point
 from foundry.game.gfx.objects.EnemyItem import EnemyObject
 from foundry.game.gfx.objects.Jump import Jump
 from foundry.game.gfx.objects.LevelObject import LevelObject
-from foundry.game.level.Level import LEVEL_DEFAULT_HEIGHT, Level
+from foundry.game.level.Level import LEVEL_DEFAULT_HEIGHT, Level, LevelSignaller
 from foundry.smb3parse.objects.tileset import PLAINS_OBJECT_SET
 from tests.conftest import level_1_1_enemy_address, level_1_1_object_address
 
@@ -99,3 +99,21 @@ def test_level_insert_in_vertical_level(level: Level) -> None:
     assert added_object.domain == 0
     assert added_object.obj_index == 0
     assert added_object.rendered_position == Point(0, LEVEL_DEFAULT_HEIGHT * 2)
+
+
+def test_level_signaller_batch(qtbot) -> None:
+    signaller = LevelSignaller()
+    emitted = []
+    signaller.data_changed.connect(lambda: emitted.append("data_changed"))
+    signaller.jumps_changed.connect(lambda: emitted.append("jumps_changed"))
+
+    with signaller.batch():
+        signaller.notify("data_changed")
+
+        with signaller.batch():
+            signaller.notify("jumps_changed")
+            signaller.notify("data_changed")
+
+        assert not emitted
+
+    assert emitted == ["data_changed", "jumps_changed"]
@@ -0,0 +1,35 @@
+from foundry.game.File import ROM
+from foundry.game.level.WorldMap import WorldMap
+
+
+def test_world_map_cache_is_shared(rom_singleton, qtbot):
+    # GIVEN a cached world map
+    world_map = WorldMap.from_cache(1)
+
+    # WHEN it is requested again without modifying the ROM
+    # THEN the same world map is provided
+    assert WorldMap.from_cache(1) is world_map
+
+
+def test_world_map_cache_invalidated_by_rom_write(rom_singleton, qtbot):
+    # GIVEN a cached world map
+    world_map = WorldMap.from_cache(1)
+
+    # WHEN the ROM is modified
+    rom = ROM()
+    rom.write(world_map.layout_address, rom.read(world_map.layout_address, 1))
+
+    # THEN a new world map is parsed
+    assert WorldMap.from_cache(1) is not world_map
+
+
+def test_screen_pixmaps_are_reused(rom_singleton, qtbot):
+    # GIVEN a world map which was rendered
+    world_map = WorldMap.from_cache(1)
+    pixmaps = world_map.screen_pixmaps(2)
+
+    # WHEN it is rendered again
+    # THEN the same images are used for each screen
+    assert world_map.screen_count == len(pixmaps)
+    assert world_map.screen_pixmaps(2) is pixmaps
+    assert world_map.screen_pixmaps(1) is not pixmaps
@@ -0,0 +1,25 @@
+from foundry.core.geometry import Point
+from foundry.game.gfx.objects.EnemyItemFactory import EnemyItemFactory
+from foundry.smb3parse.objects.tileset import PLAINS_OBJECT_SET
+
+GOOMBA = 0x72
+
+
+def test_enemy_image_is_cached(rom_singleton, qtbot):
+    factory = EnemyItemFactory(PLAINS_OBJECT_SET, 0)
+    enemy = factory.from_properties(GOOMBA, Point(1, 1))
+    other_enemy = factory.from_properties(GOOMBA, Point(5, 3))
+
+    image, offset = enemy._cached_image(16, True, False)
+    assert (image, offset) == other_enemy._cached_image(16, True, False)
+    assert image is other_enemy._cached_image(16, True, False)[0]
+    assert image is not enemy._cached_image(32, True, False)[0]
+
+
+def test_graphics_set_is_shared(rom_singleton, qtbot):
+    factory = EnemyItemFactory(PLAINS_OBJECT_SET, 0)
+
+    assert (
+        factory.from_properties(GOOMBA, Point(0, 0)).graphics_set
+        is factory.from_properties(GOOMBA, Point(1, 1)).graphics_set
+    )
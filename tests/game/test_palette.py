@@ -0,0 +1,23 @@
+from foundry.core.palette import PALETTE_GROUPS_PER_OBJECT_SET, PaletteGroup
+from foundry.gui.PaletteGroupModel import PaletteGroupModel
+from foundry.smb3parse.objects.tileset import PLAINS_OBJECT_SET
+
+
+def test_palette_group_is_memoized(rom_singleton):
+    palette_group = PaletteGroup.from_tileset(PLAINS_OBJECT_SET, 0)
+
+    assert PaletteGroup.from_tileset(PLAINS_OBJECT_SET, 0) is palette_group
+
+
+def test_palette_group_invalidated_on_save(rom_singleton):
+    background = PaletteGroup.from_tileset(PLAINS_OBJECT_SET, 0)
+    sprite = PaletteGroup.from_tileset(PLAINS_OBJECT_SET, PALETTE_GROUPS_PER_OBJECT_SET)
+    other = PaletteGroup.from_tileset(PLAINS_OBJECT_SET, 1)
+    edited = background.evolve_palettes(0, background[0].evolve_color_index(1, (background[0, 1] + 1) % 0x40))
+
+    PaletteGroupModel(PLAINS_OBJECT_SET, 0, 0, edited, sprite).save()
+
+    assert PaletteGroup.from_tileset(PLAINS_OBJECT_SET, 0) == edited
+    assert PaletteGroup.from_tileset(PLAINS_OBJECT_SET, 1) is other
+
+    PaletteGroupModel(PLAINS_OBJECT_SET, 0, 0, background, sprite).save()
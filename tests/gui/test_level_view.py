@@ -1,6 +1,6 @@
 import pytest
 from PySide6.QtCore import QPoint
-from PySide6.QtGui import Qt, QWheelEvent
+from PySide6.QtGui import QImage, QPainter, Qt, QWheelEvent
 
 from foundry.core.geometry import Point
 from foundry.game.gfx.objects.LevelObject import LevelObject
@@ -11,6 +11,7 @@ from foundry.gui.HeaderEditor import (
     header_state_to_level_header,
     level_to_header_state,
 )
+from foundry.gui.LevelDrawer import LevelDrawer
 from foundry.gui.LevelView import LevelView
 from foundry.gui.settings import FileSettings
 from foundry.smb3parse.objects.tileset import PLAINS_OBJECT_SET
@@ -106,3 +107,94 @@ def test_wheel_event(scroll_amount, coordinates, wheel_delta, type_change, main_
     new_type = level_view.object_at(coordinates).type
 
     assert new_type == original_type + type_change, (original_type, new_type)
+
+
+@pytest.mark.parametrize("zoom, remaining_scale", [(1 / 2, 1), (1 / 4, 1), (1 / 16, 1), (3 / 4, 3 / 4)])
+def test_mip_level(level_view: LevelView, zoom, remaining_scale):
+    image, scale = level_view._mip_level(zoom)
+    size = level_view.level_ref.level.get_rect(16).size
+
+    assert scale == remaining_scale
+    assert image.width() == int(size.width * zoom / scale)
+    assert image.height() == int(size.height * zoom / scale)
+
+
+def test_mip_level_is_reused_between_paints(level_view: LevelView):
+    level_view.compositor.request(level_view.level_ref.level)
+    assert level_view.compositor.wait()
+
+    image, _ = level_view._mip_level(1 / 4)
+
+    assert level_view._mip_level(1 / 4)[0] is image
+    assert level_view._mip_level(1 / 2)[0] is level_view._mip_chain[1]
+
+    level_view.compositor.request(level_view.level_ref.level)
+    assert level_view.compositor.wait()
+
+    assert level_view._mip_level(1 / 4)[0] is not image
+
+
+def test_compositor_matches_drawer(level_view: LevelView):
+    level = level_view.level_ref.level
+    size = level.get_rect(16).size.to_qt()
+
+    level_view.compositor.request(level)
+    assert level_view.compositor.wait()
+    assert not level_view.compositor.pending
+
+    composited = QImage(size, QImage.Format.Format_ARGB32_Premultiplied)
+    composited.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(composited)
+    level_view.compositor.draw(painter)
+    painter.end()
+
+    drawn = QImage(size, QImage.Format.Format_ARGB32_Premultiplied)
+    drawn.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(drawn)
+    level_view.level_drawer.draw(painter, level)
+    painter.end()
+
+    assert composited == drawn
+
+
+def test_compositor_draws_snapshot_of_level(level_view: LevelView):
+    level = level_view.level_ref.level
+    size = level.get_rect(16).size.to_qt()
+
+    drawn = QImage(size, QImage.Format.Format_ARGB32_Premultiplied)
+    drawn.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(drawn)
+    level_view.level_drawer.draw(painter, level)
+    painter.end()
+
+    level_view.compositor.request(level)
+    # Editing the level while its chunks are drawn must not affect the frame which was requested.
+    objects, level.objects = level.objects, []
+    assert level_view.compositor.wait()
+    level.objects = objects
+
+    composited = QImage(size, QImage.Format.Format_ARGB32_Premultiplied)
+    composited.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(composited)
+    level_view.compositor.draw(painter)
+    painter.end()
+
+    assert composited == drawn
+
+
+@pytest.mark.parametrize("transparency", [True, False])
+def test_block_grid_matches_object_drawing(level_view: LevelView, transparency: bool):
+    level = level_view.level_ref.level
+    level_view.user_settings.block_transparency = transparency
+    size = level.get_rect(16).size.to_qt()
+
+    images = []
+    for use_block_grid in (True, False):
+        image = QImage(size, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        LevelDrawer(level_view.user_settings, use_block_grid).draw(painter, level)
+        painter.end()
+        images.append(image)
+
+    assert images[0] == images[1]
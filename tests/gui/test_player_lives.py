@@ -33,6 +33,20 @@ def test_subscribe_on_valid_action_state_change():
     assert 1 == callback.called
 
 
+def test_subscribe_receives_new_state():
+    """Subscribers receive the new state, which shares the unchanged values with the old state."""
+    store = default_store()
+    old_state = store.get_state()
+    states = []
+    store.subscribe(states.append)
+
+    store.dispatch(Action(ActionNames.STARTING_LIVES.value, 1))
+    assert [store.get_state()] == states
+    assert 1 == states[0].starting_lives
+    assert DEFAULT_CONTINUE_LIVES == states[0].continue_lives
+    assert DEFAULT_STARTING_LIVES == old_state.starting_lives
+
+
 def test_subscribe_on_valid_action_no_state_change():
     """A valid action that causes no state change should not cause a callback."""
     store = default_store()
@@ -109,7 +123,7 @@ class CallbackTester:
 
     called = 0
 
-    def function(self):
+    def function(self, state: State):
         """Test callback keeps track of number of times it has been called."""
         self.called = self.called + 1
 
@@ -0,0 +1,36 @@
+from pathlib import Path
+
+from PySide6.QtGui import QImage
+
+from foundry.core.drawable import BLOCK_SIZE
+from foundry.game.File import ROM
+from foundry.game.level.Level import Level
+from foundry.render import DEFAULT_LAYERS, RenderOptions, render_level, render_world_map
+from foundry.smb3parse.levels.world_map import WORLD_MAP_HEIGHT
+from tests.conftest import level_1_1_object_address
+
+
+def test_render_level(tmp_path: Path, qtbot):
+    options = RenderOptions(tmp_path, 2, tuple(DEFAULT_LAYERS))
+    information = next(
+        level
+        for level in ROM().settings.levels
+        if level.generator_pointer == level_1_1_object_address + Level.HEADER_LENGTH
+    )
+
+    filename, digest, rendered = render_level(information, options, None)
+    level = Level("", level_1_1_object_address, information.enemy_pointer, information.tileset)
+
+    assert rendered
+    assert QImage(str(tmp_path / filename)).size() == level.get_rect(BLOCK_SIZE.width * 2).size.to_qt()
+    assert render_level(information, options, digest) == (filename, digest, False)
+
+
+def test_render_world_map(tmp_path: Path, qtbot):
+    options = RenderOptions(tmp_path, 1, tuple(DEFAULT_LAYERS))
+
+    filename, digest, rendered = render_world_map(1, options, None)
+
+    assert rendered
+    assert QImage(str(tmp_path / filename)).height() == WORLD_MAP_HEIGHT * BLOCK_SIZE.height
+    assert render_world_map(1, options, digest) == (filename, digest, False)
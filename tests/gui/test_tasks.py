@@ -0,0 +1,54 @@
+from asyncio import sleep
+
+from pytest import fixture, raises
+
+from foundry.core.tasks import (
+    Executor,
+    TaskCallback,
+    TaskManagerProxy,
+    start_task_manager,
+)
+from foundry.gui.tasks import QtEventLoop, TaskNotifier
+
+
+def _one() -> int:
+    return 1
+
+
+def _ignore(*_) -> None:
+    pass
+
+
+@fixture
+def loop(qtbot):
+    loop = QtEventLoop()
+    yield loop
+    loop.close()
+
+
+def test_task_notifier_await(loop):
+    manager: TaskManagerProxy = start_task_manager(worker_count=1)
+    notifier = TaskNotifier(manager)
+
+    async def run() -> tuple[int, int]:
+        process = await manager.schedule_task(TaskCallback(_one, _ignore))
+        thread = await manager.schedule_task(TaskCallback(_one, _ignore, executor=Executor.THREAD))
+        return process, thread
+
+    try:
+        assert loop.run_until_complete(run()) == (1, 1)
+    finally:
+        notifier.close()
+        manager.terminate()
+
+
+def test_qt_event_loop_sleep(loop):
+    assert loop.run_until_complete(sleep(0.01, 1)) == 1
+
+
+def test_qt_event_loop_is_not_nested(loop):
+    async def nested() -> None:
+        loop.run_until_complete(sleep(0))
+
+    with raises(RuntimeError):
+        loop.run_until_complete(nested())
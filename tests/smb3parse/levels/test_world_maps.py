@@ -90,6 +90,30 @@ def test_get_level_on_screen_4(world_8: WorldMap):
     assert world_8.level_for_position(4, Point(12, 5)) == (0x2, 0x2BC3D, 0xD5DD)
 
 
+def test_level_index(world_1: WorldMap):
+    level_1_1 = world_1.level_index[(1, 0, 4)]
+
+    assert level_1_1[:3] == world_1.level_for_position(1, Point(4, 0))
+    assert level_1_1[3] == "Level 1-1"
+
+
+def test_level_index_matches_level_lists(world_8: WorldMap):
+    for (screen, row, column), level in world_8.level_index.items():
+        assert level[:3] == world_8._read_level_for_position(screen, Point(column, row))
+
+
+def test_level_index_invalidated_by_replace(rom):
+    world_1 = WorldMap.from_world_number(rom, 1)
+    position = next(position for position in world_1.gen_positions() if position.level_info is not None)
+    tileset, level_address, enemy_address = position.level_info
+
+    world_1.replace_level_at_position((level_address, enemy_address + 1, tileset), position)
+
+    assert world_1.level_for_position(position.screen, position.point) == (tileset, level_address, enemy_address + 1)
+
+    world_1.replace_level_at_position((level_address, enemy_address, tileset), position)
+
+
 def test_tile_not_enterable(world_1: WorldMap):
     tile_at_0_0 = world_1.tile_at(1, Point(0, 0))
 